@@ -0,0 +1,11 @@
+"""
+Offline micro-benchmarks for the plog / purg hot paths.
+
+    python -m benchmarks run                 # all benches -> benchmarks/results/
+    python -m benchmarks run -k tidy -r 10   # filter by name, 10 rounds
+    python -m benchmarks compare OLD.json NEW.json
+
+Each `bench_*` function in a `bench_*.py` module builds its own synthetic
+data (see `synth.py`) and returns the callable to time, or a
+`(setup, run)` pair when every round needs fresh state.
+"""
@@ -0,0 +1,28 @@
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks import runner
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m benchmarks")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    r = sub.add_parser("run", help="run benches and store a results JSON")
+    r.add_argument("-k", dest="keyword", default=None, help="only benches whose name contains this")
+    r.add_argument("-r", "--rounds", type=int, default=5)
+    r.add_argument("-o", "--out", type=Path, default=None, help="results file (default: benchmarks/results/)")
+
+    c = sub.add_parser("compare", help="compare two results JSON files")
+    c.add_argument("old", type=Path)
+    c.add_argument("new", type=Path)
+    c.add_argument("--threshold", type=float, default=1.10, help="slowdown ratio counted as regression")
+
+    args = ap.parse_args(argv)
+    if args.cmd == "run":
+        runner.run(args.keyword, args.rounds, args.out)
+        return 0
+    return 1 if runner.compare(args.old, args.new, args.threshold) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
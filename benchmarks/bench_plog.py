@@ -0,0 +1,275 @@
+import subprocess
+import sys
+from datetime import date
+
+from benchmarks.synth import synth_month, temp_dir, use_root, write_root
+from purrgress.plog import core, totals
+from purrgress.plog.cleanup import tidy_month
+from purrgress.utils.yaml_tools import dump_no_wrap
+
+YEAR = 2024
+
+def _root(sessions_per_day: int = 8):
+    root = write_root(temp_dir() / "data", range(YEAR, YEAR + 1), sessions_per_day)
+    use_root(root)
+    return root
+
+def bench_tidy_month():
+    data = synth_month(YEAR, 3, sessions_per_day=40)
+    return lambda: tidy_month(data)
+
+def _big_month_text() -> tuple[dict, str]:
+    data = tidy_month(synth_month(YEAR, 3, sessions_per_day=100))
+    return data, dump_no_wrap(data)
+
+def bench_month_dump_pyyaml():
+    data, _ = _big_month_text()
+    return lambda: dump_no_wrap(data)
+
+def bench_month_dump_fast():
+    from purrgress.plog.monthio import dump_month
+
+    data, _ = _big_month_text()
+    return lambda: dump_month(data)
+
+def bench_month_load_pyyaml():
+    import yaml
+
+    _, text = _big_month_text()
+    return lambda: yaml.safe_load(text)
+
+def bench_month_load_fast():
+    from purrgress.plog.monthio import load_month_text
+
+    _, text = _big_month_text()
+    return lambda: load_month_text(text)
+
+def bench_minutes_for_month():
+    _root()
+    return lambda: core.minutes_for_month(YEAR, 3)
+
+def bench_minutes_by_tag_sqlite():
+    from purrgress.plog import storage
+
+    _root()
+    db = storage.SqliteRepository(temp_dir() / "plog.sqlite3")
+    storage.migrate(storage.YamlRepository(), db)
+    return lambda: db.minutes_by(f"{YEAR}-01-01", f"{YEAR}-12-31", by="tag")
+
+def bench_minutes_by_tag_yaml():
+    from purrgress.plog import storage
+
+    _root()
+    repo = storage.YamlRepository()
+    return lambda: repo.minutes_by(f"{YEAR}-01-01", f"{YEAR}-12-31", by="tag")
+
+def _history():
+    years = range(YEAR - 2, YEAR + 1)
+    root = write_root(temp_dir() / "data", years, sessions_per_day=20)
+    return root, [(y, m) for y in years for m in range(1, 13)]
+
+def bench_tidy_all_force():
+    from purrgress.plog.bulk import tidy_months
+
+    root, months = _history()
+    return lambda: tidy_months(months, root=root, force=True)
+
+def bench_tidy_all_serial():
+    from purrgress.plog.bulk import tidy_months
+
+    root, months = _history()
+    return lambda: tidy_months(months, root=root, force=True, jobs=1)
+
+def bench_tidy_all_manifest():
+    from purrgress.plog.bulk import tidy_months
+
+    root, months = _history()
+    tidy_months(months, root=root)
+    return lambda: tidy_months(months, root=root)
+
+def bench_fsck_all():
+    from purrgress.plog.fsck import fsck
+
+    root, months = _history()
+    return lambda: fsck(months, root=root)
+
+def bench_rollup_24_roots():
+    from purrgress.plog import rollup
+
+    base = temp_dir()
+    roots = [(f"p{i:02}", write_root(base / f"p{i:02}/purrgress/data", [YEAR], 8, seed=i))
+             for i in range(24)]
+    return lambda: rollup.rollup(roots, date(YEAR, 1, 1), date(YEAR, 12, 31))
+
+def _sync_pair():
+    from purrgress.plog import storage
+
+    root, _ = _history()
+    other = temp_dir() / "other"
+    write_root(other, range(YEAR - 2, YEAR + 1), sessions_per_day=20)
+    storage.YamlRepository(other).append_span(f"{YEAR}-03-04", {"task": "laptop", "spans": ["23:00-23:30"]})
+    return root, other
+
+def bench_sync_one_day_cold():
+    from purrgress.plog import sync
+
+    root, other = _sync_pair()
+    def run():
+        for r in (root, other):
+            (r / sync.TREE_CACHE).unlink(missing_ok=True)
+        sync.sync(root, other, dry_run=True)
+    return run
+
+def bench_sync_one_day_cached():
+    from purrgress.plog import sync
+
+    root, other = _sync_pair()
+    sync.sync(root, other, dry_run=True)
+    return lambda: sync.sync(root, other, dry_run=True)
+
+def _taxonomy(n: int = 600) -> list[str]:
+    areas = ["learn", "proj", "ops", "life", "write", "read"]
+    return [f"{areas[i % 6]}.{word}{i:03d}.{sub}" for i, (word, sub) in
+            enumerate(zip(["netsec", "web", "plog", "purg", "git", "misc"] * (n // 6),
+                          ["core", "docs", "infra", "notes", "review"] * (n // 5 + 1)))]
+
+def bench_picker_search_600_tags():
+    from purrgress.plog.picker import NameIndex
+
+    idx = NameIndex(_taxonomy())
+    queries = ["p", "pro", "proj.pl", "netsce", "docs", "web04", "revi"]
+    return lambda: [idx.search(q, limit=12) for q in queries]
+
+def bench_picker_usage_cached():
+    from purrgress.plog import picker, storage
+
+    _root(20)
+    repo = storage.YamlRepository()
+    today = date(YEAR, 12, 31)
+    picker.recent_usage(today, repo)
+    return lambda: picker.recent_usage(today, repo)
+
+def bench_load_month_packed():
+    from purrgress.plog import pack, storage
+
+    root, _ = _history()
+    pack.pack(root, YEAR)
+    repo = storage.YamlRepository(root)
+    return lambda: repo.load_month(YEAR - 1, 6)
+
+def bench_overlap_scan_year():
+    from purrgress.plog import intervals
+
+    days = {}
+    for month in range(1, 13):
+        days.update(synth_month(YEAR, month, sessions_per_day=20))
+    return lambda: intervals.scan(days)
+
+def bench_week_profile_year():
+    from purrgress.plog import weekly
+
+    days = {}
+    for month in range(1, 13):
+        days.update(synth_month(YEAR, month, sessions_per_day=20))
+    return lambda: weekly.week_profile(days, bin_minutes=15, by_tag=True)
+
+def bench_report_build_force():
+    from purrgress.plog import site, storage
+
+    root, _ = _history()
+    out = temp_dir()
+    return lambda: site.build(storage.YamlRepository(root), out_dir=out, force=True)
+
+def bench_report_build_noop():
+    from purrgress.plog import site, storage
+
+    root, _ = _history()
+    out = temp_dir()
+    site.build(storage.YamlRepository(root), out_dir=out)
+    return lambda: site.build(storage.YamlRepository(root), out_dir=out)
+
+def bench_range_total_index():
+    from purrgress.plog import storage
+
+    root, _ = _history()
+    repo = storage.YamlRepository(root)
+    totals.load(repo)
+    return lambda: totals.range_total(totals.load(repo), date(YEAR - 2, 3, 14), date(YEAR, 2, 2))
+
+def bench_range_total_yaml():
+    from purrgress.plog import storage
+
+    root, _ = _history()
+    repo = storage.YamlRepository(root)
+    return lambda: sum(repo.minutes_by(f"{YEAR - 2}-03-14", f"{YEAR}-02-02").values())
+
+def bench_fill_df():
+    from purrgress.plog.reports import _empty_df, _fill_df
+
+    data = tidy_month(synth_month(YEAR, 3, sessions_per_day=8))
+    return lambda: _fill_df(_empty_df(YEAR, 3), data)
+
+def bench_make_heatmap():
+    from purrgress.plog.reports import make_heatmap
+
+    _root()
+    out = temp_dir()
+    return lambda: make_heatmap(YEAR, 3, out_dir=out)
+
+def bench_make_thumbnails():
+    from purrgress.plog.reports import make_thumbnails
+
+    _root()
+    out = temp_dir()
+    return lambda: make_thumbnails(YEAR, out_dir=out)
+
+def bench_store_span():
+    _root()
+    draft = {"date": f"{YEAR}-03-14", "task": "bench", "tags": ["proj.plog"],
+             "moods": ["focus"], "start": "10:00", "end": "10:30"}
+    return lambda: core._store_span(draft)
+
+def _import_spans(batched: bool):
+    from contextlib import nullcontext
+
+    from purrgress.plog.repository import LogRepository
+
+    repo = LogRepository(temp_dir() / "data", backend="yaml")
+
+    def run():
+        with repo.batch() if batched else nullcontext():
+            for day in range(1, 29):
+                for month in (3, 4):
+                    repo.append_span(f"{YEAR}-{month:02}-{day:02}",
+                                     {"task": "import", "tags": ["proj.plog"], "spans": ["10:00-10:30"]})
+    return run
+
+def bench_append_56_batched():
+    return _import_spans(True)
+
+def bench_append_56_unbatched():
+    return _import_spans(False)
+
+def bench_aio_56_day_reads():
+    import asyncio
+
+    from purrgress.plog.aio import AsyncLogRepository
+
+    root = write_root(temp_dir() / "data", [YEAR], sessions_per_day=20)
+
+    async def reads():
+        async with AsyncLogRepository(root, backend="yaml") as log:
+            await asyncio.gather(*(log.minutes_for_day(f"{YEAR}-03-{d:02}")
+                                   for d in range(1, 29) for _ in range(2)))
+    return lambda: asyncio.run(reads())
+
+def _startup(module: str):
+    code = f"import sys; from {module} import cli; sys.argv=['x', '--help']; cli(standalone_mode=False)"
+    return lambda: subprocess.run([sys.executable, "-c", code], check=True,
+                                  stdout=subprocess.DEVNULL)
+
+def bench_cli_startup_plog():
+    return _startup("purrgress.plog_cli")
+
+def bench_cli_startup_purg():
+    return _startup("purrgress.cli")
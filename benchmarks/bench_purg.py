@@ -0,0 +1,68 @@
+from click.testing import CliRunner
+
+from benchmarks.synth import synth_board, temp_dir
+from purrgress.cli import cli
+
+BOARD = synth_board(tasks=5000)
+
+def _board_dir(count: int = 1):
+    d = temp_dir()
+    boards = [d / f"board{i}.md" for i in range(count)]
+
+    def setup():
+        for b in boards:
+            b.write_text(BOARD, encoding="utf-8")
+        (d / "archived.md").unlink(missing_ok=True)
+        (d / "manifest.json").unlink(missing_ok=True)
+    return d, boards, setup
+
+def _invoke(args, env):
+    res = CliRunner().invoke(cli, args, env=env)
+    if res.exit_code:
+        raise RuntimeError(res.output)
+
+def bench_purrdate_write():
+    d, boards, setup = _board_dir()
+    env = {"PURG_MANIFEST": str(d / "manifest.json")}
+    return setup, lambda: _invoke(["purrdate", str(boards[0]), "--write"], env)
+
+def bench_purrdate_preview():
+    d, boards, setup = _board_dir()
+    env = {"PURG_MANIFEST": str(d / "manifest.json")}
+    return setup, lambda: _invoke(["purrdate", str(boards[0]), "--preview"], env)
+
+def bench_purrdate_many_boards():
+    d, boards, setup = _board_dir(16)
+    env = {"PURG_MANIFEST": str(d / "manifest.json")}
+    return setup, lambda: _invoke(["purrdate", f"{d}/board*.md", "--write"], env)
+
+def bench_archive():
+    d, boards, setup = _board_dir()
+    env = {"PURG_MANIFEST": str(d / "manifest.json")}
+    return setup, lambda: _invoke(["archive", "--src", str(boards[0]),
+                                   "--dst", str(d / "archived.md")], env)
+
+def bench_clean_write():
+    d, boards, setup = _board_dir()
+    env = {"PURG_MANIFEST": str(d / "manifest.json")}
+    return setup, lambda: _invoke(["clean", str(boards[0]), "--write"], env)
+
+def bench_watch_idle_tick_16_boards():
+    import os
+
+    from purrgress.scripts.watch import Watcher
+
+    d, boards, setup = _board_dir(16)
+    setup()
+    os.environ["PURG_MANIFEST"] = str(d / "manifest.json")
+    watcher = Watcher([f"{d}/board*.md"], plog=False, debounce=0, echo=lambda _: None)
+    watcher.tick()
+    watcher.tick()
+    return watcher.tick
+
+def bench_purrdate_rerun_16_boards():
+    d, boards, setup = _board_dir(16)
+    setup()
+    env = {"PURG_MANIFEST": str(d / "manifest.json")}
+    _invoke(["purrdate", f"{d}/board*.md", "--write", "--no-plog"], env)
+    return lambda: _invoke(["purrdate", f"{d}/board*.md", "--write", "--no-plog"], env)
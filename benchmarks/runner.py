@@ -0,0 +1,112 @@
+"""
+Tiny timing harness: discover `bench_*` callables, time them, store JSON.
+"""
+from __future__ import annotations
+
+import gc
+import importlib
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+RESULTS = HERE / "results"
+
+def discover(keyword: str | None = None) -> list[tuple[str, callable]]:
+    """All `bench_*` functions from `benchmarks/bench_*.py`, optionally filtered."""
+    found = []
+    for mod_path in sorted(HERE.glob("bench_*.py")):
+        mod = importlib.import_module(f"benchmarks.{mod_path.stem}")
+        for name in sorted(vars(mod)):
+            if name.startswith("bench_") and callable(getattr(mod, name)):
+                full = f"{mod_path.stem[6:]}.{name[6:]}"
+                if keyword is None or keyword in full:
+                    found.append((full, getattr(mod, name)))
+    return found
+
+def time_one(factory, rounds: int) -> dict:
+    """
+    Build the bench once, then time `rounds` calls (plus one warm-up).
+
+    `factory()` returns either `run` or `(setup, run)`; `setup` runs
+    untimed before each round.
+    """
+    made = factory()
+    setup, run = made if isinstance(made, tuple) else (None, made)
+
+    samples = []
+    for i in range(rounds + 1):
+        if setup is not None:
+            setup()
+        gc.collect()
+        t0 = time.perf_counter()
+        run()
+        dt = time.perf_counter() - t0
+        if i:
+            samples.append(dt)
+    return {
+        "rounds": rounds,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+def _git_commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+def run(keyword: str | None = None, rounds: int = 5, out: Path | None = None) -> Path:
+    """Run the (filtered) suite and write a results JSON; returns its path."""
+    results = {}
+    for name, factory in discover(keyword):
+        res = time_one(factory, rounds)
+        results[name] = res
+        print(f"{name:<40} median {res['median'] * 1e3:10.2f} ms   min {res['min'] * 1e3:10.2f} ms")
+
+    commit = _git_commit()
+    payload = {
+        "commit": commit,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if out is None:
+        RESULTS.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        out = RESULTS / f"{stamp}-{commit}.json"
+    out.write_text(json.dumps(payload, indent=1))
+    print(f"→ {out}")
+    return out
+
+def compare(old: Path, new: Path, threshold: float = 1.10) -> int:
+    """
+    Print median ratios new/old; returns the number of regressions, i.e.
+    benches slower than `threshold` × the old median.
+    """
+    a = json.loads(Path(old).read_text())["results"]
+    b = json.loads(Path(new).read_text())["results"]
+    regressions = 0
+    for name in sorted(set(a) | set(b)):
+        if name not in a or name not in b:
+            print(f"{name:<40} {'only in ' + ('new' if name in b else 'old'):>24}")
+            continue
+        ratio = b[name]["median"] / a[name]["median"] if a[name]["median"] else float("inf")
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        print(f"{name:<40} {a[name]['median'] * 1e3:10.2f} → {b[name]['median'] * 1e3:10.2f} ms  ×{ratio:5.2f}{flag}")
+    return regressions
@@ -0,0 +1,93 @@
+"""
+Deterministic synthetic data: month logs, multi-year data roots, boards.
+"""
+from __future__ import annotations
+
+import atexit
+import calendar
+import random
+import shutil
+import tempfile
+from pathlib import Path
+
+from purrgress.plog.cleanup import tidy_month
+from purrgress.utils.yaml_tools import dump_no_wrap
+
+TAGS = ["learn.netsec", "learn.web", "write.docs", "proj.plog", "proj.purg", "ops.git", "life.misc"]
+MOODS = ["focus", "chill", "inspire", "pumped", "happy", "tired", "lazy"]
+TASKS = [f"task {i:03d} - {word}" for i, word in
+         enumerate(["read rfc", "fix parser", "write notes", "review pr", "study", "refactor"] * 20)]
+
+def _hm(minute: int) -> str:
+    minute %= 24 * 60
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+def synth_day(rng: random.Random, sessions: int) -> dict:
+    """One day with `sessions` sessions, ~1-3 spans each, some past midnight."""
+    out = []
+    cursor = rng.randrange(6 * 60, 9 * 60)
+    for _ in range(sessions):
+        spans = []
+        for _ in range(rng.randint(1, 3)):
+            length = rng.randint(10, 90)
+            spans.append(f"{_hm(cursor)}-{_hm(cursor + length)}")
+            cursor += length + rng.randint(0, 30)
+        out.append({
+            "task": rng.choice(TASKS),
+            "tags": rng.sample(TAGS, rng.randint(1, 2)),
+            "moods": rng.sample(MOODS, rng.randint(0, 2)),
+            "spans": spans,
+        })
+    node = {"sessions": out}
+    if rng.random() < 0.7:
+        node["wake"] = _hm(rng.randrange(6 * 60, 9 * 60))
+    if rng.random() < 0.7:
+        node["sleep"] = _hm(rng.randrange(22 * 60, 26 * 60))
+    return node
+
+def synth_month(year: int, month: int, sessions_per_day: int = 8, seed: int = 0) -> dict:
+    """Raw (untidied) month dict keyed by ISO day."""
+    rng = random.Random(f"{seed}-{year}-{month}")
+    days = calendar.monthrange(year, month)[1]
+    return {f"{year}-{month:02d}-{d:02d}": synth_day(rng, sessions_per_day) for d in range(1, days + 1)}
+
+def write_root(root: Path, years: range, sessions_per_day: int = 8, seed: int = 0) -> Path:
+    """Populate `root/<year>/<month>.yaml` for every month of `years`."""
+    for year in years:
+        for month in range(1, 13):
+            p = root / f"{year}/{month:02}.yaml"
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_text(dump_no_wrap(tidy_month(synth_month(year, month, sessions_per_day, seed))))
+    return root
+
+def synth_board(tasks: int = 2000, done_ratio: float = 0.3, seed: int = 0) -> str:
+    """A purrboard with date anchors, tokens and `tasks` bullets (some done)."""
+    rng = random.Random(seed)
+    lines = [
+        '<div class="purrboard">\n', "\n",
+        "<!--DATE-LAST_UPDATED-->\n", "<sub><em>Last updated: {{LAST_UPDATED}}</em></sub>\n", "\n",
+        "<!-- ============= ACTIVE START ============= -->\n", "\n",
+    ]
+    for i in range(tasks):
+        if i % 200 == 0:
+            lines += [f"## Section {i // 200}\n", "\n", "<!--DATE-TODAY-->\n",
+                      "<sub><em>{{DATE_TODAY}}</em></sub>\n", "\n"]
+        box = "x" if rng.random() < done_ratio else " "
+        lines.append(f"* [{box}] ![todo] _task {i}_ “note” <span class=\"tag\">#{rng.choice(TAGS)}</span> @30m\n")
+        if rng.random() < 0.2:
+            lines.append(f"  continuation for task {i} — details\n")
+    lines += ["\n", "<!-- ============= ACTIVE END ============= -->\n", "\n", "</div>\n"]
+    return "".join(lines)
+
+def temp_dir(prefix: str = "purrbench-") -> Path:
+    """Scratch directory removed when the benchmark process exits."""
+    p = Path(tempfile.mkdtemp(prefix=prefix))
+    atexit.register(shutil.rmtree, p, ignore_errors=True)
+    return p
+
+def use_root(root: Path) -> None:
+    """Point plog's module-level paths at a sandbox root (like tests/conftest)."""
+    from purrgress.plog import core
+
+    core.DATA_ROOT = root
+    core.DRAFT_FILE = root / ".draft.yaml"
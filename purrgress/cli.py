@@ -16,6 +16,8 @@ Examples:
     purrgress archive
     purrgress clean docs/purrboard.md
     purrgress clean docs/purrboard.md --write 
+    purrgress purrdate docs/ --write
+    purrgress archive --src 'docs/boards/*.md'
 
 ------------------------------------------------------
 Current Subcommands
@@ -24,30 +26,75 @@ purrdate
     Update markdown files with current date/time tokens and/or anchored
     <!--DATE-XYZ--> blocks.
     Options:
-      -f, --file         Target markdown file (default: docs/purrboard.md)
+      -f, --file         Target file, directory or glob; repeatable
+                         (default: docs/purrboard.md). Bare arguments work too.
       --preview, -p      Show unified diff; do not write
       --write, -w        Apply changes
       --tags-only        Update {{TAGS}} only; skip anchors
       --anchors-only     Update anchors only; skip {{TAGS}}
+      -j, --jobs         Worker threads for multi-file runs
+      --force            Ignore the manifest; re-check every file
 
 archive
     Move completed tasks (* [x] / - [x]) from an ACTIVE block in the source
     board into a month bucket in the destination archive file. Removes them
     from the source by default.
     Options:
-      --src              Source board (default: docs/purrboard.md)
+      --src              Source board, directory or glob; repeatable
+                         (default: docs/purrboard.md)
       --dst              Archive file (default: docs/archived.md)
       --preview, -p      Show diffs; do not write
+      -j, --jobs         Worker threads for multi-board runs
+      --force            Ignore the manifest; re-scan every board
 
 clean
-    Normalize Unicode punctuation in Markdown files
+    Normalize Unicode punctuation in Markdown files (streamed in chunks)
 
 Arguments
-    `files`              One or more file paths
-                         (globs work when shell-expanded).
+    `files`              One or more files, directories or globs;
+                         `-` filters stdin to stdout.
 
     Options:
         -w, --write      Overwrite each file in place (default is to print).
+        -j, --jobs       Worker threads for multi-file runs.
+        --force          Ignore the manifest; re-scan every file.
+        --chunk-size     Characters per streaming step (default 1 MiB).
+
+    Replacement counts are reported per file (on stderr when printing).
+
+watch
+    Long-running replacement for cron'd purrdate + archive. Polls the
+    boards' mtimes; an edited board (once it has been quiet for --debounce
+    seconds) gets its tokens/anchors refreshed and, if it has completed
+    tasks, is archived. Untouched boards are only rewritten when the date
+    rolls over, using anchor positions cached in the manifest.
+    Options:
+      -f, --file         Board file, directory or glob; repeatable
+      --dst              Archive file (default: docs/archived.md)
+      --no-archive       Only refresh tokens/anchors
+      --no-plog          Skip <!--PLOG-XYZ--> anchors
+      -i, --interval     Seconds between polls (default 2)
+      --debounce         Quiet period before an edit is handled (default 1)
+      --once             One pass, then exit
+
+------------------------------------------------------
+Multi-board runs
+
+All three commands accept directories (walked for *.md) and glob patterns,
+process files on a thread pool and print one aggregate summary at the end.
+Files whose sha256 matches the last run are skipped without being touched;
+hashes live in `.purg-manifest.json` at the repo root (override with the
+PURG_MANIFEST environment variable).
+
+------------------------------------------------------
+Profiling
+
+    purrgress --profile purrdate --write
+    PURRGRESS_PROFILE=cprofile,tracemalloc purrgress archive
+
+Appends wall time, phase timings (read / render / write) and bytes moved to
+purrgress/data/.metrics/metrics.jsonl; `--profile-dump cprofile|tracemalloc`
+also writes a .prof file or a tracemalloc top-25 next to it.
 
 ------------------------------------------------------
 Markers
@@ -87,12 +134,25 @@ import click
 from purrgress.scripts.clean import clean_cmd
 from purrgress.scripts.archive import archive
 from purrgress.scripts.purrdate import purrdate
+from purrgress.scripts.watch import watch
+from purrgress.utils import profiling
+from purrgress.utils.path import resolve_pathish
 
 @click.group()
-def cli():
+@click.option("--profile", is_flag=True,
+              help="Append timing metrics to purrgress/data/.metrics/metrics.jsonl "
+                   "(or set PURRGRESS_PROFILE=1).")
+@click.option("--profile-dump", type=click.Choice(profiling.DUMPS), multiple=True,
+              help="With profiling, also dump cProfile stats / tracemalloc top lines.")
+@click.pass_context
+def cli(ctx, profile: bool = False, profile_dump: tuple[str] = ()):
     """purrgress: CLI tools for boards, dates, archiving."""
-    pass
+    dumps = profiling.resolve(profile, profile_dump)
+    if dumps is not None:
+        profiling.start(f"purg {ctx.invoked_subcommand}", dumps)
+        ctx.call_on_close(profiling.finish_on_close(resolve_pathish("purrgress/data")))
 
 cli.add_command(purrdate)
 cli.add_command(archive)
 cli.add_command(clean_cmd)
+cli.add_command(watch)
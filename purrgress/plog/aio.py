@@ -0,0 +1,148 @@
+"""
+`AsyncLogRepository`: `LogRepository` for asyncio code (dashboards, bots).
+
+Blocking work - file I/O, YAML parsing, index rebuilds - runs on a bounded
+executor so the event loop never waits on it:
+
+* Loads are single-flight: concurrent requests for the same month share
+  one in-flight load instead of each parsing the file.
+* Writes are serialized per month through an `asyncio.Lock`, so two
+  coroutines appending to the same month can't lose each other's update;
+  loads take the same lock, so they never see a half-written month, and
+  a finished write drops any in-flight load of that month, so later
+  readers see it.
+
+With `processes=True` month parsing runs in worker processes (real
+parallelism for big months); writes and index work stay on threads.
+
+    >>> async with AsyncLogRepository("~/work-log/data") as log:
+    ...     total, today = await asyncio.gather(
+    ...         log.minutes_for_month(2025, 7), log.load_day("2025-07-14"))
+"""
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import partial
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Callable, Hashable
+
+from purrgress.plog import storage, totals
+from purrgress.plog.repository import LogRepository, day_minutes
+from purrgress.utils.date import today_iso
+
+log = getLogger("plog")
+
+def _load_month_worker(backend: str, location: str, year: int, month: int) -> dict:
+    """Process-pool entry point: parse one month from a fresh store."""
+    return storage.get_repository(backend, location=Path(location)).load_month(year, month)
+
+class AsyncLogRepository:
+    """
+    Awaitable reads and writes over a `LogRepository`.
+
+    Args:
+        root (Path | str | None): Data root (see `LogRepository`).
+        backend (str | None): Storage backend (see `LogRepository`).
+        repo (LogRepository | None): Wrap this repository instead.
+        max_workers (int): Size of the worker pool(s).
+        processes (bool): Parse months in worker processes.
+
+    Loaded month dicts are shared between the coroutines that awaited the
+    same load - treat them as read-only.
+    """
+
+    def __init__(self, root: Path | str | None = None, *, backend: str | None = None,
+                 repo: LogRepository | None = None, max_workers: int = 4, processes: bool = False):
+        self.repo = repo or LogRepository(root, backend=backend)
+        self._threads: Executor = ThreadPoolExecutor(max_workers=max_workers,
+                                                     thread_name_prefix="plog-aio")
+        self._procs: Executor | None = ProcessPoolExecutor(max_workers=max_workers) if processes else None
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._locks: dict[tuple[int, int], asyncio.Lock] = {}
+
+    async def __aenter__(self) -> "AsyncLogRepository":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Wait for running work and shut the pools down."""
+        pools = [p for p in (self._threads, self._procs) if p is not None]
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: [p.shutdown(wait=True) for p in pools])
+
+    # ---------- plumbing ----------
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._threads, partial(func, *args, **kwargs))
+
+    async def _single_flight(self, key: Hashable, start: Callable[[], "asyncio.Future"]) -> Any:
+        """Join the in-flight call for `key`, or start one with `start()`."""
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = self._inflight[key] = asyncio.ensure_future(start())
+
+            def _done(f: asyncio.Future) -> None:
+                if self._inflight.get(key) is f:
+                    del self._inflight[key]
+            fut.add_done_callback(_done)
+        # shield: one caller being cancelled must not cancel the shared load
+        return await asyncio.shield(fut)
+
+    def _lock(self, year: int, month: int) -> asyncio.Lock:
+        return self._locks.setdefault((year, month), asyncio.Lock())
+
+    # ---------- reads ----------
+    async def load_month(self, year: int, month: int) -> dict:
+        """Month data keyed by ISO day; concurrent calls share one load."""
+        async def _start():
+            # the month's write lock doubles as a read barrier: a load never
+            # overlaps a write of the same month
+            async with self._lock(year, month):
+                if self._procs is not None:
+                    backend, location = storage.repository_spec(self.repo.store)
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(
+                        self._procs, _load_month_worker, backend, location, year, month)
+                return await self._run(self.repo.load_month, year, month)
+
+        return await self._single_flight(("month", year, month), _start)
+
+    async def load_day(self, day_iso: str) -> dict:
+        return (await self.load_month(int(day_iso[:4]), int(day_iso[5:7]))).get(day_iso, {})
+
+    async def minutes_for_day(self, day_iso: str) -> int:
+        return day_minutes(await self.load_day(day_iso), day_iso)
+
+    async def minutes_for_range(self, start_iso: str, end_iso: str) -> int:
+        """Range total from the daily-totals index (concurrent callers share one refresh)."""
+        idx = await self._single_flight(("totals",), lambda: self._run(self.repo.totals))
+        return totals.range_total(idx, date.fromisoformat(start_iso), date.fromisoformat(end_iso))
+
+    async def minutes_for_month(self, year: int, month: int) -> int:
+        last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        return await self.minutes_for_range(f"{year:04}-{month:02}-01", last.isoformat())
+
+    # ---------- writes ----------
+    async def _write(self, day_iso: str, func: Callable[..., None], *args) -> None:
+        year, month = int(day_iso[:4]), int(day_iso[5:7])
+        async with self._lock(year, month):
+            await self._run(func, *args)
+            self._inflight.pop(("month", year, month), None)
+            self._inflight.pop(("totals",), None)
+
+    async def append_span(self, day_iso: str, session: dict) -> None:
+        """Append one session; writes to the same month run one at a time."""
+        await self._write(day_iso, self.repo.append_span, day_iso, session)
+
+    async def set_wake(self, time_hm: str, *, day_iso: str | None = None, tz: str | None = None) -> None:
+        day_iso = day_iso or today_iso(tz)
+        await self._write(day_iso, self.repo.set_key, day_iso, "wake", time_hm)
+
+    async def set_sleep(self, time_hm: str, *, day_iso: str | None = None, tz: str | None = None) -> None:
+        day_iso = day_iso or today_iso(tz)
+        await self._write(day_iso, self.repo.set_key, day_iso, "sleep", time_hm)
+
+__all__ = ["AsyncLogRepository"]
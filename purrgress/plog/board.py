@@ -0,0 +1,98 @@
+"""
+plog numbers for purrboard anchors (`<!--PLOG-TODAY-->` & co.), filled in
+by `purg purrdate` next to the `<!--DATE-...-->` ones.
+
+The rendered lines are cached in the data directory together with the
+change markers (`Repository.month_stamps`) of the months they were
+computed from, so a cron-driven purrdate only re-reads the log when the
+current week's or month's file actually changed.
+"""
+from datetime import date, timedelta
+from logging import getLogger
+
+from purrgress.plog import storage
+from purrgress.utils import log_call, profiling
+from purrgress.utils.date import fmt_duration, month_keys, today_iso
+from purrgress.utils.manifest import load_manifest, save_manifest
+
+log = getLogger("plog")
+
+BOARD_CACHE = ".board-summary.json"
+TOP_TAGS = 3
+
+def render_lines(today: date, daily: dict[str, int], tags: dict[str, int]) -> dict:
+    """
+    Anchor key → `<sub>` line from per-day and per-tag minutes.
+
+    Args:
+        today (date): Day the board is rendered for.
+        daily (dict[str, int]): ISO day → minutes (at least this week and month).
+        tags (dict[str, int]): Tag → minutes for this month.
+
+    Returns:
+        dict: Lines for PLOG-TODAY, PLOG-WEEK, PLOG-MONTH and PLOG-TAGS.
+    """
+    week_start = today - timedelta(days=today.weekday())
+    month_start = today.replace(day=1)
+
+    def _sum(start: date) -> tuple[int, int]:
+        mins = [daily.get((start + timedelta(days=i)).isoformat(), 0)
+                for i in range((today - start).days + 1)]
+        return sum(mins), sum(1 for m in mins if m)
+
+    today_min = daily.get(today.isoformat(), 0)
+    week_min, _ = _sum(week_start)
+    month_min, month_days = _sum(month_start)
+    per_day = week_min // (today.weekday() + 1)
+    top = sorted(tags.items(), key=lambda kv: (-kv[1], kv[0]))[:TOP_TAGS]
+    top_txt = " · ".join(f"#{t} {fmt_duration(m)}" for t, m in top) or "—"
+    return {
+        "PLOG-TODAY": f"<sub><em>🐾 Logged today: {fmt_duration(today_min)}</em></sub>",
+        "PLOG-WEEK": f"<sub><em>🐾 This week: {fmt_duration(week_min)} ({fmt_duration(per_day)}/day)</em></sub>",
+        "PLOG-MONTH": f"<sub><em>🐾 This month: {fmt_duration(month_min)} over {month_days} day(s)</em></sub>",
+        "PLOG-TAGS": f"<sub><em>🐾 Top tags: {top_txt}</em></sub>",
+    }
+
+@log_call()
+def anchored_plog_lines(today: date | None = None, repo: storage.Repository | None = None) -> dict:
+    """
+    Lines for the `<!--PLOG-...-->` anchors, served from the cache when the
+    months they cover are unchanged.
+
+    Args:
+        today (date | None): Day to render (default: today in the plog
+            timezone, PLOG_TZ, like the session dates).
+        repo (Repository | None): Source store (default: active backend).
+
+    Returns:
+        dict: anchor key → replacement line (see `render_lines`).
+
+    Example:
+        >>> anchored_plog_lines()["PLOG-TODAY"]
+        '<sub><em>🐾 Logged today: 1h30m</em></sub>'
+    """
+    today = today or date.fromisoformat(today_iso())
+    repo = repo or storage.get_repository()
+    week_start = today - timedelta(days=today.weekday())
+    start = min(week_start, today.replace(day=1))
+
+    all_stamps = repo.month_stamps()
+    stamps = {k: all_stamps.get(k) for k in month_keys(start, today)}
+    key = {"day": today.isoformat(), "backend": repo.name, "stamps": stamps}
+
+    cache_file = repo.data_dir / BOARD_CACHE
+    cached = load_manifest(cache_file)
+    if cached.get("key") == key and isinstance(cached.get("lines"), dict):
+        return cached["lines"]
+
+    with profiling.phase("plog_summary"):
+        daily = repo.minutes_by(start.isoformat(), today.isoformat(), by="day")
+        tags = repo.minutes_by(today.replace(day=1).isoformat(), today.isoformat(), by="tag")
+        lines = render_lines(today, daily, tags)
+    try:
+        save_manifest(cache_file, {"key": key, "lines": lines})
+    except OSError as e:
+        log.warning("[anchored_plog_lines] Could not write %s: %s", cache_file, e)
+    return lines
+
+__all__ = ["BOARD_CACHE", "anchored_plog_lines", "render_lines"]
@@ -0,0 +1,134 @@
+"""
+Whole-history operations on the YAML month files, fanned out across a
+process pool (tidying is pure-Python CPU work, so threads don't help).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from logging import getLogger
+from pathlib import Path
+from typing import Callable, Iterable, List, NamedTuple, TypeVar
+
+from purrgress.plog import cleanup, intervals, monthio
+from purrgress.plog.storage import YamlRepository
+from purrgress.utils import date as date_utils
+from purrgress.utils import log_call, profiling, yaml_tools
+from purrgress.utils.load import write_atomic
+from purrgress.utils.manifest import file_digest, load_manifest, modules_digest, save_manifest
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+log = getLogger("plog")
+
+TIDY_MANIFEST = ".tidy-manifest.json"
+
+class TidyResult(NamedTuple):
+    year: int
+    month: int
+    status: str          # "changed" | "unchanged" | "skipped"
+    sha: str
+
+def run_processes(func: Callable[[T], R], items: Iterable[T], jobs: int | None = None) -> List[R]:
+    """
+    Map a module-level `func` over `items` on a process pool, keeping order.
+    A single item (or `jobs == 1`) runs inline.
+    """
+    items = list(items)
+    jobs = jobs or os.cpu_count() or 1
+    if len(items) <= 1 or jobs <= 1:
+        return [func(it) for it in items]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(items))) as pool:
+        return list(pool.map(func, items, chunksize=max(1, len(items) // (jobs * 4))))
+
+def rules_digest() -> str:
+    """
+    Fingerprint of the tidy rules + serializer and the modules they build
+    on; a change to any of them re-tidies everything.
+    """
+    return modules_digest(cleanup, intervals, date_utils, monthio, yaml_tools)
+
+def _tidy_file(path: str) -> tuple[bool, str]:
+    """
+    Worker: tidy one month file in place if needed → (changed, new sha).
+    Profiling phases only register when this runs inline (single month).
+    """
+    p = Path(path)
+    raw = p.read_bytes()
+    profiling.add_bytes(read=len(raw))
+    with profiling.phase("yaml_load"):
+        data = monthio.load_month_text(raw.decode("utf-8"))
+    with profiling.phase("tidy"):
+        data = cleanup.tidy_month(data)
+    with profiling.phase("dump"):
+        out = monthio.dump_month(data).encode("utf-8")
+    if out != raw:
+        write_atomic(p, out)
+    return out != raw, file_digest(p)
+
+def select_months(months: Iterable[tuple[int, int]], start: str | None = None,
+                  end: str | None = None, year: int | None = None) -> list[tuple[int, int]]:
+    """
+    Filter (year, month) pairs by an inclusive "YYYY-MM" range and/or year.
+    """
+    picked = []
+    for y, m in months:
+        key = f"{y:04}-{m:02}"
+        if (start and key < start) or (end and key > end) or (year and y != year):
+            continue
+        picked.append((y, m))
+    return picked
+
+@log_call()
+def tidy_months(months: Iterable[tuple[int, int]], *, root: Path | None = None,
+                jobs: int | None = None, force: bool = False) -> list[TidyResult]:
+    """
+    Re-tidy many month files in parallel, rewriting only the ones that change.
+
+    A manifest in the data root (`TIDY_MANIFEST`) remembers the hash of each
+    file as last left canonical, plus a fingerprint of the tidy rules; files
+    whose bytes still match are skipped without being parsed.
+
+    Args:
+        months (Iterable[tuple[int, int]]): (year, month) pairs to tidy.
+        root (Path | None): Data root (default `core.DATA_ROOT`).
+        jobs (int | None): Worker processes (default: CPU count).
+        force (bool): Ignore the manifest.
+
+    Returns:
+        list[TidyResult]: One entry per existing month file, by month.
+    """
+    repo = YamlRepository(root)
+    manifest_file = repo.root / TIDY_MANIFEST
+    manifest = load_manifest(manifest_file)
+    rules = rules_digest()
+    if manifest.get("rules") != rules:
+        manifest = {"rules": rules, "files": {}}
+    files = manifest.setdefault("files", {})
+
+    results: dict[tuple[int, int], TidyResult] = {}
+    todo: list[tuple[int, int]] = []
+    for y, m in months:
+        path = repo.month_path(y, m)
+        sha = file_digest(path)
+        if not sha:
+            continue
+        if not force and files.get(f"{y:04}/{m:02}.yaml") == sha:
+            results[(y, m)] = TidyResult(y, m, "skipped", sha)
+        else:
+            todo.append((y, m))
+
+    try:
+        done = run_processes(_tidy_file, [str(repo.month_path(y, m)) for y, m in todo], jobs)
+    except Exception as e:
+        log.error("[tidy_months] Worker failed: %s", e)
+        raise
+
+    for (y, m), (changed, sha) in zip(todo, done):
+        results[(y, m)] = TidyResult(y, m, "changed" if changed else "unchanged", sha)
+
+    for r in results.values():
+        files[f"{r.year:04}/{r.month:02}.yaml"] = r.sha
+    save_manifest(manifest_file, manifest)
+    return [results[k] for k in sorted(results)]
+
+__all__ = ["TIDY_MANIFEST", "TidyResult", "run_processes", "select_months", "tidy_months"]
@@ -2,6 +2,7 @@ from copy import deepcopy
 from datetime import datetime
 from logging import getLogger
 
+from purrgress.plog.intervals import merge_spans
 from purrgress.utils import log_call
 
 log = getLogger("plog")
@@ -30,7 +31,9 @@ def tidy_day(node: dict) -> dict:
     1. Deep-copies input data to avoid side effects.
     2. Ensures all session dicts have the keys: 'task', 'tags', 'moods', 'spans'.
     3. Deduplicates and sorts each session's 'spans' chronologically.
-    4. Merges sessions with the same task and tags, combining spans and moods.
+    4. Merges sessions with the same task and tags, combining spans and moods;
+       overlapping spans within the merged session are unioned
+       (`intervals.merge_spans`), touching spans stay separate.
     5. Rebuilds a normalized session list and sorts by the first span (empty sessions pushed to the end).
     6. Returns an ordered dict with optional 'wake'/'sleep' at the top, followed by cleaned 'sessions'.
 
@@ -82,7 +85,7 @@ def tidy_day(node: dict) -> dict:
     log.debug("[tidy_day] Rebuilding sessions list...")
     clean_sessions = []
     for (task, tags), payload in merged.items():
-        spans = sorted(set(payload["spans"]), key=_span_key)
+        spans = sorted(merge_spans(payload["spans"]), key=_span_key)
         moods = sorted(payload["moods"]) if payload["moods"] else []
         clean_sessions.append(
             {"task": task, "tags": list(tags), "moods": moods, "spans": spans}
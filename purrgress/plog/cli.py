@@ -1,23 +1,22 @@
 import logging
+from datetime import date as date_cls, timedelta
 from logging import getLogger
 import sys
 
 import click
-import yaml
-from questionary import checkbox
 from rich import print
 from rich.console import Console
+from rich.markup import escape
 from rich.traceback import Traceback
 
-from purrgress.plog import core, log_setup
-from purrgress.plog.cleanup import tidy_month
+from purrgress.plog import core, log_setup, storage, totals, weekly
+from purrgress.plog import pack as pack_mod
+from purrgress.plog.bulk import select_months, tidy_months
 from purrgress.plog.config import CFG
-from purrgress.plog.core import DRAFT_FILE
-from purrgress.plog.reports import make_heatmap
-from purrgress.utils import log_call
-from purrgress.utils.date import now, today_iso
+from purrgress.utils import log_call, profiling
+from purrgress.utils.batch import summary_line
 from purrgress.utils.path import resolve_pathish
-from purrgress.utils.yaml_tools import dump_no_wrap
+from purrgress.utils.date import now, today_iso
 
 log = getLogger("plog")
 
@@ -25,8 +24,21 @@ log = getLogger("plog")
 @click.option("--tz", metavar="TZ", default=None,
               help="IANA timezone (e.g. Europe/Paris). Overrides PLOG_TZ env.")
 @click.option("-v", "--verbose", count=True, help="-v = INFO, -vv = DEBUG")
+@click.option("--log-queue/--no-log-queue", default=False, envvar="PLOG_LOG_QUEUE",
+              help="Render log records on a background thread (QueueHandler).")
+@click.option("--log-file", metavar="PATH", default=None, envvar="PLOG_LOG_FILE",
+              help="Also write DEBUG records as rotating JSON lines to PATH (implies --log-queue).")
+@click.option("--backend", type=click.Choice(storage.BACKENDS), default=None, envvar="PLOG_BACKEND",
+              help="Storage backend (default yaml).")
+@click.option("--profile", is_flag=True,
+              help="Append timing metrics to DATA_ROOT/.metrics/metrics.jsonl "
+                   "(or set PURRGRESS_PROFILE=1).")
+@click.option("--profile-dump", type=click.Choice(profiling.DUMPS), multiple=True,
+              help="With profiling, also dump cProfile stats / tracemalloc top lines.")
 @click.pass_context
-def log_group(ctx, tz: str | None = None, verbose: int = 0) -> None:
+def log_group(ctx, tz: str | None = None, verbose: int = 0,
+              log_queue: bool = False, log_file: str | None = None,
+              backend: str | None = None, profile: bool = False, profile_dump: tuple[str] = ()) -> None:
     """
     Root CLI group for life-log commands.
 
@@ -38,11 +50,21 @@ def log_group(ctx, tz: str | None = None, verbose: int = 0) -> None:
       - 2+ (-vv): DEBUG
     - Saves the chosen timezone (`tz`) and the logger in `ctx.obj`
       for use by all subcommands without extra parameters.
+    - With `--log-queue` / `--log-file`, records are rendered by a
+      background listener so verbose logging stays off the hot paths.
+    - `--backend` / PLOG_BACKEND picks the storage backend (yaml, sqlite).
+    - Starts per-command metrics when `--profile` / PURRGRESS_PROFILE is set;
+      the record is appended when the command finishes.
 
     Args:
         ctx (click.Context): Click context object.
         tz (str|None): Timezone string (IANA format) or None.
         verbose (int): Verbosity level from `-v` flags.
+        log_queue (bool): Use the queue-based logging mode.
+        log_file (str|None): Rotating JSON-lines diagnostics file.
+        backend (str|None): Storage backend name.
+        profile (bool): Record metrics for this command.
+        profile_dump (tuple[str]): Extra dumps (cprofile, tracemalloc).
     """
     level = "WARNING"
     if verbose == 1:
@@ -54,9 +76,16 @@ def log_group(ctx, tz: str | None = None, verbose: int = 0) -> None:
     log.debug("[log_group] Setting tz to %s", tz)
 
     ctx.obj = {"tz": tz}
-    ctx.obj["log"] = logger = log_setup.init(level)
+    ctx.obj["log"] = logger = log_setup.init(level, use_queue=log_queue, json_file=log_file)
     log.debug("[log_group] Logger initialized and stored in context.")
 
+    storage.use_backend(backend)
+
+    dumps = profiling.resolve(profile, profile_dump)
+    if dumps is not None:
+        profiling.start(f"plog {ctx.invoked_subcommand}", dumps)
+        ctx.call_on_close(profiling.finish_on_close(core.DATA_ROOT))
+
 @log_call()
 def _tz(ctx) -> (str | None):
     """
@@ -77,41 +106,46 @@ def _tz(ctx) -> (str | None):
 @click.argument("task")
 @click.option("-t", "--tags",  multiple=True, help="Repeatable tag option")
 @click.option("-m", "--moods", multiple=True, help="Repeatable mood option")
+@click.option("--last", is_flag=True,
+              help="Reuse the previous session's tags/moods (where -t/-m are not given)")
 @click.pass_context
-def start(ctx, task: str, tags: tuple[str], moods: tuple[str]) -> None:
+def start(ctx, task: str, tags: tuple[str], moods: tuple[str], last: bool) -> None:
     """
-    Begin a study/work span. If you omit --tags or --moods,
-    an interactive checklist appears (arrow keys + space).
+    Begin a study/work span. If you omit --tags or --moods, a picker
+    appears: type to filter (prefix or fuzzy), Tab to complete, empty
+    Enter to finish; recently used names come first.
 
     Args:
         ctx (click.Context): Click context object.
         task (str): The task name.
         tags (tuple[str]): The tag names (repeatable option).
         moods (tuple[str]): The mood names (repeatable option).
+        last (bool): Reuse the previous session's tags/moods.
+
+    Example:
+        >>> plog start "fix parser" --last
     """
+    from purrgress.plog import picker
+
+    today = date_cls.fromisoformat(today_iso(_tz(ctx)))
+    usage = picker.recent_usage(today) if last or not (tags and moods) else None
+    if last:
+        if usage.last is None:
+            raise click.UsageError(f"--last: no session in the last {picker.WINDOW_DAYS} days")
+        tags = tags or tuple(usage.last["tags"])
+        moods = moods or tuple(usage.last["moods"])
+
     try:
-        cfg = CFG()
+        cfg = CFG() if not (tags and moods) else None
     except Exception as e:
         log.error("[start] Failed to load config file: %s", e)
         raise
     else:
-        if not tags:
-            tag_choices = [
-                {"name": k, "checked": False} for k in cfg["tags"].keys()
-            ]
-            tags = checkbox(
-                "Select tag(s)  (space = toggle, enter = accept)",
-                choices=tag_choices,
-            ).unsafe_ask()
-
-        if not moods:
-            mood_choices = [
-                {"name": k, "checked": False} for k in cfg["moods"].keys()
-            ]
-            moods = checkbox(
-                "Select mood(s) (space = toggle, enter = accept)",
-                choices=mood_choices,
-            ).unsafe_ask()
+        if not tags and not last:
+            tags = picker.pick_many("tag", cfg["tags"].keys(), usage.tags)
+
+        if not moods and not last:
+            moods = picker.pick_many("mood", cfg["moods"].keys(), usage.moods)
 
         tags  = list(tags)
         moods = list(moods)
@@ -139,8 +173,8 @@ def status(ctx) -> None:
     iso = today_iso(tz)
 
     try:
-        if DRAFT_FILE.exists():
-            draft = yaml.safe_load(DRAFT_FILE.read_text())
+        draft = core.open_draft()
+        if draft is not None:
             print(f"[yellow]OPEN[/] {draft['task']} since {draft['start']}")
             total = core.minutes_for_day(iso)
             h, m = divmod(total, 60)
@@ -216,50 +250,153 @@ def month(year: int, month: int) -> None:
     print(f"[bold green]{y}-{m:02} total:[/bold green] {h}h{mm:02d}m ({minutes} mins)")
 
 # ----------- tidy ----------
+def _year_month(ctx, param, value: str | None) -> str | None:
+    if value is None:
+        return None
+    try:
+        y, m = (int(part) for part in value.split("-"))
+        if not 1 <= m <= 12:
+            raise ValueError
+    except ValueError:
+        raise click.BadParameter("expected YYYY-MM")
+    return f"{y:04}-{m:02}"
+
 @log_group.command()
 @log_call(logging.INFO)
 @click.option("-y","--year",  type=int, default=None, 
               help="Year, default this year")
 @click.option("-m", "--month", type=int, default=None,
               help="Month 1-12, default this month")
-def tidy(year: int, month: int) -> None:
+@click.option("--all", "all_months", is_flag=True,
+              help="Every month on disk (narrow with --from/--to/--year).")
+@click.option("--from", "start", metavar="YYYY-MM", callback=_year_month,
+              help="First month of a bulk run (inclusive).")
+@click.option("--to", "end", metavar="YYYY-MM", callback=_year_month,
+              help="Last month of a bulk run (inclusive).")
+@click.option("-j", "--jobs", type=int, default=None,
+              help="Worker processes for bulk runs (default: CPU count).")
+@click.option("--force", is_flag=True,
+              help="Ignore the tidy manifest and re-check every file.")
+def tidy(year: int, month: int, all_months: bool, start: str | None, end: str | None,
+         jobs: int | None, force: bool) -> None:
     """
-    Retro-tidy and normalize an entire month's log file in place.
+    Retro-tidy and normalize month log files in place.
     Cleans up formatting, deduplicates, and normalizes sessions.
 
+    With --all / --from / --to, months are tidied on a process pool; files
+    already recorded as canonical in DATA_ROOT/.tidy-manifest.json are
+    skipped, and only files whose bytes change are rewritten.
+
     Args:
         year (int, optional): Year (defaults to current year)
         month (int, optional): Month 1-12 (defaults to current month)
+        all_months (bool, optional): Bulk mode over every month.
+        start (str, optional): First YYYY-MM of the bulk range.
+        end (str, optional): Last YYYY-MM of the bulk range.
+        jobs (int, optional): Worker processes.
+        force (bool, optional): Ignore the manifest.
 
     Example:
         >>> plog tidy --year 2025 --month 7
         ✨  Tidied data/2025/07.yaml
+        >>> plog tidy --all --from 2024-01
+        🐾 18 file(s): 3 tidied, 2 unchanged, 13 skipped (manifest)
     """
-    today = now()
-    y = year  or today.year
-    m = month or today.month
-    month_path = resolve_pathish(f"purrgress/data/{y}/{m:02}.yaml")
+    repo = core._repo()
+    bulk = all_months or start or end
+    if bulk:
+        months = select_months(repo.months(), start, end, year)
+    else:
+        today = now()
+        months = [(year or today.year, month or today.month)]
 
-    try:
-        if month_path.exists():
-            data = yaml.safe_load(month_path.read_text()) or {}
-        else:
-            print("[yellow]Nothing to tidy.[/yellow]")
-            return
-    except Exception as e:
-        log.error("[tidy] Failed to read month file %s: %s", month_path, e)
-        raise
-    
-    cleaned = tidy_month(data)
+    if not any(repo.has_month(y, m) for y, m in months):
+        print("[yellow]Nothing to tidy.[/yellow]")
+        return
+
+    if repo.name != "yaml":
+        # rows are stored tidied; re-saving re-applies the current rules
+        for y, m in months:
+            repo.save_month(y, m, repo.load_month(y, m))
+            print(f"[bold green]✨  Tidied[/bold green] {repo.location(y, m)}")
+        return
 
     try:
-        month_path.write_text(dump_no_wrap(cleaned))
-        print(f"[bold green]✨  Tidied[/bold green] {month_path.relative_to(resolve_pathish('purrgress'))}")
+        results = tidy_months(months, root=repo.root, jobs=jobs, force=force)
     except Exception as e:
-        log.error("[tidy] Failed to write tidied month file %s: %s", month_path, e)
+        log.error("[tidy] Failed to tidy %d month(s): %s", len(months), e)
         print("[red]Failed to write tidied file![/red]")
         raise
 
+    for r in results:
+        if r.status == "changed":
+            print(f"[bold green]✨  Tidied[/bold green] {repo.location(r.year, r.month)}")
+        elif not bulk:
+            print(f"[cyan]😺  Already tidy[/cyan] {repo.location(r.year, r.month)}")
+    if bulk:
+        counts = {s: sum(r.status == s for r in results) for s in ("changed", "unchanged", "skipped")}
+        click.echo(summary_line(counts["changed"], counts["unchanged"], counts["skipped"], "tidied"))
+
+# ----------- fsck ----------
+@log_group.command()
+@log_call(logging.INFO)
+@click.option("-y", "--year", type=int, default=None,
+              help="Only months of this year")
+@click.option("--from", "start", metavar="YYYY-MM", callback=_year_month,
+              help="First month to check (inclusive).")
+@click.option("--to", "end", metavar="YYYY-MM", callback=_year_month,
+              help="Last month to check (inclusive).")
+@click.option("--repair", is_flag=True,
+              help="Fix what can be fixed safely and rewrite those files atomically.")
+@click.option("-j", "--jobs", type=int, default=None,
+              help="Worker processes (default: CPU count).")
+@click.pass_context
+def fsck(ctx, year: int | None, start: str | None, end: str | None, repair: bool,
+         jobs: int | None) -> None:
+    """
+    Validate every YAML month file: span syntax, zero-length spans, day
+    totals over 24 h, overlaps, misplaced day keys, wake/sleep times and
+    unknown tags/moods. Exits 1 if problems remain.
+
+    Args:
+        ctx (click.Context): Click context object.
+        year (int, optional): Restrict to one year.
+        start (str, optional): First YYYY-MM.
+        end (str, optional): Last YYYY-MM.
+        repair (bool, optional): Apply the safe fixes.
+        jobs (int, optional): Worker processes.
+
+    Example:
+        >>> plog fsck --repair
+        data/2025/03.yaml
+          2025-03-04 span  'code': bad span '9:00-' (dropped)
+        🐾 14 file(s) checked: 1 with issues, 1 repaired; 1 issue(s), 1 fixable
+    """
+    from purrgress.plog import fsck as checker
+
+    repo = storage.YamlRepository()
+    reports = checker.fsck(select_months(repo.months(), start, end, year),
+                           repair=repair, jobs=jobs)
+    remaining = 0
+    for r in reports:
+        if not r.issues:
+            continue
+        tag = "  [green](repaired)[/green]" if r.repaired else ""
+        print(f"[bold]{repo.location(r.year, r.month)}[/bold]{tag}")
+        for issue in r.issues:
+            colour = "yellow" if issue.fixable else "red"
+            print(f"  {issue.day or '-':<10} [{colour}]{issue.code:<11}[/{colour}] {escape(issue.message)}")
+            remaining += not (issue.fixable and r.repaired)
+
+    issues = [i for r in reports for i in r.issues]
+    fixable = sum(i.fixable for i in issues)
+    click.echo(f"🐾 {len(reports)} file(s) checked: {sum(bool(r.issues) for r in reports)} with issues, "
+               f"{sum(r.repaired for r in reports)} repaired; {len(issues)} issue(s), {fixable} fixable")
+    if fixable and not repair:
+        click.echo("💡 Use --repair to apply the fixable ones.")
+    if remaining:
+        ctx.exit(1)
+
 @log_group.command()
 @log_call(logging.INFO)
 @click.option("-y", "--year",  type=int, 
@@ -270,10 +407,12 @@ def tidy(year: int, month: int) -> None:
               help="Matplotlib colormap (viridis, magma, plasma, turbo, etc.)")
 @click.option("--dark/--light", default=False, 
               help="Dark background")
+@click.option("--term", is_flag=True,
+              help="Draw the grid in the terminal instead of writing a PNG (no matplotlib).")
 @click.pass_context
-def heatmap(ctx, year: int, month: int, theme: str, dark: bool):
+def heatmap(ctx, year: int, month: int, theme: str, dark: bool, term: bool):
     """
-    Generate an hour-by-day heat-map PNG.
+    Generate an hour-by-day heat-map PNG, or draw it in the terminal.
 
     Args:
         ctx (click.Context): Click context object.
@@ -281,13 +420,461 @@ def heatmap(ctx, year: int, month: int, theme: str, dark: bool):
         month (int, optional): Month 1-12 (defaults to current month)
         theme (str, optional): Heatmap color theme. Default is 'viridis'.
         dark (bool, optional): Use dark mode. Default is False.
+        term (bool, optional): Render with rich in the terminal. Default is False.
     """
     dt   = now()
     y    = year  or dt.year
     m    = month or dt.month
+
+    if term:
+        from purrgress.plog.grid import month_grid
+        from purrgress.plog.termviz import print_heatmap
+
+        grid = month_grid(y, m)
+        if grid is None:
+            print(f"[yellow]No data for {y}-{m:02}.[/yellow]")
+            return
+        print_heatmap(grid, y, m, theme=theme)
+        return
+
+    from purrgress.plog.reports import make_heatmap
+
     path = make_heatmap(y, m, theme=theme, dark=dark, tz=_tz(ctx))
     print(f"🖼  [bold green]Heat-map saved to[/bold green] {path}")
 
+@log_group.command()
+@log_call(logging.INFO)
+@click.option("-y", "--year", type=int,
+              help="Year, default this year")
+@click.option("-m", "--month", "months", type=int, multiple=True,
+              help="Month 1-12 (repeatable), default every logged month")
+@click.option("--theme", default="viridis",
+              help="Matplotlib colormap (viridis, magma, plasma, turbo, etc.)")
+@click.option("--scale", type=click.IntRange(1, 64), default=4, show_default=True,
+              help="Pixels per hour/day cell")
+@click.option("-o", "--out", "out_dir", type=click.Path(file_okay=False), default=None,
+              help="Output directory, default purrgress/visuals/<year>/thumbs")
+def thumbs(year: int, months: tuple[int], theme: str, scale: int, out_dir: str | None):
+    """
+    Batch-write unannotated heat-map thumbnails (no Matplotlib figures).
+
+    Args:
+        year (int, optional): Year (defaults to current year)
+        months (tuple[int], optional): Months to render.
+        theme (str, optional): Colormap. Default is 'viridis'.
+        scale (int, optional): Pixels per cell edge. Default is 4.
+        out_dir (str, optional): Output directory.
+    """
+    from purrgress.plog.reports import make_thumbnails
+
+    y = year or now().year
+    paths = make_thumbnails(y, list(months) or None, theme=theme, scale=scale, out_dir=out_dir)
+    if not paths:
+        print(f"[yellow]No data for {y}.[/yellow]")
+        return
+    for path in paths:
+        print(f"🖼  [bold green]Thumbnail saved to[/bold green] {path}")
+
+# ----------- overlaps ----------
+def _iso_day(ctx, param, value: str | None) -> str | None:
+    if value is None:
+        return None
+    try:
+        return date_cls.fromisoformat(value).isoformat()
+    except ValueError:
+        raise click.BadParameter("expected YYYY-MM-DD")
+
+@log_group.command()
+@log_call(logging.INFO)
+@click.option("--from", "start", metavar="YYYY-MM-DD", callback=_iso_day,
+              help="First day (default: Jan 1 of this year)")
+@click.option("--to", "end", metavar="YYYY-MM-DD", callback=_iso_day,
+              help="Last day (default: Dec 31 of this year)")
+@click.option("--limit", type=int, default=50, show_default=True,
+              help="Overlaps to list (0 = all)")
+def overlaps(start: str | None, end: str | None, limit: int) -> None:
+    """
+    Find spans from different sessions that overlap, and how many minutes
+    that double-counts.
+
+    Args:
+        start (str, optional): First ISO day.
+        end (str, optional): Last ISO day.
+        limit (int, optional): Maximum overlaps printed.
+
+    Example:
+        >>> plog overlaps --from 2025-01-01 --to 2025-12-31
+        2025-03-04 09:30-10:00  30 min  code [py] ↔ read [py]
+        1 overlap(s); logged 4276 min, unique 4246 min (30 double-counted)
+    """
+    from purrgress.plog import intervals
+
+    year = now().year
+    start = start or f"{year}-01-01"
+    end = end or f"{year}-12-31"
+    report = intervals.scan(core._repo().load_range(start, end))
+
+    shown = report.overlaps if limit <= 0 else report.overlaps[:limit]
+    for ov in shown:
+        day_iso, hm = intervals.abs_to_day(ov.start)
+        a = escape(f"{ov.a.task} [{', '.join(ov.a.tags)}]")
+        b = escape(f"{ov.b.task} [{', '.join(ov.b.tags)}]")
+        print(f"[yellow]{day_iso} {hm}-{intervals.fmt_hm(ov.end)}[/yellow]  "
+              f"{ov.end - ov.start} min  {a} ↔ {b}")
+    if len(shown) < len(report.overlaps):
+        print(f"[dim]… {len(report.overlaps) - len(shown)} more[/dim]")
+
+    doubled = report.logged - report.unique
+    colour = "green" if not report.overlaps else "bold yellow"
+    print(f"[{colour}]{len(report.overlaps)} overlap(s)[/{colour}]; logged {report.logged} min, "
+          f"unique {report.unique} min ({doubled} double-counted)")
+
+# ----------- total ----------
+@log_group.command()
+@log_call(logging.INFO)
+@click.option("--from", "start", metavar="YYYY-MM-DD", callback=_iso_day,
+              help="First day (default: 1st of this month)")
+@click.option("--to", "end", metavar="YYYY-MM-DD", callback=_iso_day,
+              help="Last day (default: today)")
+@click.option("--by", type=click.Choice(totals.PERIODS), default=None,
+              help="Also break the range down per week / month / year")
+@click.pass_context
+def total(ctx, start: str | None, end: str | None, by: str | None) -> None:
+    """
+    Minutes logged over a date range, plus 7/30-day rolling averages,
+    answered from the daily-totals index (no YAML parsing once built).
+
+    Args:
+        ctx (click.Context): Click context object.
+        start (str, optional): First ISO day.
+        end (str, optional): Last ISO day.
+        by (str, optional): Period breakdown.
+
+    Example:
+        >>> plog total --from 2024-03-14 --to 2025-02-02 --by month
+    """
+    end_day = date_cls.fromisoformat(end or today_iso(_tz(ctx)))
+    start_day = date_cls.fromisoformat(start) if start else end_day.replace(day=1)
+    if start_day > end_day:
+        raise click.BadParameter("--from is after --to")
+
+    idx = totals.load(core._repo())
+    minutes = totals.range_total(idx, start_day, end_day)
+    days = (end_day - start_day).days + 1
+    h, m = divmod(minutes, 60)
+    print(f"[bold green]{start_day} → {end_day}:[/bold green] {minutes} mins ({h}h{m:02d}m), "
+          f"{minutes / days:.1f} min/day over {days} day(s)")
+    print(f"7-day avg: {totals.rolling_average(idx, 7, end_day):.1f} min/day   "
+          f"30-day avg: {totals.rolling_average(idx, 30, end_day):.1f} min/day")
+
+    if by:
+        for label, mins in totals.period_sums(idx, start_day, end_day, by).items():
+            ph, pm = divmod(mins, 60)
+            click.echo(f"  {label:>8}  {mins:>6} mins  {ph:>4}h{pm:02d}m")
+
+# ----------- profile ----------
+@log_group.command()
+@log_call(logging.INFO)
+@click.option("--from", "start", metavar="YYYY-MM-DD", callback=_iso_day,
+              help="First day (default: Jan 1 of this year)")
+@click.option("--to", "end", metavar="YYYY-MM-DD", callback=_iso_day,
+              help="Last day (default: today)")
+@click.option("--bin", "bin_minutes", type=click.Choice([str(b) for b in weekly.BINS]),
+              default="60", show_default=True, help="Bin width in minutes")
+@click.option("--by-tag", is_flag=True,
+              help="One profile per tag instead of a single total")
+@click.option("--png", is_flag=True,
+              help="Write PNGs instead of drawing in the terminal")
+@click.option("--theme", default="viridis",
+              help="Matplotlib colormap (viridis, magma, plasma, turbo, etc.)")
+@click.option("--dark/--light", default=False,
+              help="Dark background (PNG only)")
+@click.option("-o", "--out", "out_dir", type=click.Path(file_okay=False), default=None,
+              help="PNG directory, default purrgress/visuals/profile")
+@click.pass_context
+def profile(ctx, start: str | None, end: str | None, bin_minutes: str, by_tag: bool,
+            png: bool, theme: str, dark: bool, out_dir: str | None) -> None:
+    """
+    Weekday × time-of-day profile: every span in the range folded onto one
+    week, so habitual hours stand out.
+
+    Args:
+        ctx (click.Context): Click context object.
+        start (str, optional): First ISO day.
+        end (str, optional): Last ISO day.
+        bin_minutes (str, optional): Bin width. Default is 60.
+        by_tag (bool, optional): Split per tag. Default is False.
+        png (bool, optional): Save PNGs instead of terminal output.
+        theme (str, optional): Colormap. Default is 'viridis'.
+        dark (bool, optional): Dark PNG background. Default is False.
+        out_dir (str, optional): PNG output directory.
+
+    Example:
+        >>> plog profile --from 2024-01-01 --bin 15 --by-tag --png
+    """
+    end = end or today_iso(_tz(ctx))
+    start = start or f"{end[:4]}-01-01"
+    if start > end:
+        raise click.BadParameter("--from is after --to")
+    width = int(bin_minutes)
+
+    profiles = weekly.week_profile(core._repo().load_range(start, end), bin_minutes=width, by_tag=by_tag)
+    if not any(m.any() for m in profiles.values()):
+        print(f"[yellow]No data for {start} → {end}.[/yellow]")
+        return
+
+    if png:
+        from purrgress.plog.reports import make_profile
+
+        for path in make_profile(profiles, start, end, bin_minutes=width, theme=theme,
+                                 dark=dark, out_dir=out_dir):
+            print(f"🖼  [bold green]Profile saved to[/bold green] {path}")
+        return
+
+    from purrgress.plog.termviz import print_profile
+
+    print_profile(profiles, start, end, bin_minutes=width, theme=theme)
+
+# ----------- report ----------
+@log_group.group()
+def report() -> None:
+    """Static markdown report tree (per-month pages, heat-maps, indexes)."""
+
+@report.command("build")
+@log_call(logging.INFO)
+@click.option("-o", "--out", "out_dir", type=click.Path(file_okay=False), default=None,
+              help="Output root, default purrgress/reports")
+@click.option("-j", "--jobs", type=int, default=None,
+              help="Worker processes for month pages (default: CPU count)")
+@click.option("--force", is_flag=True,
+              help="Ignore the manifest and rebuild every page")
+@click.option("--theme", default="viridis",
+              help="Matplotlib colormap for the heat-maps")
+@click.option("--scale", type=click.IntRange(1, 64), default=4, show_default=True,
+              help="Pixels per hour/day cell")
+def report_build(out_dir: str | None, jobs: int | None, force: bool, theme: str, scale: int) -> None:
+    """
+    Build or refresh the report tree; only months whose data changed since
+    the last build are re-rendered.
+
+    Args:
+        out_dir (str, optional): Output root.
+        jobs (int, optional): Worker processes.
+        force (bool, optional): Rebuild everything.
+        theme (str, optional): Colormap. Default is 'viridis'.
+        scale (int, optional): Pixels per cell edge. Default is 4.
+
+    Example:
+        >>> plog report build -o docs/plog
+        📄 3 month(s) rendered, 33 unchanged, 0 removed → docs/plog/index.md
+    """
+    from purrgress.plog import site
+
+    out = resolve_pathish(out_dir) if out_dir else None
+    result = site.build(out_dir=out, jobs=jobs, force=force, theme=theme, scale=scale)
+    for rel in result.written:
+        log.info("[report] wrote %s", rel)
+    index = (out or resolve_pathish("purrgress/reports")) / "index.md"
+    print(f"📄 [bold green]{len(result.rendered)} month(s) rendered[/bold green], "
+          f"{result.skipped} unchanged, {len(result.removed)} removed → {index}")
+
+# ----------- rollup ----------
+@log_group.command()
+@log_call(logging.INFO)
+@click.option("--roots", "roots", multiple=True, metavar="[NAME=]DIR",
+              help="Data root to include (repeatable; extra DIR arguments are roots too)")
+@click.argument("more_roots", nargs=-1, metavar="[DIR]...")
+@click.option("--from", "start", metavar="YYYY-MM-DD", callback=_iso_day,
+              help="First day (default: Monday of this week)")
+@click.option("--to", "end", metavar="YYYY-MM-DD", callback=_iso_day,
+              help="Last day (default: today)")
+@click.option("--by", type=click.Choice(["person", "tag", "task"]), multiple=True,
+              help="Tables to print (default: all three)")
+@click.option("--top", type=click.IntRange(1), default=10, show_default=True,
+              help="Rows per tag/task table")
+@click.option("-j", "--jobs", type=int, default=None,
+              help="Worker processes (default: CPU count)")
+@click.pass_context
+def rollup(ctx, roots: tuple[str], more_roots: tuple[str], start: str | None, end: str | None,
+           by: tuple[str], top: int, jobs: int | None) -> None:
+    """
+    Team totals across many people's data roots, by person, tag and task.
+    Each root is read by its own worker; only per-root summaries are merged.
+    A root's person is its directory name (above purrgress/data), or NAME=.
+
+    Args:
+        ctx (click.Context): Click context object.
+        roots (tuple[str]): Roots given with --roots.
+        more_roots (tuple[str]): Roots given as arguments.
+        start (str, optional): First ISO day.
+        end (str, optional): Last ISO day.
+        by (tuple[str], optional): Tables to print.
+        top (int, optional): Rows per tag/task table. Default is 10.
+        jobs (int, optional): Worker processes.
+
+    Example:
+        >>> plog rollup --roots team/*/purrgress/data --from 2025-07-01
+    """
+    from purrgress.plog import rollup as rollup_mod
+
+    specs = roots + more_roots
+    if not specs:
+        raise click.UsageError("give at least one data root (--roots DIR...)")
+    end_day = date_cls.fromisoformat(end or today_iso(_tz(ctx)))
+    start_day = date_cls.fromisoformat(start) if start else end_day - timedelta(days=end_day.weekday())
+    if start_day > end_day:
+        raise click.BadParameter("--from is after --to")
+
+    result = rollup_mod.rollup([rollup_mod.parse_root(s) for s in specs], start_day, end_day, jobs=jobs)
+    by = by or ("person", "tag", "task")
+
+    def _row(label: str, mins: int, extra: str = "") -> None:
+        h, m = divmod(mins, 60)
+        share = 100 * mins / result.minutes if result.minutes else 0
+        click.echo(f"  {label[:24]:<24} {mins:>7} mins {h:>5}h{m:02d}m {share:>5.1f}%{extra}")
+
+    print(f"[bold green]{start_day} → {end_day}:[/bold green] {result.minutes} mins "
+          f"across {len(result.people)} person(s)")
+    if "person" in by:
+        print("[bold]by person[/bold]")
+        for p in result.people:
+            if p.error:
+                print(f"  [red]{escape(p.person)}: {escape(p.error)}[/red]")
+            else:
+                lead = next(iter(p.tags), "")
+                _row(p.person, p.minutes, f"  {p.days:>3} day(s)" + (f", mostly {lead}" if lead else ""))
+    for field in ("tag", "task"):
+        if field in by:
+            counts = getattr(result, f"{field}s")
+            print(f"[bold]by {field}[/bold]")
+            for label, mins in list(counts.items())[:top]:
+                _row(label or "(no task)", mins)
+            if len(counts) > top:
+                print(f"[dim]  … {len(counts) - top} more[/dim]")
+    if any(p.error for p in result.people):
+        ctx.exit(1)
+
+# ----------- pack ----------
+@log_group.command("pack")
+@log_call(logging.INFO)
+@click.option("--before", type=int, required=True, metavar="YYYY",
+              help="Pack every year before this one")
+@click.option("--codec", type=click.Choice(pack_mod.CODECS), default=pack_mod.DEFAULT_CODEC,
+              show_default=True, help="Compression (zstd needs the `zstandard` package)")
+def pack_cmd(before: int, codec: str) -> None:
+    """
+    Roll old month files into compressed per-year bundles
+    (DATA_ROOT/<year>.plogpack); every reader still sees the months.
+
+    Args:
+        before (int): First year to keep as loose files.
+        codec (str): Compression codec.
+
+    Example:
+        >>> plog pack --before 2025
+        📦 2024: 12 month(s), 1843 KiB → 201 KiB (data/2024.plogpack)
+    """
+    repo = storage.YamlRepository()
+    results = pack_mod.pack(repo.root, before, codec)
+    if not results:
+        print("[yellow]Nothing to pack.[/yellow]")
+    for r in results:
+        print(f"📦 [bold green]{r.year}[/bold green]: {len(r.months)} month(s), "
+              f"{r.raw_bytes // 1024} KiB → {r.packed_bytes // 1024} KiB "
+              f"({pack_mod.bundle_path(repo.root, r.year).name})")
+
+@log_group.command("unpack")
+@log_call(logging.INFO)
+@click.option("-y", "--year", "years", type=int, multiple=True,
+              help="Year to unpack (repeatable), default every bundle")
+def unpack_cmd(years: tuple[int]) -> None:
+    """
+    Restore packed months to loose YAML files (same bytes and mtimes) and
+    remove the bundles.
+
+    Args:
+        years (tuple[int], optional): Years to unpack.
+    """
+    repo = storage.YamlRepository()
+    results = pack_mod.unpack(repo.root, list(years) or None)
+    if not results:
+        print("[yellow]Nothing to unpack.[/yellow]")
+    for r in results:
+        print(f"📂 [bold green]{r.year}[/bold green]: restored {len(r.months)} month(s)")
+
+# ----------- sync ----------
+@log_group.command()
+@log_call(logging.INFO)
+@click.argument("src", type=click.Path(exists=True, file_okay=False))
+@click.argument("dst", type=click.Path(exists=True, file_okay=False))
+@click.option("--one-way", is_flag=True, help="Only update DST.")
+@click.option("-n", "--dry-run", is_flag=True, help="List differing days, write nothing.")
+def sync(src: str, dst: str, one_way: bool, dry_run: bool) -> None:
+    """
+    Merge two data roots (e.g. laptop and a mounted desktop share) so both
+    hold every session. Only days whose content hashes differ are merged;
+    only their month files are rewritten, atomically.
+
+    Args:
+        src (str): First data root (wins wake/sleep conflicts).
+        dst (str): Second data root.
+        one_way (bool, optional): Only update DST.
+        dry_run (bool, optional): Report without writing.
+
+    Example:
+        >>> plog sync purrgress/data /mnt/desktop/purrgress/data
+        🔄 3 day(s) differed in 2 month(s); rewrote src:2025-07, dst:2025-07, dst:2025-08
+    """
+    from purrgress.plog import sync as sync_mod
+
+    result = sync_mod.sync(resolve_pathish(src), resolve_pathish(dst), one_way=one_way, dry_run=dry_run)
+    for line in result.conflicts:
+        print(f"[yellow]conflict[/yellow] {escape(line)}")
+    if not result.days:
+        print("[bold green]🔄 Already in sync[/bold green]")
+        return
+    months = sorted({d[:7] for d in result.days})
+    if dry_run:
+        print(f"🔄 [bold]{len(result.days)} day(s) differ[/bold] in {len(months)} month(s):")
+        click.echo("  " + ", ".join(result.days))
+        return
+    rewrote = ", ".join(f"{side}:{key}" for side, key in result.written) or "nothing"
+    print(f"🔄 [bold green]{len(result.days)} day(s) differed[/bold green] in {len(months)} month(s); "
+          f"rewrote {rewrote}")
+
+# ----------- migrate ----------
+@log_group.command()
+@log_call(logging.INFO)
+@click.option("--from", "src", type=click.Choice(storage.BACKENDS), default="yaml", show_default=True,
+              help="Backend to read.")
+@click.option("--to", "dst", type=click.Choice(storage.BACKENDS), default="sqlite", show_default=True,
+              help="Backend to write.")
+@click.option("--db", type=click.Path(dir_okay=False), default=None,
+              help=f"SQLite file, default DATA_ROOT/{storage.SQLITE_NAME}")
+def migrate(src: str, dst: str, db: str | None) -> None:
+    """
+    Copy every month from one storage backend to another.
+
+    Months present in the target are replaced; others are left alone.
+
+    Args:
+        src (str): Source backend.
+        dst (str): Target backend.
+        db (str, optional): SQLite database path for whichever side is sqlite.
+
+    Example:
+        >>> plog migrate --from yaml --to sqlite
+        🚚  Migrated 7 month(s) yaml → sqlite
+    """
+    if src == dst:
+        raise click.BadParameter("--from and --to must differ")
+
+    def _open(name):
+        return storage.get_repository(name, location=db if name == "sqlite" else None)
+
+    copied = storage.migrate(_open(src), _open(dst))
+    print(f"[bold green]🚚  Migrated {len(copied)} month(s)[/bold green] {src} → {dst}")
+
 @log_group.result_callback()
 def cli_finished(result, **kwargs):
     pass
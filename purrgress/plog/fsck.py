@@ -0,0 +1,225 @@
+"""
+Integrity checks for the YAML month files (`plog fsck`).
+
+Every file is parsed and walked on its own, so files are checked in
+parallel on the bulk process pool. Problems that have one obvious fix
+(malformed or zero-length spans, bad wake/sleep times, missing
+`sessions`, non-mapping sessions, scalar tags/moods, unquoted day keys)
+can be repaired: the file is rewritten
+atomically, tidied, and only if its bytes change. Everything else
+(overlaps across sessions, misplaced or unparsable day keys, unknown
+tags/moods) needs a human and is only reported.
+
+A span string can't encode more than 24 h ("09:00-09:00" reads as zero
+length), so the ">24 h" check applies to a day's logged total (overlapping
+sessions counted once, `intervals.day_total`).
+"""
+import logging
+from datetime import date
+from logging import getLogger
+from pathlib import Path
+from typing import NamedTuple
+
+import yaml
+
+from purrgress.plog import monthio
+from purrgress.plog.bulk import run_processes
+from purrgress.plog.cleanup import tidy_month
+from purrgress.plog.config import CFG
+from purrgress.plog.intervals import DAY_MIN, day_intervals, day_total, find_overlaps, fmt_span
+from purrgress.plog.storage import YamlRepository
+from purrgress.utils import log_call
+from purrgress.utils.date import parse_hm, parse_span
+from purrgress.utils.load import write_atomic
+
+log = getLogger("plog")
+
+class Issue(NamedTuple):
+    day: str             # ISO day, or "" for file-level problems
+    code: str            # see CODES
+    message: str
+    fixable: bool
+
+class FileReport(NamedTuple):
+    year: int
+    month: int
+    issues: list
+    repaired: bool
+
+CODES = (
+    "yaml", "root", "day_key", "wrong_month", "node", "sessions", "wake", "sleep",
+    "session", "span", "zero_span", "day_total", "overlap", "tag", "mood",
+)
+
+class _Job(NamedTuple):
+    path: str
+    year: int
+    month: int
+    tags: frozenset | None
+    moods: frozenset | None
+    repair: bool
+
+def check_day(day_iso: str, node, tags: frozenset | None = None,
+              moods: frozenset | None = None) -> tuple[list[Issue], dict | None]:
+    """
+    Validate one day node.
+
+    Args:
+        day_iso (str): The (already validated) ISO day.
+        node: Raw day value from the file.
+        tags (frozenset | None): Known tags (None = don't check).
+        moods (frozenset | None): Known moods (None = don't check).
+
+    Returns:
+        tuple: (issues, repaired node) - the node is None when it can't be
+        repaired automatically.
+    """
+    if not isinstance(node, dict):
+        return [Issue(day_iso, "node", f"day is a {type(node).__name__}, not a mapping", False)], None
+
+    issues: list[Issue] = []
+    fixed = dict(node)
+    for key in ("wake", "sleep"):
+        if key in fixed and (not isinstance(fixed[key], str) or parse_hm(fixed[key]) is None):
+            issues.append(Issue(day_iso, key, f"{key} {fixed[key]!r} is not HH:MM (dropped)", True))
+            del fixed[key]
+
+    sessions = fixed.get("sessions")
+    if not isinstance(sessions, list):
+        what = "missing" if sessions is None else f"a {type(sessions).__name__}"
+        issues.append(Issue(day_iso, "sessions", f"sessions is {what} (reset to [])", True))
+        fixed["sessions"] = sessions = []
+
+    clean_sessions = []
+    for i, sess in enumerate(sessions):
+        if not isinstance(sess, dict):
+            issues.append(Issue(day_iso, "session", f"session #{i} is not a mapping (dropped)", True))
+            continue
+        sess = dict(sess)
+        spans = []
+        raw_spans = sess.get("spans") or []
+        if not isinstance(raw_spans, list):
+            issues.append(Issue(day_iso, "span", f"{sess.get('task', '')!r}: spans {raw_spans!r} is not a list (wrapped)", True))
+            raw_spans = [raw_spans]
+        for span in raw_spans:
+            iv = parse_span(span)
+            if iv is None:
+                issues.append(Issue(day_iso, "span", f"{sess.get('task', '')!r}: bad span {span!r} (dropped)", True))
+            elif iv[0] == iv[1]:
+                issues.append(Issue(day_iso, "zero_span", f"{sess.get('task', '')!r}: zero-length {span} (dropped)", True))
+            else:
+                spans.append(span)
+        if spans != (sess.get("spans") or []):
+            sess["spans"] = spans
+        for field, known in (("tags", tags), ("moods", moods)):
+            values = sess.get(field)
+            if values is not None and not isinstance(values, list):
+                issues.append(Issue(day_iso, field[:-1], f"{field} {values!r} is not a list (wrapped)", True))
+                sess[field] = values = [values]
+            strings = [v for v in values or [] if isinstance(v, str)]
+            for value in values or []:
+                if not isinstance(value, str):
+                    issues.append(Issue(day_iso, field[:-1], f"{field[:-1]} {value!r} is not a string (dropped)", True))
+            if values is not None and len(strings) != len(values):
+                sess[field] = strings
+            if known is None:
+                continue
+            for value in strings:
+                if value not in known:
+                    issues.append(Issue(day_iso, field[:-1], f"unknown {field[:-1]} {value!r}", False))
+        clean_sessions.append(sess)
+    fixed["sessions"] = clean_sessions
+
+    logged = day_total(fixed)
+    if logged > DAY_MIN:
+        issues.append(Issue(day_iso, "day_total", f"{logged} min logged (> 24 h)", False))
+    for ov in find_overlaps(day_intervals(day_iso, fixed)):
+        issues.append(Issue(day_iso, "overlap",
+                            f"{fmt_span(ov.start, ov.end)} {ov.a.task!r} overlaps {ov.b.task!r}", False))
+    return issues, fixed
+
+def check_month(data, year: int, month: int, tags: frozenset | None = None,
+                moods: frozenset | None = None) -> tuple[list[Issue], dict | None]:
+    """
+    Validate parsed month data against the file's year/month.
+
+    Returns:
+        tuple: (issues, repaired data or None if nothing was repairable).
+    """
+    if not isinstance(data, dict):
+        return [Issue("", "root", f"top level is a {type(data).__name__}, not a mapping", False)], None
+
+    issues: list[Issue] = []
+    fixed = {}
+    for day, node in data.items():
+        try:
+            d = date.fromisoformat(str(day))
+        except ValueError:
+            issues.append(Issue(str(day), "day_key", f"day key {day!r} is not YYYY-MM-DD", False))
+            fixed[day] = node
+            continue
+        if not isinstance(day, str):
+            # an unquoted 2025-03-01 loads as a date object
+            issues.append(Issue(str(day), "day_key", "day key is not quoted (quoted)", True))
+            day = str(day)
+        if (d.year, d.month) != (year, month):
+            issues.append(Issue(str(day), "wrong_month", f"belongs in {d.year}/{d.month:02}.yaml", False))
+        day_issues, day_fixed = check_day(str(day), node, tags, moods)
+        issues.extend(day_issues)
+        fixed[day] = node if day_fixed is None else day_fixed
+    return issues, fixed
+
+def _check_file(job: _Job) -> FileReport:
+    """Worker: check (and maybe repair) one month file."""
+    p = Path(job.path)
+    raw = p.read_bytes()
+    try:
+        data = monthio.load_month_text(raw.decode("utf-8"))
+    except (UnicodeDecodeError, yaml.YAMLError) as e:
+        return FileReport(job.year, job.month, [Issue("", "yaml", str(e).splitlines()[0], False)], False)
+
+    issues, fixed = check_month(data, job.year, job.month, job.tags, job.moods)
+    repaired = False
+    if job.repair and fixed is not None and any(i.fixable for i in issues):
+        # unparsable day keys / non-mapping days would break tidy_month; leave those files alone
+        if not any(i.code in ("day_key", "node") and not i.fixable for i in issues):
+            out = monthio.dump_month(tidy_month(fixed)).encode("utf-8")
+            if out != raw:
+                write_atomic(p, out)
+                repaired = True
+    return FileReport(job.year, job.month, issues, repaired)
+
+def _known(section: str) -> frozenset | None:
+    try:
+        return frozenset((CFG() or {}).get(section) or ())
+    except Exception as e:
+        log.warning("[fsck] No config, skipping %s check: %s", section, e)
+        return None
+
+@log_call(logging.INFO)
+def fsck(months: list[tuple[int, int]] | None = None, *, root: Path | None = None,
+         repair: bool = False, jobs: int | None = None) -> list[FileReport]:
+    """
+    Check month files in parallel, optionally repairing the fixable issues.
+
+    Args:
+        months (list[tuple[int, int]] | None): (year, month) pairs (default: all).
+        root (Path | None): Data root (default `core.DATA_ROOT`).
+        repair (bool): Rewrite files that have fixable issues.
+        jobs (int | None): Worker processes (default: CPU count).
+
+    Returns:
+        list[FileReport]: One report per file, by month.
+    """
+    repo = YamlRepository(root)
+    months = repo.months() if months is None else months
+    tags, moods = _known("tags"), _known("moods")
+    todo = [_Job(str(repo.month_path(y, m)), y, m, tags, moods, repair)
+            for y, m in months if repo.month_path(y, m).exists()]
+    try:
+        return run_processes(_check_file, todo, jobs)
+    except Exception as e:
+        log.error("[fsck] Worker failed: %s", e)
+        raise
+
+__all__ = ["CODES", "FileReport", "Issue", "check_day", "check_month", "fsck"]
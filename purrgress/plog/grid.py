@@ -0,0 +1,95 @@
+"""
+Hour × day minute grids built with NumPy only (no pandas / matplotlib), so
+both the PNG heat-map and the terminal view share one set of numbers.
+"""
+import calendar
+from logging import getLogger
+
+import numpy as np
+
+from purrgress.plog import core
+from purrgress.plog.cleanup import tidy_month
+from purrgress.utils import log_call
+from purrgress.utils.date import parse_span
+
+log = getLogger("plog")
+
+DAY_MIN = 24 * 60
+
+def days_in_month(year: int, month: int) -> int:
+    return calendar.monthrange(year, month)[1]
+
+def span_arrays(month_data: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Flatten every parsable span of a month into parallel arrays.
+
+    Args:
+        month_data (dict): Month log keyed by ISO day.
+
+    Returns:
+        tuple: (day numbers, start minutes, end minutes); end > start for
+        spans rolling past midnight. Malformed spans are skipped.
+    """
+    days, starts, ends = [], [], []
+    for day_iso, node in month_data.items():
+        try:
+            day_num = int(str(day_iso).split("-")[2])
+        except (IndexError, ValueError):
+            continue
+        for sess in (node or {}).get("sessions") or []:
+            for span in sess.get("spans") or []:
+                parsed = parse_span(span)
+                if parsed is None:
+                    continue
+                days.append(day_num)
+                starts.append(parsed[0])
+                ends.append(parsed[1])
+    return (np.asarray(days, dtype=np.int64),
+            np.asarray(starts, dtype=np.int64),
+            np.asarray(ends, dtype=np.int64))
+
+@log_call()
+def hour_day_grid(month_data: dict, days: int) -> np.ndarray:
+    """
+    Minutes logged per [hour, day] cell, counted minute by minute.
+
+    Uses a difference array over the month's minutes: +1 at each span start,
+    -1 at its end, then a cumulative sum - O(spans + minutes in month).
+    A minute counts once however many sessions overlap it, so no cell
+    exceeds 60. Spans crossing midnight spill into the next day; minutes
+    falling past the last day of the month are dropped.
+
+    Args:
+        month_data (dict): Month log keyed by ISO day.
+        days (int): Number of days in the month.
+
+    Returns:
+        np.ndarray: int64 array of shape (24, days).
+    """
+    day_nums, starts, ends = span_arrays(month_data)
+    keep = (day_nums >= 1) & (day_nums <= days)
+    base = (day_nums[keep] - 1) * DAY_MIN
+    total = days * DAY_MIN
+
+    lo = np.minimum(base + starts[keep], total)
+    hi = np.minimum(base + ends[keep], total)
+
+    diff = np.zeros(total + 1, dtype=np.int64)
+    np.add.at(diff, lo, 1)
+    np.add.at(diff, hi, -1)
+    covered = (np.cumsum(diff[:-1]) > 0).astype(np.int64)
+    return covered.reshape(days, 24, 60).sum(axis=2).T
+
+@log_call()
+def month_grid(year: int, month: int) -> np.ndarray | None:
+    """
+    Load, tidy and grid one month from the active storage backend.
+
+    Returns:
+        np.ndarray | None: (24, days) grid, or None if the month has no data.
+    """
+    repo = core._repo()
+    if not repo.has_month(year, month):
+        log.warning("[month_grid] No data for %d-%02d", year, month)
+        return None
+    return hour_day_grid(tidy_month(repo.load_month(year, month)), days_in_month(year, month))
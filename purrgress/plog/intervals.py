@@ -0,0 +1,187 @@
+"""
+Sweep-line interval engine for session spans.
+
+Spans are handled as integer minutes: "HH:MM-HH:MM" → (start, end) with
+end > 1440 when a span rolls past midnight. For multi-day scans minutes
+are made absolute (day ordinal × 1440 + minute), so a late-night span
+that spills into the next morning is compared against that morning too.
+
+Touching spans ("09:00-10:00", "10:00-11:00") do not overlap.
+"""
+import heapq
+from datetime import date
+from logging import getLogger
+from typing import Hashable, Iterable, NamedTuple
+
+from purrgress.utils import log_call
+from purrgress.utils.date import parse_span
+
+log = getLogger("plog")
+
+DAY_MIN = 24 * 60
+
+class Overlap(NamedTuple):
+    start: int
+    end: int
+    a: Hashable
+    b: Hashable
+
+class SessionRef(NamedTuple):
+    day: str
+    index: int
+    task: str
+    tags: tuple
+
+class OverlapReport(NamedTuple):
+    overlaps: list
+    logged: int
+    unique: int
+
+def fmt_hm(minute: int) -> str:
+    minute %= DAY_MIN
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+def fmt_span(start: int, end: int) -> str:
+    return f"{fmt_hm(start)}-{fmt_hm(end)}"
+
+def merge_intervals(intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Union of intervals, sorted; overlapping ones are merged, touching ones
+    are kept apart. O(n log n).
+    """
+    merged: list[list[int]] = []
+    for s, e in sorted(intervals):
+        if merged and s < merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], e)
+        else:
+            merged.append([s, e])
+    return [(s, e) for s, e in merged]
+
+def unique_minutes(intervals: Iterable[tuple[int, int]]) -> int:
+    """Minutes covered by at least one interval (overlaps counted once)."""
+    return sum(e - s for s, e in merge_intervals(intervals))
+
+def day_total(node: dict) -> int:
+    """
+    Minutes logged on a day: the union of every session's parsable spans,
+    so overlapping sessions count once (the same numbers the heat-map grid
+    shows). This is the day-total semantics used by every aggregate.
+    """
+    intervals = []
+    for sess in (node or {}).get("sessions") or []:
+        for span in sess.get("spans") or []:
+            iv = parse_span(span)
+            if iv is not None:
+                intervals.append(iv)
+    return unique_minutes(intervals)
+
+def merge_spans(spans: Iterable[str]) -> list[str]:
+    """
+    Dedupe span strings and merge the overlapping ones.
+
+    Spans that don't overlap anything keep their original text; a merged
+    group is rewritten as one "HH:MM-HH:MM" span (or keeps the text of the
+    member that already covers it). Groups that would reach 24 h, and
+    malformed spans, are left untouched. Order is not guaranteed; callers
+    sort afterwards.
+    """
+    parsed, out = [], []
+    for span in dict.fromkeys(spans):
+        iv = parse_span(span)
+        if iv is None:
+            out.append(span)
+        else:
+            parsed.append((iv[0], iv[1], span))
+    parsed.sort()
+
+    group: list[tuple[int, int, str]] = []
+    group_end = -1
+
+    def _flush():
+        if not group:
+            return
+        s, e = group[0][0], group_end
+        if len(group) == 1:
+            out.append(group[0][2])
+        elif e - s >= DAY_MIN:
+            out.extend(text for _, _, text in group)
+        else:
+            cover = next((text for gs, ge, text in group if (gs, ge) == (s, e)), None)
+            out.append(cover or fmt_span(s, e))
+
+    for s, e, text in parsed:
+        if group and s < group_end:
+            group.append((s, e, text))
+            group_end = max(group_end, e)
+        else:
+            _flush()
+            group, group_end = [(s, e, text)], e
+    _flush()
+    return out
+
+def find_overlaps(intervals: Iterable[tuple[int, int, Hashable]]) -> list[Overlap]:
+    """
+    Every pair of intervals with different keys that overlap.
+
+    Sweep by start time with a min-heap of active ends: O(n log n + k) for
+    k reported pairs.
+
+    Args:
+        intervals: (start, end, key) triples; pairs sharing a key are ignored.
+
+    Returns:
+        list[Overlap]: (overlap start, overlap end, earlier key, later key).
+    """
+    found = []
+    active: list[tuple[int, int, Hashable]] = []
+    ordered = sorted(intervals, key=lambda t: (t[0], t[1]))
+    for i, (s, e, key) in enumerate(ordered):
+        while active and active[0][0] <= s:
+            heapq.heappop(active)
+        for a_end, _, a_key in active:
+            if a_key != key:
+                found.append(Overlap(s, min(a_end, e), a_key, key))
+        heapq.heappush(active, (e, i, key))
+    return found
+
+def day_intervals(day_iso: str, node: dict) -> list[tuple[int, int, SessionRef]]:
+    """A day's spans as absolute-minute intervals keyed by their session."""
+    base = date.fromisoformat(str(day_iso)).toordinal() * DAY_MIN
+    out = []
+    for i, sess in enumerate((node or {}).get("sessions") or []):
+        ref = SessionRef(str(day_iso), i, sess.get("task", ""), tuple(sess.get("tags") or ()))
+        for span in sess.get("spans") or []:
+            iv = parse_span(span)
+            if iv is not None:
+                out.append((base + iv[0], base + iv[1], ref))
+    return out
+
+@log_call()
+def scan(days: dict) -> OverlapReport:
+    """
+    Cross-session overlaps and logged vs unique minutes over many days.
+
+    Args:
+        days (dict): Day nodes keyed by ISO day (e.g. `Repository.load_range`).
+
+    Returns:
+        OverlapReport: overlaps, total logged minutes, unique minutes.
+    """
+    intervals = []
+    for day, node in days.items():
+        try:
+            intervals.extend(day_intervals(day, node))
+        except ValueError as e:
+            log.warning("[scan] Skipping day %r: %s", day, e)
+    logged = sum(e - s for s, e, _ in intervals)
+    unique = unique_minutes((s, e) for s, e, _ in intervals)
+    return OverlapReport(find_overlaps(intervals), logged, unique)
+
+def abs_to_day(minute: int) -> tuple[str, str]:
+    """Absolute minute → (ISO day, "HH:MM")."""
+    return date.fromordinal(minute // DAY_MIN).isoformat(), fmt_hm(minute)
+
+__all__ = [
+    "Overlap", "OverlapReport", "SessionRef", "abs_to_day", "day_intervals", "day_total", "find_overlaps",
+    "fmt_span", "merge_intervals", "merge_spans", "scan", "unique_minutes",
+]
@@ -1,13 +1,108 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
+from datetime import datetime, timezone
+from pathlib import Path
 
 from rich.logging import RichHandler
 
+_LISTENER: logging.handlers.QueueListener | None = None
 
-def init(level="WARNING"):
-    logging.basicConfig(
-        level=level,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[RichHandler(rich_tracebacks=True, show_time=level=="DEBUG")],
-    )
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Render the message on the caller's thread (so mutable arguments are
+    captured as they are now), then enqueue; formatting, the JSON sink and
+    rich rendering happen on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+class JsonLineFormatter(logging.Formatter):
+    """One JSON object per record, for the rotating diagnostics sink."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "func": record.funcName,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+def _stop_listener() -> None:
+    global _LISTENER
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _LISTENER = None
+
+atexit.register(_stop_listener)
+
+def init(level="WARNING", *, use_queue: bool = False, json_file=None,
+         json_level="DEBUG", max_bytes: int = 5 * 1024 * 1024, backups: int = 3):
+    """
+    Configure the root logger for plog.
+
+    By default this is a plain synchronous `RichHandler`. With `use_queue`
+    (implied by `json_file`) the root logger only gets a `QueueHandler`;
+    a `QueueListener` thread formats records and feeds the rich console
+    plus, optionally, a rotating JSON-lines file that may be more verbose
+    than the console.
+
+    Args:
+        level (str): Console log level.
+        use_queue (bool): Render on a background thread.
+        json_file (str | Path | None): Path of the JSON-lines sink.
+        json_level (str): Level for the JSON sink.
+        max_bytes (int): Rotate the JSON sink at this size.
+        backups (int): Rotated JSON files to keep.
+
+    Returns:
+        logging.Logger: The "plog" logger.
+    """
+    global _LISTENER
+    console = RichHandler(rich_tracebacks=True, show_time=level=="DEBUG")
+
+    if not (use_queue or json_file):
+        logging.basicConfig(
+            level=level,
+            format="%(message)s",
+            datefmt="[%X]",
+            handlers=[console],
+        )
+        return logging.getLogger("plog")
+
+    console.setLevel(level)
+    console.setFormatter(logging.Formatter("%(message)s", datefmt="[%X]"))
+    sinks = [console]
+    root_level = logging.getLevelName(level) if isinstance(level, str) else level
+
+    if json_file:
+        Path(json_file).parent.mkdir(parents=True, exist_ok=True)
+        fh = logging.handlers.RotatingFileHandler(
+            json_file, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+        )
+        fh.setLevel(json_level)
+        fh.setFormatter(JsonLineFormatter())
+        sinks.append(fh)
+        file_level = logging.getLevelName(json_level) if isinstance(json_level, str) else json_level
+        root_level = min(root_level, file_level)
+
+    _stop_listener()
+    q = queue.SimpleQueue()
+    _LISTENER = logging.handlers.QueueListener(q, *sinks, respect_handler_level=True)
+    _LISTENER.start()
+
+    logging.basicConfig(level=root_level, handlers=[DeferredQueueHandler(q)], force=True)
     return logging.getLogger("plog")
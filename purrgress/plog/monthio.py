@@ -0,0 +1,226 @@
+"""
+Fast reader / writer for month files.
+
+Month files always have the shape
+    day -> {wake?, sleep?, sessions: [{task, tags, moods, spans}]}
+so both directions can be done line by line instead of through PyYAML's
+event pipeline. Scalar quoting reuses PyYAML's own resolver and scalar
+analysis, which keeps `dump_month` byte-identical to `dump_no_wrap` and
+makes `load_month_text` return exactly what `yaml.safe_load` would.
+
+Anything outside that shape (flow collections, comments, multi-line or
+double-quoted scalars, non-string values, ...) falls back to PyYAML.
+"""
+import io
+import re
+from functools import lru_cache
+from logging import getLogger
+
+import yaml
+from yaml.emitter import Emitter
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
+
+from purrgress.utils.yaml_tools import dump_no_wrap
+
+log = getLogger("plog")
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_ANALYZER = Emitter(io.StringIO(), allow_unicode=True)
+_RESOLVER = Resolver()
+_QUOTED_RE = re.compile(r"'((?:[^']|'')*)'")
+# PyYAML only writes `key:` (not `? key`) when tag "!!str" + key < 128 chars
+_MAX_KEY = 128 - len("!!str")
+
+class _Unsupported(Exception):
+    """Input is outside the month-file shape; use PyYAML instead."""
+
+@lru_cache(maxsize=8192)
+def _style(value: str) -> str:
+    """
+    Mirror of `Emitter.choose_scalar_style` for an implicit str scalar in
+    block context: "plain", "single", or "other" (double-quoted / multi-line).
+    """
+    analysis = _ANALYZER.analyze_scalar(value)
+    if analysis.multiline:
+        return "other"
+    implicit = _RESOLVER.resolve(ScalarNode, value, (True, False)) == _STR_TAG
+    if implicit and analysis.allow_block_plain and not analysis.empty:
+        return "plain"
+    if analysis.allow_single_quoted:
+        return "single"
+    return "other"
+
+def _scalar(value) -> str:
+    if not isinstance(value, str):
+        raise _Unsupported(type(value).__name__)
+    style = _style(value)
+    if style == "plain":
+        return value
+    if style == "single":
+        return "'" + value.replace("'", "''") + "'"
+    raise _Unsupported(value)
+
+def _key(value) -> str:
+    if not isinstance(value, str) or not value or len(value) >= _MAX_KEY:
+        raise _Unsupported(value)
+    return _scalar(value)
+
+def _emit(data: dict, out: list[str]) -> None:
+    seen: set[int] = set()
+
+    def _fresh(obj):
+        # PyYAML would emit an &anchor / *alias for a shared container
+        if id(obj) in seen:
+            raise _Unsupported("alias")
+        seen.add(id(obj))
+        return obj
+
+    if not isinstance(data, dict) or not data:
+        raise _Unsupported("top level")
+    for day, node in _fresh(data).items():
+        if not isinstance(node, dict) or not node:
+            raise _Unsupported(day)
+        out.append(f"{_key(day)}:\n")
+        for key, value in _fresh(node).items():
+            if not isinstance(value, list):
+                out.append(f"  {_key(key)}: {_scalar(value)}\n")
+                continue
+            if not _fresh(value):
+                out.append(f"  {_key(key)}: []\n")
+                continue
+            out.append(f"  {_key(key)}:\n")
+            for sess in value:
+                if not isinstance(sess, dict) or not sess:
+                    raise _Unsupported(key)
+                lead = "  - "
+                for skey, svalue in _fresh(sess).items():
+                    if not isinstance(svalue, list):
+                        out.append(f"{lead}{_key(skey)}: {_scalar(svalue)}\n")
+                    elif not _fresh(svalue):
+                        out.append(f"{lead}{_key(skey)}: []\n")
+                    else:
+                        out.append(f"{lead}{_key(skey)}:\n")
+                        out.extend(f"    - {_scalar(item)}\n" for item in svalue)
+                    lead = "    "
+
+def dump_month(data: dict) -> str:
+    """
+    Serialise a month dict exactly like `dump_no_wrap(data)`.
+
+    Args:
+        data (dict): Month data (normally already `tidy_month`-ed).
+
+    Returns:
+        str: YAML text.
+    """
+    out: list[str] = []
+    try:
+        _emit(data, out)
+    except _Unsupported as e:
+        log.debug("[dump_month] Falling back to PyYAML (%s)", e)
+        return dump_no_wrap(data)
+    return "".join(out)
+
+def _read_scalar(token: str, *, key: bool = False):
+    quoted = _QUOTED_RE.fullmatch(token)
+    if quoted:
+        value = quoted.group(1).replace("''", "'")
+        # NEL / LS / PS and friends are line breaks to YAML
+        if (key and not value) or _style(value) == "other":
+            raise _Unsupported(token)
+        return value
+    if token and _style(token) == "plain":
+        return token
+    raise _Unsupported(token)
+
+def _split_pair(text: str) -> tuple[str, str | None]:
+    """`key: value` → (key, value token); `key:` → (key, None)."""
+    if text.startswith("'"):
+        m = re.match(r"'(?:[^']|'')*'", text)
+        if not m:
+            raise _Unsupported(text)
+        end = m.end()
+    else:
+        idx = text.find(": ")
+        end = idx if idx >= 0 else len(text) - 1
+    key, rest = text[:end], text[end:]
+    if rest == ":":
+        return _read_scalar(key, key=True), None
+    if rest.startswith(": ") and len(rest) > 2:
+        return _read_scalar(key, key=True), rest[2:]
+    raise _Unsupported(text)
+
+def _read_value(token: str):
+    return [] if token == "[]" else _read_scalar(token)
+
+def _parse(text: str) -> dict:
+    if not text.endswith("\n"):
+        raise _Unsupported("no trailing newline")
+    data: dict = {}
+    node = items = sess = slist = None
+    opened: list[list] = []
+
+    for line in text[:-1].split("\n"):
+        if line.startswith("    - "):
+            if slist is None:
+                raise _Unsupported(line)
+            slist.append(_read_scalar(line[6:]))
+        elif line.startswith("  - "):
+            if items is None:
+                raise _Unsupported(line)
+            sess = {}
+            items.append(sess)
+            slist = _set(sess, line[4:], opened)
+        elif line.startswith("    "):
+            if sess is None or line[4] == " ":
+                raise _Unsupported(line)
+            slist = _set(sess, line[4:], opened)
+        elif line.startswith("  "):
+            if node is None or line[2] == " ":
+                raise _Unsupported(line)
+            items = _set(node, line[2:], opened)
+            sess = slist = None
+        elif line and not line.startswith((" ", "#")):
+            day, value = _split_pair(line)
+            if value is not None:
+                raise _Unsupported(line)
+            node = data[day] = {}
+            items = sess = slist = None
+        else:
+            raise _Unsupported(line)
+
+    # `key:` with nothing under it is null in YAML, not an empty collection
+    if not data or any(not n for n in data.values()) or any(not o for o in opened):
+        raise _Unsupported("empty block")
+    return data
+
+def _set(mapping: dict, text: str, opened: list) -> list | None:
+    """Store one `key: value` line; returns the new block list for `key:`."""
+    key, token = _split_pair(text)
+    if token is None:
+        mapping[key] = block = []
+        opened.append(block)
+        return block
+    mapping[key] = _read_value(token)
+    return None
+
+def load_month_text(text: str) -> dict:
+    """
+    Parse month-file text; same result as `yaml.safe_load(text) or {}`.
+
+    Args:
+        text (str): File contents.
+
+    Returns:
+        dict: Month data keyed by ISO day.
+    """
+    if not text:
+        return {}
+    try:
+        return _parse(text)
+    except _Unsupported as e:
+        log.debug("[load_month_text] Falling back to PyYAML (%s)", e)
+        return yaml.safe_load(text) or {}
+
+__all__ = ["dump_month", "load_month_text"]
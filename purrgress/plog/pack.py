@@ -0,0 +1,241 @@
+"""
+Per-year bundles for cold month files (`plog pack` / `plog unpack`).
+
+`<root>/<year>.plogpack` holds that year's month files, each compressed on
+its own so reading one month decompresses only that month:
+
+    b"PLPACK1\\0" | codec (8 bytes, NUL padded) | index length (u4)
+    | index JSON {"MM": [offset, length, size, sha256, mtime_ns]}
+    | compressed month blobs
+
+`size` and `mtime_ns` are the original file's, so `YamlRepository`'s change
+markers (and every index keyed on them) survive a pack/unpack round trip,
+and `unpack` restores byte-identical files. A loose `<year>/<MM>.yaml`
+always wins over a packed copy: writing to a packed month just creates the
+loose file again, and the next `pack` folds it back in.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import lzma
+import os
+import struct
+from functools import lru_cache
+from logging import getLogger
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from purrgress.utils import log_call, profiling
+from purrgress.utils.load import write_atomic
+
+log = getLogger("plog")
+
+MAGIC = b"PLPACK1\0"
+_HEADER = struct.Struct("<8s8sI")
+SUFFIX = ".plogpack"
+
+class Entry(NamedTuple):
+    offset: int
+    length: int
+    size: int
+    sha: str
+    mtime_ns: int
+
+class Bundle(NamedTuple):
+    path: Path
+    codec: str
+    entries: dict        # month (int) → Entry
+
+class PackResult(NamedTuple):
+    year: int
+    months: list
+    raw_bytes: int
+    packed_bytes: int
+
+@lru_cache(maxsize=None)
+def _codecs() -> dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]]:
+    codecs = {
+        "gzip": (lambda b: gzip.compress(b, compresslevel=9, mtime=0), gzip.decompress),
+        "lzma": (lambda b: lzma.compress(b, preset=9), lzma.decompress),
+    }
+    try:
+        import zstandard
+    except ImportError:
+        pass
+    else:
+        codecs["zstd"] = (zstandard.ZstdCompressor(level=19).compress,
+                          zstandard.ZstdDecompressor().decompress)
+    return codecs
+
+CODECS = tuple(_codecs())
+DEFAULT_CODEC = "zstd" if "zstd" in CODECS else "lzma"
+
+def bundle_path(root: Path, year: int) -> Path:
+    return Path(root) / f"{year:04}{SUFFIX}"
+
+_INDEX_CACHE: dict[Path, tuple[tuple[int, int], Bundle]] = {}
+
+def read_bundle(path: Path) -> Bundle | None:
+    """Header + month index of a bundle (cached on mtime/size); None if missing."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _INDEX_CACHE.get(path)
+    if hit and hit[0] == key:
+        return hit[1]
+    with path.open("rb") as f:
+        magic, codec, ilen = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a plog bundle")
+        index = json.loads(f.read(ilen))
+    base = _HEADER.size + ilen
+    entries = {int(m): Entry(base + e[0], *e[1:]) for m, e in index.items()}
+    bundle = Bundle(path, codec.rstrip(b"\0").decode(), entries)
+    _INDEX_CACHE[path] = (key, bundle)
+    return bundle
+
+def bundles(root: Path) -> dict[int, Bundle]:
+    """Every bundle under `root`, by year."""
+    found = {}
+    for path in Path(root).glob(f"[0-9][0-9][0-9][0-9]{SUFFIX}"):
+        bundle = read_bundle(path)
+        if bundle is not None:
+            found[int(path.name[:4])] = bundle
+    return found
+
+def read_month(bundle: Bundle, month: int) -> bytes:
+    """Decompress one month's original file bytes."""
+    entry = bundle.entries[month]
+    try:
+        decompress = _codecs()[bundle.codec][1]
+    except KeyError:
+        raise RuntimeError(f"{bundle.path}: codec {bundle.codec!r} unavailable (pip install zstandard?)")
+    with profiling.phase("unpack"), bundle.path.open("rb") as f:
+        f.seek(entry.offset)
+        raw = decompress(f.read(entry.length))
+    if len(raw) != entry.size or hashlib.sha256(raw).hexdigest() != entry.sha:
+        raise ValueError(f"{bundle.path}: month {month:02} is corrupt")
+    return raw
+
+def write_bundle(path: Path, codec: str, months: dict[int, tuple[bytes, int]]) -> int:
+    """
+    Write a bundle atomically from month → (file bytes, mtime_ns).
+
+    Returns:
+        int: Bundle size in bytes.
+    """
+    compress = _codecs()[codec][0]
+    index, blobs, offset = {}, [], 0
+    for month, (raw, mtime_ns) in sorted(months.items()):
+        blob = compress(raw)
+        index[f"{month:02}"] = [offset, len(blob), len(raw), hashlib.sha256(raw).hexdigest(), mtime_ns]
+        blobs.append(blob)
+        offset += len(blob)
+    ijson = json.dumps(index, sort_keys=True, separators=(",", ":")).encode()
+    data = _HEADER.pack(MAGIC, codec.encode().ljust(8, b"\0"), len(ijson)) + ijson + b"".join(blobs)
+    write_atomic(path, data)
+    return len(data)
+
+def _loose(root: Path, year: int) -> dict[int, Path]:
+    return {int(p.stem): p for p in (Path(root) / f"{year:04}").glob("[0-9][0-9].yaml")}
+
+@log_call(logging.INFO)
+def pack(root: Path, before: int, codec: str = DEFAULT_CODEC) -> list[PackResult]:
+    """
+    Fold the loose month files of every year before `before` into bundles.
+
+    Existing bundles are merged (loose files replace their packed months).
+    Loose files are removed only after the new bundle has been written and
+    read back.
+
+    Args:
+        root (Path): Data root.
+        before (int): First year to leave loose.
+        codec (str): One of `CODECS`.
+
+    Returns:
+        list[PackResult]: One per year that had loose files.
+    """
+    if codec not in CODECS:
+        raise ValueError(f"codec must be one of {CODECS}, got {codec!r}")
+    years = sorted({int(p.name) for p in Path(root).glob("[0-9][0-9][0-9][0-9]")
+                    if p.is_dir() and int(p.name) < before})
+    results = []
+    for year in years:
+        loose = _loose(root, year)
+        if not loose:
+            continue
+        path = bundle_path(root, year)
+        months: dict[int, tuple[bytes, int]] = {}
+        old = read_bundle(path)
+        if old is not None:
+            for m, e in old.entries.items():
+                months[m] = (read_month(old, m), e.mtime_ns)
+        for m, p in loose.items():
+            months[m] = (p.read_bytes(), p.stat().st_mtime_ns)
+
+        try:
+            size = write_bundle(path, codec, months)
+            check = read_bundle(path)
+            for m in loose:
+                if read_month(check, m) != months[m][0]:
+                    raise ValueError(f"{path}: month {m:02} did not round-trip")
+        except Exception as e:
+            log.error("[pack] Failed to pack %d: %s", year, e)
+            raise
+
+        for p in loose.values():
+            p.unlink()
+        try:
+            (Path(root) / f"{year:04}").rmdir()
+        except OSError:
+            pass
+        results.append(PackResult(year, sorted(loose), sum(len(r) for r, _ in months.values()), size))
+    return results
+
+@log_call(logging.INFO)
+def unpack(root: Path, years: list[int] | None = None) -> list[PackResult]:
+    """
+    Restore bundled months to loose files (original bytes and mtimes) and
+    delete the bundles. A month that already has a loose file keeps it.
+
+    Args:
+        root (Path): Data root.
+        years (list[int] | None): Years to unpack (default: all bundles).
+
+    Returns:
+        list[PackResult]: One per bundle unpacked.
+    """
+    results = []
+    for year, bundle in sorted(bundles(root).items()):
+        if years is not None and year not in years:
+            continue
+        restored = []
+        raw_bytes = 0
+        try:
+            for m, entry in sorted(bundle.entries.items()):
+                target = Path(root) / f"{year:04}/{m:02}.yaml"
+                if target.exists():
+                    log.warning("[unpack] %s exists; keeping it over the packed copy", target)
+                    continue
+                raw = read_month(bundle, m)
+                write_atomic(target, raw)
+                os.utime(target, ns=(entry.mtime_ns, entry.mtime_ns))
+                restored.append(m)
+                raw_bytes += len(raw)
+        except Exception as e:
+            log.error("[unpack] Failed to unpack %s: %s", bundle.path, e)
+            raise
+        size = bundle.path.stat().st_size
+        bundle.path.unlink()
+        _INDEX_CACHE.pop(bundle.path, None)
+        results.append(PackResult(year, restored, raw_bytes, size))
+    return results
+
+__all__ = [
+    "Bundle", "CODECS", "DEFAULT_CODEC", "Entry", "PackResult", "bundle_path", "bundles",
+    "pack", "read_bundle", "read_month", "unpack", "write_bundle",
+]
@@ -0,0 +1,213 @@
+"""
+Tag / mood picking for `plog start` with large, hierarchical taxonomies.
+
+`NameIndex` precomputes a prefix map (whole name and every dotted
+segment: "net" finds `learn.netsec`) and a trigram map (typos and
+infixes: "netsce" still finds it), so a search touches only candidate
+names instead of scanning hundreds of config keys per keystroke.
+
+Results are ranked by match quality, then by recent usage: tags and moods
+from the last `WINDOW_DAYS` of sessions, weighted with a `HALF_LIFE`-day
+decay. The usage counts and the previous session's tags/moods (for
+`plog start --last`) are cached in the data directory, keyed on the day
+and the change markers of the months they were counted from - like the
+board summary, the log is only re-read after it changed.
+"""
+from __future__ import annotations
+
+import re
+from datetime import date, timedelta
+from functools import lru_cache
+from logging import getLogger
+from typing import Iterable, NamedTuple
+
+from purrgress.plog import storage
+from purrgress.utils import log_call
+from purrgress.utils.date import month_keys, today_iso
+from purrgress.utils.manifest import load_manifest, save_manifest
+
+log = getLogger("plog")
+
+PICKER_CACHE = ".picker-usage.json"
+WINDOW_DAYS = 90
+HALF_LIFE = 30
+
+_SEGMENT = re.compile(r"[._\-/ ]+")
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class Usage(NamedTuple):
+    tags: dict           # tag → decayed use count
+    moods: dict          # mood → decayed use count
+    last: dict | None    # {"task", "tags", "moods"} of the newest session
+
+class NameIndex:
+    """
+    Prefix + trigram index over a fixed list of names.
+
+    Args:
+        names (Iterable[str]): Tag or mood names (e.g. config keys).
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names = list(dict.fromkeys(str(n) for n in names))
+        self._lower = [n.lower() for n in self.names]
+        self._prefix: dict[str, set[int]] = {}
+        self._segment: dict[str, set[int]] = {}
+        self._tri: dict[str, set[int]] = {}
+        for i, name in enumerate(self._lower):
+            for end in range(1, len(name) + 1):
+                self._prefix.setdefault(name[:end], set()).add(i)
+            for seg in _SEGMENT.split(name)[1:]:
+                for end in range(1, len(seg) + 1):
+                    self._segment.setdefault(seg[:end], set()).add(i)
+            for tri in _trigrams(name):
+                self._tri.setdefault(tri, set()).add(i)
+
+    def search(self, query: str, usage: dict | None = None, limit: int | None = None) -> list[str]:
+        """
+        Names matching `query`, best first.
+
+        Args:
+            query (str): What the user typed; empty lists everything.
+            usage (dict | None): name → usage weight, the tie-breaker.
+            limit (int | None): Max results.
+
+        Returns:
+            list[str]: Matching names.
+        """
+        usage = usage or {}
+        q = query.strip().lower()
+        top = max(usage.values(), default=0) or 1
+        scores: dict[int, float] = {}
+        if not q:
+            scores = dict.fromkeys(range(len(self.names)), 0.0)
+        else:
+            for i in self._prefix.get(q, ()):
+                scores[i] = 3.0 if self._lower[i] == q else 2.0
+            for i in self._segment.get(q, ()):
+                scores.setdefault(i, 1.5)
+            if len(q) >= 3:
+                # unpadded, so an infix ("netsec" in "learn.netsec") isn't penalised
+                grams = {q[i:i + 3] for i in range(len(q) - 2)}
+                hits: dict[int, int] = {}
+                for tri in grams:
+                    for i in self._tri.get(tri, ()):
+                        hits[i] = hits.get(i, 0) + 1
+                for i, n in hits.items():
+                    ratio = n / len(grams)
+                    if ratio >= 0.5:
+                        scores.setdefault(i, ratio)
+        ranked = sorted(scores, key=lambda i: (-(scores[i] + 0.5 * usage.get(self.names[i], 0) / top),
+                                               self.names[i]))
+        return [self.names[i] for i in ranked[:limit]]
+
+@lru_cache(maxsize=8)
+def name_index(names: tuple[str, ...]) -> NameIndex:
+    """`NameIndex` for a config section, built once per process."""
+    return NameIndex(names)
+
+def count_usage(days: dict, today: date) -> Usage:
+    """
+    Decayed tag/mood counts and the newest session from day nodes.
+
+    Args:
+        days (dict): ISO day → day node (any order).
+        today (date): Reference day for the decay.
+    """
+    tags: dict[str, float] = {}
+    moods: dict[str, float] = {}
+    last = None
+    for day in sorted(days):
+        sessions = (days[day] or {}).get("sessions") or []
+        if not sessions:
+            continue
+        weight = 0.5 ** (max((today - date.fromisoformat(day)).days, 0) / HALF_LIFE)
+        for sess in sessions:
+            for tag in sess.get("tags") or []:
+                tags[tag] = tags.get(tag, 0) + weight
+            for mood in sess.get("moods") or []:
+                moods[mood] = moods.get(mood, 0) + weight
+        # tidied days keep sessions ordered by first span
+        newest = sessions[-1]
+        last = {"task": newest.get("task", ""), "tags": list(newest.get("tags") or []),
+                "moods": list(newest.get("moods") or [])}
+    return Usage({k: round(v, 4) for k, v in tags.items()},
+                 {k: round(v, 4) for k, v in moods.items()}, last)
+
+@log_call()
+def recent_usage(today: date | None = None, repo: storage.Repository | None = None) -> Usage:
+    """
+    `count_usage` over the last `WINDOW_DAYS` up to `today` (default: today
+    in the plog timezone, like the session dates), served from the cache
+    while those months are unchanged.
+    """
+    today = today or date.fromisoformat(today_iso())
+    repo = repo or storage.get_repository()
+    start = today - timedelta(days=WINDOW_DAYS - 1)
+
+    all_stamps = repo.month_stamps()
+    key = {"day": today.isoformat(), "backend": repo.name,
+           "stamps": {k: all_stamps.get(k) for k in month_keys(start, today)}}
+    cache_file = repo.data_dir / PICKER_CACHE
+    cached = load_manifest(cache_file)
+    if cached.get("key") == key and isinstance(cached.get("usage"), dict):
+        return Usage(**cached["usage"])
+
+    usage = count_usage(repo.load_range(start.isoformat(), today.isoformat()), today)
+    try:
+        save_manifest(cache_file, {"key": key, "usage": usage._asdict()})
+    except OSError as e:
+        log.warning("[recent_usage] Could not write %s: %s", cache_file, e)
+    return usage
+
+def pick_many(kind: str, names: Iterable[str], usage: dict | None = None,
+              limit: int = 12) -> list[str]:
+    """
+    Interactive multi-pick: type to filter (prefix / fuzzy), Tab or arrows
+    to complete, Enter to add, empty Enter to finish. Only the top `limit`
+    matches are rendered at a time.
+
+    Args:
+        kind (str): "tag" or "mood", for the prompt.
+        names (Iterable[str]): Allowed names.
+        usage (dict | None): name → usage weight for ranking.
+        limit (int): Completions shown per keystroke.
+
+    Returns:
+        list[str]: Picked names, in pick order.
+    """
+    import questionary
+    from prompt_toolkit.completion import Completer, Completion
+    from prompt_toolkit.shortcuts import CompleteStyle
+
+    index = name_index(tuple(names))
+    picked: list[str] = []
+
+    class _Fuzzy(Completer):
+        def get_completions(self, document, complete_event):
+            text = document.text_before_cursor
+            for name in index.search(text, usage, limit + len(picked)):
+                if name not in picked:
+                    yield Completion(name, start_position=-len(text))
+
+    while True:
+        suffix = f" [{', '.join(picked)}]" if picked else ""
+        answer = questionary.autocomplete(
+            f"Add {kind}{suffix} (Tab = complete, empty Enter = done)",
+            choices=[], completer=_Fuzzy(), complete_style=CompleteStyle.MULTI_COLUMN,
+        ).unsafe_ask().strip()
+        if not answer:
+            return picked
+        match = answer if answer in index.names else next(iter(index.search(answer, usage, 1)), None)
+        if match is None:
+            questionary.print(f"  no {kind} matches {answer!r}", style="fg:yellow")
+        elif match not in picked:
+            picked.append(match)
+
+__all__ = [
+    "HALF_LIFE", "NameIndex", "PICKER_CACHE", "Usage", "WINDOW_DAYS", "count_usage",
+    "name_index", "pick_many", "recent_usage",
+]
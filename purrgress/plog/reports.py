@@ -1,17 +1,21 @@
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from logging import getLogger
 from pathlib import Path
 
+import matplotlib
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import yaml
 from rich import print
 
+from purrgress.plog import core
 from purrgress.plog.cleanup import tidy_month
-from purrgress.utils import log_call
+from purrgress.plog.grid import hour_day_grid, month_grid
+from purrgress.utils import log_call, profiling
 from purrgress.utils.date import minutes_between, now, today_iso
 from purrgress.utils.path import resolve_pathish
+from purrgress.utils.png import write_png
 
 log = getLogger("plog")
 
@@ -28,19 +32,20 @@ def _month_yaml(year: int, month: int) -> dict:
     Returns:
         dict: Tidied month file 
     """
-    src = resolve_pathish(f"purrgress/data/{year}/{month:02}.yaml")
+    repo = core._repo()
     try:
-        if not src.exists():
+        if not repo.has_month(year, month):
             raise FileNotFoundError(f"No data for {year}-{month:02}")
-        data = yaml.safe_load(src.read_text()) or {}
+        data = repo.load_month(year, month)
     except FileNotFoundError as e:
         log.error("No data for %d-%02d: %s", year, month, e)
         raise
     except Exception as e:
-        log.error("Failed to load data file %s: %s", src, e)
+        log.error("Failed to load data for %s: %s", repo.location(year, month), e)
         raise
 
-    return tidy_month(data)
+    with profiling.phase("tidy"):
+        return tidy_month(data)
 
 @log_call()
 def _empty_df(year: int, month: int) -> pd.DataFrame:
@@ -76,7 +81,9 @@ def _fill_df(df: pd.DataFrame, month_data: dict) -> pd.DataFrame:
     Populate an hourly DataFrame with minute-level session data.
 
     For each session in each day's data, every minute between
-    span start and end is counted into the appropriate [hour, day] cell.
+    span start and end is counted into the appropriate [hour, day] cell
+    (computed by `grid.hour_day_grid`, shared with `plog heatmap --term`).
+    Minutes covered by overlapping sessions are counted once.
 
     - Handles multiple sessions and spans per day.
     - Spans that cross midnight are split across days/hours.
@@ -93,46 +100,14 @@ def _fill_df(df: pd.DataFrame, month_data: dict) -> pd.DataFrame:
         After calling _fill_df, df[hour][day] contains the number of minutes
         logged at that hour on that day.
     """
-    for day_iso, node in month_data.items():
-        day_num = int(day_iso.split("-")[2])
-        day_col = df.columns.get_loc(day_num)
-
-        for sess in node.get("sessions", []):
-            for span in (sess.get("spans") or []):
-                if not span or "-" not in span or ":" not in span:
-                    continue
-
-                try:
-                    start_str, end_str = span.split("-")
-                except ValueError:
-                    continue
-
-                if not start_str or not end_str or ":" not in start_str or ":" not in end_str:
-                    continue
-
-                try:
-                    sdt = datetime.strptime(start_str, "%H:%M")
-                    edt = datetime.strptime(end_str,   "%H:%M")
-                except ValueError:
-                    continue
-
-                if edt < sdt:
-                    edt += timedelta(days=1)
-
-                cur = sdt
-                while cur < edt:
-                    hour = cur.hour
-                    day_offset = (cur.date() - sdt.date()).days
-                    col_day    = day_num + day_offset
-                    if col_day in df.columns:
-                        df.iat[hour, df.columns.get_loc(col_day)] += 1
-                    cur += timedelta(minutes=1)
-
+    grid = hour_day_grid(month_data, len(df.columns))
+    df.iloc[:, :] = df.to_numpy() + grid
     return df
 
 # ────────────────────────────────────────────────────────────
 @log_call(logging.INFO)
-def make_heatmap(year: int, month: int, *, theme: str = "viridis", dark: bool = False, tz: str | None = None) -> Path:
+def make_heatmap(year: int, month: int, *, theme: str = "viridis", dark: bool = False, tz: str | None = None,
+                 out_dir: Path | None = None) -> Path:
     """
     Generate and save an hour-by-day study heatmap as a PNG.
 
@@ -147,6 +122,8 @@ def make_heatmap(year: int, month: int, *, theme: str = "viridis", dark: bool =
         theme (str, optional): Heatmap color theme. Default is 'viridis'.
         dark (bool, optional): Use dark mode. Default is False.
         tz (str | None, optional): Timezone name (future use). Default is None.
+        out_dir (Path | None, optional): Output directory. Default is
+            'purrgress/visuals/<year>'.
 
     Returns:
         Path: Filesystem path to the generated PNG file.
@@ -160,13 +137,14 @@ def make_heatmap(year: int, month: int, *, theme: str = "viridis", dark: bool =
     """
     try:
         data = _month_yaml(year, month)
-        df   = _fill_df(_empty_df(year, month), data)
+        with profiling.phase("fill"):
+            df = _fill_df(_empty_df(year, month), data)
     except Exception as e:
         log.error("[make_heatmap] Failed to load/fill month data: %s", e)
         raise
 
     try:
-        out_dir = resolve_pathish(f"purrgress/visuals/{year}")
+        out_dir = Path(out_dir) if out_dir else resolve_pathish(f"purrgress/visuals/{year}")
         out_dir.mkdir(parents=True, exist_ok=True)
         suffix  = "dark" if dark else "light"
         out_png = out_dir / f"{month:02}_heatmap_{theme}_{suffix}.png"
@@ -175,36 +153,206 @@ def make_heatmap(year: int, month: int, *, theme: str = "viridis", dark: bool =
         raise
 
     try:
-        fig, ax = plt.subplots(figsize=(12, 6))
-
-        if dark:
-            bg = "#121212"
-            fig.patch.set_facecolor(bg)
-            ax.set_facecolor(bg)
-            ax.tick_params(colors="white")
-            ax.xaxis.label.set_color("white")
-            ax.yaxis.label.set_color("white")
-            ax.title.set_color("white")
-
-        img = ax.imshow(df, aspect="auto", origin="lower", cmap=theme)
-        ax.set_yticks(range(24))
-        ax.set_yticklabels(range(24))
-        ax.set_xticks(range(len(df.columns)))
-        ax.set_xticklabels(df.columns)
-        ax.set_xlabel("Day")
-        ax.set_ylabel("Hour")
-        ax.set_title(f"Study Heat-map {year}-{month:02}")
-
-        cbar = plt.colorbar(img, label="Minutes studied")
-        if dark:
-            cbar.ax.yaxis.set_tick_params(color="white")
-            plt.setp(cbar.ax.get_yticklabels(), color="white")
-
-        plt.tight_layout()
-        plt.savefig(out_png, dpi=150)
-        plt.close()
+        with profiling.phase("render"):
+            fig, ax = plt.subplots(figsize=(12, 6))
+
+            if dark:
+                bg = "#121212"
+                fig.patch.set_facecolor(bg)
+                ax.set_facecolor(bg)
+                ax.tick_params(colors="white")
+                ax.xaxis.label.set_color("white")
+                ax.yaxis.label.set_color("white")
+                ax.title.set_color("white")
+
+            img = ax.imshow(df, aspect="auto", origin="lower", cmap=theme)
+            ax.set_yticks(range(24))
+            ax.set_yticklabels(range(24))
+            ax.set_xticks(range(len(df.columns)))
+            ax.set_xticklabels(df.columns)
+            ax.set_xlabel("Day")
+            ax.set_ylabel("Hour")
+            ax.set_title(f"Study Heat-map {year}-{month:02}")
+
+            cbar = plt.colorbar(img, label="Minutes studied")
+            if dark:
+                cbar.ax.yaxis.set_tick_params(color="white")
+                plt.setp(cbar.ax.get_yticklabels(), color="white")
+
+            plt.tight_layout()
+            plt.savefig(out_png, dpi=150)
+            plt.close()
+        profiling.add_bytes(written=out_png.stat().st_size)
     except Exception as e:
         log.error("[make_heatmap] Failed during plotting/saving: %s", e)
         raise
 
-    return out_png
\ No newline at end of file
+    return out_png
+
+# ─────────────────── figure-free thumbnails ─────────────────
+@log_call()
+def colormap_lut(theme: str = "viridis", size: int = 256) -> np.ndarray:
+    """
+    Sample a Matplotlib colormap into an RGB lookup table.
+
+    Args:
+        theme (str): Colormap name.
+        size (int): Number of entries.
+
+    Returns:
+        np.ndarray: uint8 array of shape (size, 3).
+    """
+    rgba = matplotlib.colormaps[theme](np.linspace(0.0, 1.0, size))
+    return np.round(rgba[:, :3] * 255).astype(np.uint8)
+
+def grid_to_rgb(grid: np.ndarray, lut: np.ndarray, scale: int = 4) -> np.ndarray:
+    """
+    Map a (hours × days) count grid to an upscaled RGB raster.
+
+    Values are scaled from 0 to the grid's peak, the first row ends up at the bottom (`origin="lower"`) and every cell
+    becomes a `scale` × `scale` block.
+
+    Args:
+        grid (np.ndarray): Minutes per [hour, day].
+        lut (np.ndarray): (N, 3) uint8 table from `colormap_lut`.
+        scale (int): Pixels per cell edge.
+
+    Returns:
+        np.ndarray: uint8 array of shape (rows*scale, cols*scale, 3).
+    """
+    peak = grid.max() if grid.size else 0
+    if peak:
+        idx = (grid * (len(lut) - 1) + peak // 2) // peak
+    else:
+        idx = np.zeros(grid.shape, dtype=np.int64)
+    rgb = lut[idx.astype(np.intp)[::-1]]
+    return np.repeat(np.repeat(rgb, scale, axis=0), scale, axis=1)
+
+@log_call()
+def make_thumbnail(year: int, month: int, *, theme: str = "viridis", scale: int = 4,
+                   out_dir: Path | None = None, lut: np.ndarray | None = None) -> Path | None:
+    """
+    Write an unannotated heat-map thumbnail without creating a figure.
+
+    Same grid as `make_heatmap`, pushed through a colormap lookup table and
+    encoded straight to PNG - no axes, labels or colour bar.
+
+    Args:
+        year (int): Year, e.g. 2025.
+        month (int): Month, 1-12.
+        theme (str, optional): Matplotlib colormap. Default is 'viridis'.
+        scale (int, optional): Pixels per hour/day cell. Default is 4.
+        out_dir (Path | None, optional): Output directory. Default is
+            'purrgress/visuals/<year>/thumbs'.
+        lut (np.ndarray | None, optional): Pre-built table (batch runs).
+
+    Returns:
+        Path | None: The PNG written, or None if the month has no data.
+
+    Example:
+        >>> make_thumbnail(2025, 7, theme="magma")
+        Path('purrgress/visuals/2025/thumbs/07_thumb_magma.png')
+    """
+    with profiling.phase("fill"):
+        grid = month_grid(year, month)
+    if grid is None:
+        return None
+
+    out_dir = Path(out_dir) if out_dir else resolve_pathish(f"purrgress/visuals/{year}/thumbs")
+    out_png = out_dir / f"{month:02}_thumb_{theme}.png"
+    try:
+        with profiling.phase("render"):
+            write_png(out_png, grid_to_rgb(grid, colormap_lut(theme) if lut is None else lut, scale))
+        profiling.add_bytes(written=out_png.stat().st_size)
+    except Exception as e:
+        log.error("[make_thumbnail] Failed to write %s: %s", out_png, e)
+        raise
+    return out_png
+
+@log_call(logging.INFO)
+def make_thumbnails(year: int, months: list[int] | None = None, *, theme: str = "viridis",
+                    scale: int = 4, out_dir: Path | None = None) -> list[Path]:
+    """
+    Batch `make_thumbnail` over a year, sharing one lookup table.
+
+    Args:
+        year (int): Year, e.g. 2025.
+        months (list[int] | None): Months to render (default: every month
+            with a log file).
+        theme (str, optional): Matplotlib colormap.
+        scale (int, optional): Pixels per cell edge.
+        out_dir (Path | None, optional): Output directory.
+
+    Returns:
+        list[Path]: Thumbnails written; months without data are skipped.
+    """
+    if months is None:
+        months = [m for y, m in core._repo().months() if y == year]
+    lut = colormap_lut(theme)
+    written = []
+    for month in months:
+        path = make_thumbnail(year, month, theme=theme, scale=scale, out_dir=out_dir, lut=lut)
+        if path is not None:
+            written.append(path)
+    return written
+
+# ──────────────────── weekly profile ────────────────────────
+@log_call(logging.INFO)
+def make_profile(profiles: dict, start: str, end: str, *, bin_minutes: int = 60,
+                 theme: str = "viridis", dark: bool = False, out_dir: Path | None = None) -> list[Path]:
+    """
+    Save one weekday × time-of-day PNG per profile label.
+
+    Args:
+        profiles (dict): label → (7, bins) matrix from `weekly.week_profile`.
+        start (str): First ISO day of the range (for titles / file names).
+        end (str): Last ISO day of the range.
+        bin_minutes (int, optional): Bin width the matrices were built with.
+        theme (str, optional): Matplotlib colormap. Default is 'viridis'.
+        dark (bool, optional): Dark background. Default is False.
+        out_dir (Path | None, optional): Output directory. Default is
+            'purrgress/visuals/profile'.
+
+    Returns:
+        list[Path]: PNGs written, in label order.
+    """
+    out_dir = Path(out_dir) if out_dir else resolve_pathish("purrgress/visuals/profile")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    per_hour = 60 // bin_minutes
+    written = []
+
+    for label, matrix in profiles.items():
+        safe = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in label)
+        out_png = out_dir / f"profile_{start}_{end}_{safe}_{theme}.png"
+        try:
+            with profiling.phase("render"):
+                fig, ax = plt.subplots(figsize=(12, 3.5))
+                if dark:
+                    bg = "#121212"
+                    fig.patch.set_facecolor(bg)
+                    ax.set_facecolor(bg)
+                    ax.tick_params(colors="white")
+                    ax.title.set_color("white")
+
+                img = ax.imshow(matrix, aspect="auto", cmap=theme)
+                ax.set_yticks(range(7))
+                ax.set_yticklabels(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"])
+                ax.set_xticks([h * per_hour - 0.5 for h in range(0, 24, 2)])
+                ax.set_xticklabels(range(0, 24, 2))
+                ax.set_xlabel("Hour")
+                ax.set_title(f"Weekly profile {start} → {end} ({label}, {bin_minutes}-min bins)")
+
+                cbar = plt.colorbar(img, label="Minutes")
+                if dark:
+                    cbar.ax.yaxis.set_tick_params(color="white")
+                    plt.setp(cbar.ax.get_yticklabels(), color="white")
+
+                plt.tight_layout()
+                plt.savefig(out_png, dpi=150)
+                plt.close()
+            profiling.add_bytes(written=out_png.stat().st_size)
+        except Exception as e:
+            log.error("[make_profile] Failed during plotting/saving %s: %s", out_png, e)
+            raise
+        written.append(out_png)
+    return written
@@ -0,0 +1,322 @@
+"""
+`LogRepository`: the life log as an object, for scripts and dashboards
+that embed plog instead of shelling out to the CLI.
+
+A repository owns its data root, draft file, storage backend and derived
+caches, so several can live side by side:
+
+    >>> from purrgress.plog.repository import LogRepository
+    >>> work = LogRepository("~/work-log/data")
+    >>> with work.batch():
+    ...     for day, span in imported:
+    ...         work.append_span(day, {"task": "import", "spans": [span]})
+    >>> work.minutes_for_month(2025, 7)
+
+Inside `batch()` writes land in memory; on a clean exit every touched
+month is tidied and written once, and the totals index is refreshed once
+per month. If the block raises, nothing is written; a nested block that
+raises discards only its own writes.
+
+`purrgress.plog.core` keeps its module-level functions as thin wrappers
+over `default_repository()`, which follows `core.DATA_ROOT` /
+`core.DRAFT_FILE` and the active backend.
+"""
+import copy
+from contextlib import contextmanager
+from datetime import date, timedelta
+from logging import getLogger
+from pathlib import Path
+from typing import Iterator
+
+import yaml
+
+from purrgress.plog import storage, totals
+from purrgress.plog.intervals import day_total
+from purrgress.utils import log_call
+from purrgress.utils.date import now, parse_span, today_iso
+
+log = getLogger("plog")
+
+DRAFT_NAME = ".draft.yaml"
+
+def _month_of(day_iso: str) -> tuple[int, int]:
+    return int(day_iso[:4]), int(day_iso[5:7])
+
+def day_minutes(node: dict, day_iso: str = "") -> int:
+    """
+    Minutes logged on a day (`intervals.day_total`: overlapping sessions
+    count once); malformed spans are skipped with a warning.
+    """
+    for sess in (node or {}).get("sessions", []):
+        for span in sess.get("spans", []):
+            if parse_span(span) is None:
+                log.warning("[minutes_for_day] Failed to parse span '%s' in %s", span, day_iso)
+    return day_total(node)
+
+class LogRepository:
+    """
+    Sessions, wake/sleep times and aggregates over one data root.
+
+    Args:
+        root (Path | str | None): Data root; None follows `core.DATA_ROOT`.
+        backend (str | None): "yaml" or "sqlite"; None follows
+            `plog --backend` / PLOG_BACKEND.
+        store (storage.Repository | None): Use this backend instance as is.
+    """
+
+    def __init__(self, root: Path | str | None = None, *, backend: str | None = None,
+                 store: storage.Repository | None = None):
+        self._root = Path(root).expanduser() if root is not None else None
+        self._backend = backend
+        self._store = store
+        if store is None and self._root is not None:
+            name = backend or storage.get_repository().name
+            location = self._root if name == "yaml" else self._root / storage.SQLITE_NAME
+            self._store = storage.get_repository(name, location=location)
+        self._pending: dict[tuple[int, int], dict] | None = None
+        self._depth = 0
+        self._totals: tuple[Path, totals.TotalsIndex] | None = None
+
+    def __repr__(self) -> str:
+        return f"LogRepository(root={str(self.root)!r}, backend={self.store.name!r})"
+
+    # ---------- paths / backend ----------
+    @property
+    def root(self) -> Path:
+        from purrgress.plog import core
+        return self._root if self._root is not None else core.DATA_ROOT
+
+    @property
+    def draft_file(self) -> Path:
+        from purrgress.plog import core
+        return self._root / DRAFT_NAME if self._root is not None else core.DRAFT_FILE
+
+    @property
+    def store(self) -> storage.Repository:
+        """The storage backend (re-resolved each time for the default repository)."""
+        return self._store if self._store is not None else storage.get_repository(self._backend)
+
+    # ---------- batching ----------
+    @contextmanager
+    def batch(self) -> Iterator["LogRepository"]:
+        """
+        Buffer writes and flush each touched month once on exit.
+
+        Re-entrant: nested blocks flush with the outermost one; a nested
+        block that raises rolls back only its own writes. Reads inside the
+        block see the buffered writes.
+        """
+        if self._depth == 0:
+            self._pending = {}
+            snapshot = None
+        else:
+            snapshot = copy.deepcopy(self._pending)
+        self._depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._depth == 1:
+                log.warning("[batch] Discarding %d buffered month(s)", len(self._pending or {}))
+                self._pending = None
+            else:
+                log.warning("[batch] Rolling back a nested batch")
+                self._pending = snapshot
+            raise
+        finally:
+            self._depth -= 1
+        if self._depth == 0:
+            pending, self._pending = self._pending or {}, None
+            self._flush(pending)
+
+    def _flush(self, pending: dict[tuple[int, int], dict]) -> None:
+        store = self.store
+        for (year, month), data in sorted(pending.items()):
+            try:
+                store.save_month(year, month, data)
+            except Exception as e:
+                log.error("[batch] Failed to write %d-%02d: %s", year, month, e)
+                raise
+            self._refresh_totals(store, f"{year:04}-{month:02}-01")
+        log.info("[batch] Flushed %d month(s)", len(pending))
+
+    def _buffered(self, year: int, month: int) -> dict:
+        key = (year, month)
+        if key not in self._pending:
+            self._pending[key] = self.store.load_month(year, month)
+        return self._pending[key]
+
+    def _refresh_totals(self, store: storage.Repository, day_iso: str) -> None:
+        self._totals = None
+        try:
+            totals.refresh_month(store, day_iso)
+        except Exception as e:
+            # derived data: the next query recounts the month anyway
+            log.warning("[_refresh_totals] Could not refresh totals index: %s", e)
+
+    # ---------- writes ----------
+    @log_call()
+    def append_span(self, day_iso: str, session: dict) -> None:
+        """Append one session (task/tags/moods/spans) to a day."""
+        session = {"task": session.get("task", ""), "tags": list(session.get("tags") or []),
+                   "moods": list(session.get("moods") or []), "spans": list(session.get("spans") or [])}
+        if self._pending is not None:
+            node = self._buffered(*_month_of(day_iso)).setdefault(day_iso, {"sessions": []})
+            node.setdefault("sessions", []).append(session)
+            return
+        store = self.store
+        store.append_span(day_iso, session)
+        self._refresh_totals(store, day_iso)
+
+    @log_call()
+    def set_key(self, day_iso: str, key: str, value: str) -> None:
+        """Set "wake" or "sleep" on a day, overwriting it."""
+        if self._pending is not None:
+            self._buffered(*_month_of(day_iso)).setdefault(day_iso, {"sessions": []})[key] = value
+            return
+        self.store.set_key(day_iso, key, value)
+
+    def set_wake(self, time_hm: str, *, day_iso: str | None = None, tz: str | None = None) -> None:
+        self.set_key(day_iso or today_iso(tz), "wake", time_hm)
+
+    def set_sleep(self, time_hm: str, *, day_iso: str | None = None, tz: str | None = None) -> None:
+        self.set_key(day_iso or today_iso(tz), "sleep", time_hm)
+
+    @log_call()
+    def store_span(self, draft: dict, *, tz: str | None = None) -> None:
+        """Store a finished draft (task/tags/moods/start/end[/date]) as a session."""
+        self.append_span(draft.get("date") or today_iso(tz), {
+            "task": draft["task"],
+            "tags": draft.get("tags", []),
+            "moods": draft.get("moods", []),
+            "spans": [f'{draft["start"]}-{draft["end"]}'],
+        })
+
+    # ---------- open session ----------
+    def open_draft(self) -> dict | None:
+        """The running session's draft, or None."""
+        if not self.draft_file.exists():
+            return None
+        return yaml.safe_load(self.draft_file.read_text()) or {}
+
+    @log_call()
+    def start_session(self, task: str, tags: list[str], moods: list[str], *,
+                      tz: str | None = None) -> dict:
+        """
+        Start a session by writing the draft file.
+
+        Raises:
+            RuntimeError: If a session is already running.
+        """
+        draft_file = self.draft_file
+        if draft_file.exists():
+            raise RuntimeError("A session is already running. Run `plog stop` to stop it first.")
+        draft = {
+            "date": today_iso(tz),
+            "task": task,
+            "tags": tags,
+            "moods": moods,
+            "start": now(tz).strftime("%H:%M"),
+        }
+        try:
+            draft_file.parent.mkdir(parents=True, exist_ok=True)
+            draft_file.write_text(yaml.dump(draft))
+        except Exception as e:
+            log.error("[start_session] Failed to write draft %s: %s", draft_file, e)
+            raise
+        log.info("[start_session] Draft saved to %s", draft_file)
+        return draft
+
+    @log_call()
+    def stop_session(self, *, tz: str | None = None) -> dict:
+        """
+        Close the running session: store its span and remove the draft.
+
+        Raises:
+            RuntimeError: If no session is open.
+        """
+        draft = self.open_draft()
+        if draft is None:
+            log.error("[stop_session] No open session to stop.")
+            raise RuntimeError("No open session.")
+        draft["end"] = now(tz).strftime("%H:%M")
+        try:
+            self.store_span(draft, tz=tz)
+            self.draft_file.unlink()
+        except Exception as e:
+            log.error("[stop_session] Error storing session or deleting draft: %s", e)
+            raise
+        log.info("[stop_session] Session stored and draft file deleted.")
+        return draft
+
+    # ---------- reads ----------
+    def load_month(self, year: int, month: int) -> dict:
+        if self._pending is not None and (year, month) in self._pending:
+            return self._pending[(year, month)]
+        return self.store.load_month(year, month)
+
+    def load_day(self, day_iso: str) -> dict:
+        if self._pending is not None and _month_of(day_iso) in self._pending:
+            return self._pending[_month_of(day_iso)].get(day_iso, {})
+        return self.store.load_day(day_iso)
+
+    def totals(self) -> totals.TotalsIndex:
+        """
+        Daily-totals index, revalidated against the backend's change markers;
+        kept in memory while they don't move.
+        """
+        store = self.store
+        path = totals.index_path(store)
+        if self._totals is not None and self._totals[0] == path \
+                and self._totals[1].stamps == store.month_stamps():
+            return self._totals[1]
+        idx = totals.load(store)
+        self._totals = (path, idx)
+        return idx
+
+    @log_call()
+    def minutes_for_day(self, day_iso: str) -> int:
+        """Minutes logged on one day (malformed spans are skipped with a warning)."""
+        return day_minutes(self.load_day(day_iso), day_iso)
+
+    def _range_minutes(self, start: date, end: date) -> int:
+        """
+        `totals.range_total`, with months buffered by `batch()` recounted
+        from the buffer instead of the (not yet refreshed) index.
+        """
+        idx = self.totals()
+        total = totals.range_total(idx, start, end)
+        for (year, month), data in (self._pending or {}).items():
+            first = date(year, month, 1)
+            last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+            lo, hi = max(start, first), min(end, last)
+            if lo > hi:
+                continue
+            total -= totals.range_total(idx, lo, hi)
+            total += sum(day_minutes(node, str(day)) for day, node in data.items()
+                         if lo.isoformat() <= str(day) <= hi.isoformat())
+        return total
+
+    def minutes_for_range(self, start_iso: str, end_iso: str) -> int:
+        """Minutes logged between two ISO days (inclusive), from the totals index."""
+        return self._range_minutes(date.fromisoformat(start_iso), date.fromisoformat(end_iso))
+
+    def minutes_for_month(self, year: int, month: int) -> int:
+        first = date(year, month, 1)
+        last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        return self.minutes_for_range(first.isoformat(), last.isoformat())
+
+    def rolling_average(self, window: int, end_iso: str | None = None, *, tz: str | None = None) -> float:
+        """Mean minutes per day over the `window` days ending at `end_iso` (default today)."""
+        end = date.fromisoformat(end_iso or today_iso(tz))
+        return self._range_minutes(end - timedelta(days=window - 1), end) / window
+
+_DEFAULT: LogRepository | None = None
+
+def default_repository() -> LogRepository:
+    """The repository behind `core`'s functions (follows DATA_ROOT and the active backend)."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = LogRepository()
+    return _DEFAULT
+
+__all__ = ["LogRepository", "day_minutes", "default_repository"]
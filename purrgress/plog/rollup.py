@@ -0,0 +1,164 @@
+"""
+Team rollup over many data roots (`plog rollup`).
+
+Each root is summarised by its own worker process into a compact
+`Partial` (minutes per tag and per task, plus totals). A person's total
+counts overlapping sessions once (`intervals.day_total`); the tag and
+task tables credit every session. Workers share nothing and read one
+month at a time, so memory per worker is one month of one person and the
+parent only ever holds the partials. Partials are then merged into
+team-wide tables.
+"""
+import logging
+from datetime import date
+from logging import getLogger
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from purrgress.plog import storage
+from purrgress.plog.bulk import run_processes
+from purrgress.plog.intervals import day_total
+from purrgress.utils import log_call
+from purrgress.utils.date import parse_span
+
+log = getLogger("plog")
+
+class Partial(NamedTuple):
+    person: str
+    minutes: int
+    days: int
+    tags: dict           # tag → minutes
+    tasks: dict          # task → minutes
+    error: str = ""
+
+class Rollup(NamedTuple):
+    start: str
+    end: str
+    people: list         # Partial per person, busiest first
+    tags: dict           # tag → minutes, team-wide
+    tasks: dict          # task → minutes, team-wide
+    minutes: int
+
+def person_name(root: Path) -> str:
+    """
+    Name for a data root: the first path component above the usual
+    `<person>/purrgress/data` layout.
+    """
+    parts = [p for p in Path(root).resolve().parts if p not in ("/", "")]
+    while len(parts) > 1 and parts[-1] in ("data", "purrgress"):
+        parts.pop()
+    return parts[-1] if parts else str(root)
+
+def parse_root(spec: str) -> tuple[str, Path]:
+    """"NAME=DIR" or "DIR" → (person, root)."""
+    name, sep, path = spec.partition("=")
+    if sep and name and not Path(spec).exists():
+        return name, Path(path).expanduser()
+    root = Path(spec).expanduser()
+    return person_name(root), root
+
+def _open(root: Path) -> storage.Repository:
+    sqlite = root / storage.SQLITE_NAME
+    yaml_repo = storage.YamlRepository(root)
+    if sqlite.exists() and not yaml_repo.months():
+        return storage.SqliteRepository(sqlite)
+    return yaml_repo
+
+def _sorted(counts: dict) -> dict:
+    return dict(sorted(counts.items(), key=lambda kv: (-kv[1], kv[0])))
+
+def _add(dst: dict, src: dict) -> dict:
+    for k, v in src.items():
+        dst[k] = dst.get(k, 0) + v
+    return dst
+
+def summarize_root(job: tuple[str, str, str, str]) -> Partial:
+    """
+    Worker: fold one root's spans between two ISO days into a `Partial`.
+
+    Args:
+        job (tuple): (person, root, start ISO, end ISO).
+    """
+    person, root, start, end = job
+    root = Path(root)
+    if not root.is_dir():
+        return Partial(person, 0, 0, {}, {}, f"{root} is not a directory")
+    try:
+        repo = _open(root)
+        tags: dict[str, int] = {}
+        tasks: dict[str, int] = {}
+        days: dict[str, int] = {}
+        for year, month in repo.months():
+            key = f"{year:04}-{month:02}"
+            if key < start[:7] or key > end[:7]:
+                continue
+            for day, node in repo.load_month(year, month).items():
+                day = str(day)
+                if not start <= day <= end:
+                    continue
+                minutes = day_total(node)
+                if minutes:
+                    days[day] = minutes
+                for sess in (node or {}).get("sessions") or []:
+                    mins = 0
+                    for span in sess.get("spans") or []:
+                        iv = parse_span(span)
+                        if iv is not None:
+                            mins += iv[1] - iv[0]
+                    if not mins:
+                        continue
+                    _add(tasks, {str(sess.get("task", "")): mins})
+                    _add(tags, {str(t): mins for t in dict.fromkeys(sess.get("tags") or ["untagged"])})
+    except Exception as e:
+        return Partial(person, 0, 0, {}, {}, f"{type(e).__name__}: {e}")
+    return Partial(person, sum(days.values()), len(days), _sorted(tags), _sorted(tasks))
+
+def merge(partials: Iterable[Partial], start: str, end: str) -> Rollup:
+    """
+    Combine per-root partials; roots with the same person name are summed
+    (their active-day counts can only be bounded, so the larger is kept).
+    Failed partials are kept (with their error) but add nothing.
+    """
+    people: dict[str, Partial] = {}
+    tags: dict[str, int] = {}
+    tasks: dict[str, int] = {}
+    for p in partials:
+        _add(tags, p.tags)
+        _add(tasks, p.tasks)
+        prev = people.get(p.person)
+        if prev is None:
+            people[p.person] = p
+            continue
+        people[p.person] = Partial(
+            p.person, prev.minutes + p.minutes, max(prev.days, p.days),
+            _sorted(_add(dict(prev.tags), p.tags)), _sorted(_add(dict(prev.tasks), p.tasks)),
+            "; ".join(e for e in (prev.error, p.error) if e),
+        )
+    ranked = sorted(people.values(), key=lambda p: (-p.minutes, p.person))
+    return Rollup(start, end, ranked, _sorted(tags), _sorted(tasks), sum(p.minutes for p in ranked))
+
+@log_call(logging.INFO)
+def rollup(roots: Iterable[tuple[str, Path]], start: date, end: date, *,
+           jobs: int | None = None) -> Rollup:
+    """
+    Summarise many data roots over [start, end] in parallel and merge.
+
+    Args:
+        roots (Iterable[tuple[str, Path]]): (person, data root) pairs.
+        start (date): First day.
+        end (date): Last day.
+        jobs (int | None): Worker processes (default: CPU count).
+
+    Returns:
+        Rollup: Per-person partials plus team totals by tag and task.
+    """
+    s, e = start.isoformat(), end.isoformat()
+    work = [(person, str(root), s, e) for person, root in roots]
+    try:
+        partials = run_processes(summarize_root, work, jobs)
+    except Exception as ex:
+        log.error("[rollup] Worker failed: %s", ex)
+        raise
+    return merge(partials, s, e)
+
+__all__ = ["Partial", "Rollup", "merge", "parse_root", "person_name", "rollup", "summarize_root"]
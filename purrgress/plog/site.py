@@ -0,0 +1,241 @@
+"""
+Incremental markdown report tree for the life log:
+
+    <out>/index.md              years + totals
+    <out>/<year>/index.md       months, totals, top tags, thumbnails
+    <out>/<year>/<MM>.md        month page: totals, tag table, day table
+    <out>/<year>/<MM>_heatmap.png
+
+A manifest in `<out>` records, per month, the backend change marker the
+page was built from (`Repository.month_stamps`) and the month's summary.
+A build re-renders only months whose marker moved (or whose outputs are
+missing), then the year pages that contain them, then the top index;
+year and top pages are built from the stored summaries without reading
+any month data. Month pages are rendered on a process pool.
+"""
+import logging
+from logging import getLogger
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from purrgress.plog import storage
+from purrgress.plog.bulk import run_processes
+from purrgress.plog.cleanup import tidy_month
+from purrgress.plog.grid import days_in_month, hour_day_grid
+from purrgress.plog.intervals import day_total
+from purrgress.utils import log_call
+from purrgress.utils.date import fmt_duration, parse_span
+from purrgress.utils.load import write_atomic
+from purrgress.utils.manifest import file_digest, load_manifest, modules_digest, save_manifest
+from purrgress.utils.path import resolve_pathish
+
+log = getLogger("plog")
+
+REPORT_MANIFEST = ".report-manifest.json"
+TOP_TAGS = 3
+
+class MonthJob(NamedTuple):
+    backend: str
+    location: str
+    year: int
+    month: int
+    out_dir: str
+    lut: np.ndarray
+    scale: int
+
+class BuildResult(NamedTuple):
+    rendered: list       # "YYYY-MM" months re-rendered
+    skipped: int         # months left as they were
+    removed: list        # "YYYY-MM" months whose pages were deleted
+    written: list        # relative paths written
+
+def summarize(data: dict) -> dict:
+    """
+    Totals of one tidied month: minutes, days logged, per-tag and per-day
+    minutes and per-day session counts. Malformed spans are skipped; day
+    totals count overlapping sessions once (`intervals.day_total`, like the
+    heat-map), tag totals credit every session.
+    """
+    tags: dict[str, int] = {}
+    daily: dict[str, int] = {}
+    sessions: dict[str, int] = {}
+    for day, node in sorted((data or {}).items()):
+        day = str(day)
+        if (node or {}).get("sessions"):
+            daily[day] = day_total(node)
+        for sess in (node or {}).get("sessions") or []:
+            minutes = 0
+            for span in sess.get("spans") or []:
+                iv = parse_span(span)
+                if iv is not None:
+                    minutes += iv[1] - iv[0]
+            sessions[day] = sessions.get(day, 0) + 1
+            for tag in dict.fromkeys(sess.get("tags") or ["untagged"]):
+                tags[str(tag)] = tags.get(str(tag), 0) + minutes
+    return {
+        "minutes": sum(daily.values()),
+        "days": sum(1 for v in daily.values() if v),
+        "tags": dict(sorted(tags.items(), key=lambda kv: (-kv[1], kv[0]))),
+        "daily": daily,
+        "sessions": sessions,
+    }
+
+def month_page(year: int, month: int, summary: dict, image: str | None) -> str:
+    """Markdown for one month."""
+    total = summary["minutes"]
+    out = [f"# {year}-{month:02}\n", "",
+           f"[← {year}](index.md)\n", "",
+           f"**Total:** {total} min ({fmt_duration(total)}) over {summary['days']} day(s)\n", ""]
+    if image:
+        out += [f"![{year}-{month:02} heat-map]({image})\n", ""]
+    if summary["tags"]:
+        out += ["## Tags\n", "", "| Tag | Minutes | Time | Share |\n", "|---|---:|---:|---:|\n"]
+        for tag, mins in summary["tags"].items():
+            share = 100 * mins / total if total else 0
+            out.append(f"| `{tag}` | {mins} | {fmt_duration(mins)} | {share:.0f}% |\n")
+        out.append("\n")
+    if summary["daily"]:
+        out += ["## Days\n", "", "| Day | Sessions | Minutes | Time |\n", "|---|---:|---:|---:|\n"]
+        for day, mins in summary["daily"].items():
+            out.append(f"| {day} | {summary['sessions'].get(day, 0)} | {mins} | {fmt_duration(mins)} |\n")
+    return "".join(out).rstrip("\n") + "\n"
+
+def year_page(year: int, months: dict[int, dict]) -> str:
+    """Markdown index of one year from month summaries (month → summary)."""
+    total = sum(s["minutes"] for s in months.values())
+    out = [f"# {year}\n", "", "[← all years](../index.md)\n", "",
+           f"**Total:** {total} min ({fmt_duration(total)})\n", "",
+           "| Month | Days | Minutes | Time | Top tags | Heat-map |\n",
+           "|---|---:|---:|---:|---|---|\n"]
+    for month, s in sorted(months.items()):
+        top = ", ".join(f"`{t}`" for t in list(s["tags"])[:TOP_TAGS])
+        out.append(f"| [{year}-{month:02}]({month:02}.md) | {s['days']} | {s['minutes']} | "
+                   f"{fmt_duration(s['minutes'])} | {top} | ![]({month:02}_heatmap.png) |\n")
+    return "".join(out)
+
+def index_page(years: dict[int, int]) -> str:
+    """Top-level markdown index (year → minutes)."""
+    out = ["# plog reports\n", "", "| Year | Minutes | Time |\n", "|---|---:|---:|\n"]
+    for year, minutes in sorted(years.items(), reverse=True):
+        out.append(f"| [{year}]({year}/index.md) | {minutes} | {fmt_duration(minutes)} |\n")
+    return "".join(out)
+
+def _write_text(path: Path, text: str) -> bool:
+    """Write `text` unless the file already holds it; True if written."""
+    data = text.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    write_atomic(path, data)
+    return True
+
+def _build_month(job: MonthJob) -> dict:
+    """Worker: render one month page + heat-map; returns the summary kept in the manifest."""
+    from purrgress.plog.reports import grid_to_rgb
+    from purrgress.utils.png import write_png
+
+    repo = storage.get_repository(job.backend, location=Path(job.location))
+    data = tidy_month(repo.load_month(job.year, job.month))
+    summary = summarize(data)
+
+    year_dir = Path(job.out_dir) / str(job.year)
+    image = f"{job.month:02}_heatmap.png"
+    grid = hour_day_grid(data, days_in_month(job.year, job.month))
+    write_png(year_dir / image, grid_to_rgb(grid, job.lut, job.scale))
+    _write_text(year_dir / f"{job.month:02}.md", month_page(job.year, job.month, summary, image))
+    return {k: summary[k] for k in ("minutes", "days", "tags")}
+
+def _month_outputs(year: int, month: int) -> list[str]:
+    return [f"{year}/{month:02}.md", f"{year}/{month:02}_heatmap.png"]
+
+@log_call(logging.INFO)
+def build(repo: storage.Repository | None = None, *, out_dir: Path | None = None,
+          jobs: int | None = None, force: bool = False, theme: str = "viridis",
+          scale: int = 4) -> BuildResult:
+    """
+    Bring the report tree up to date, re-rendering only what changed.
+
+    Args:
+        repo (Repository | None): Source store (default: active backend).
+        out_dir (Path | None): Output root (default 'purrgress/reports').
+        jobs (int | None): Worker processes for month pages (default: CPUs).
+        force (bool): Ignore the manifest and rebuild everything.
+        theme (str): Matplotlib colormap for the heat-maps.
+        scale (int): Pixels per hour/day cell.
+
+    Returns:
+        BuildResult: Months rendered / skipped / removed, paths written.
+    """
+    from purrgress.plog import cleanup, grid, intervals, reports
+    from purrgress.plog.reports import colormap_lut
+    from purrgress.utils import date as date_utils
+    from purrgress.utils import png
+
+    repo = repo or storage.get_repository()
+    out = Path(out_dir) if out_dir else resolve_pathish("purrgress/reports")
+    manifest_file = out / REPORT_MANIFEST
+    manifest = load_manifest(manifest_file)
+    # a change to the page templates, the summary / heat-map code or the
+    # heat-map look invalidates every page
+    code = modules_digest(cleanup, grid, intervals, reports, date_utils, png)
+    rules = f"{file_digest(__file__)[:16]}:{code}:{theme}:{scale}"
+    if force or manifest.get("rules") != rules:
+        manifest = {"rules": rules, "months": {}}
+    entries: dict = manifest.setdefault("months", {})
+
+    stamps = repo.month_stamps()
+    todo: list[tuple[int, int]] = []
+    for key, stamp in sorted(stamps.items()):
+        y, m = int(key[:4]), int(key[5:7])
+        entry = entries.get(key)
+        fresh = entry is not None and entry.get("stamp") == stamp \
+            and all((out / p).exists() for p in _month_outputs(y, m))
+        if not fresh:
+            todo.append((y, m))
+
+    removed = sorted(set(entries) - set(stamps))
+    for key in removed:
+        for rel in _month_outputs(int(key[:4]), int(key[5:7])):
+            (out / rel).unlink(missing_ok=True)
+        del entries[key]
+
+    lut = colormap_lut(theme)
+    backend, location = storage.repository_spec(repo)
+    jobs_in = [MonthJob(backend, location, y, m, str(out), lut, scale) for y, m in todo]
+    try:
+        summaries = run_processes(_build_month, jobs_in, jobs)
+    except Exception as e:
+        log.error("[build] Worker failed: %s", e)
+        raise
+
+    rendered, written = [], []
+    for (y, m), summary in zip(todo, summaries):
+        key = f"{y:04}-{m:02}"
+        entries[key] = {"stamp": stamps[key], "summary": summary}
+        rendered.append(key)
+        written.extend(_month_outputs(y, m))
+
+    # year + top pages only depend on summaries, so rendering them is cheap;
+    # _write_text keeps untouched ones byte-for-byte (and their mtime)
+    by_year: dict[int, dict[int, dict]] = {}
+    for key, entry in entries.items():
+        by_year.setdefault(int(key[:4]), {})[int(key[5:7])] = entry["summary"]
+    dirty = {y for y, _ in todo} | {int(key[:4]) for key in removed}
+    for year, months in by_year.items():
+        rel = f"{year}/index.md"
+        if (year in dirty or not (out / rel).exists()) and _write_text(out / rel, year_page(year, months)):
+            written.append(rel)
+    for year in dirty - set(by_year):
+        (out / f"{year}/index.md").unlink(missing_ok=True)
+    years = {y: sum(s["minutes"] for s in months.values()) for y, months in by_year.items()}
+    if _write_text(out / "index.md", index_page(years)):
+        written.append("index.md")
+
+    save_manifest(manifest_file, manifest)
+    return BuildResult(rendered, len(stamps) - len(todo), removed, written)
+
+__all__ = ["BuildResult", "REPORT_MANIFEST", "build", "index_page", "month_page", "summarize", "year_page"]
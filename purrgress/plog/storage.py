@@ -0,0 +1,531 @@
+"""
+Storage backends for the life-log.
+
+`Repository` is the interface `core`, `reports` and the CLI talk to.
+`YamlRepository` is the historical layout (DATA_ROOT/<year>/<month>.yaml);
+`SqliteRepository` keeps the same data in one stdlib-sqlite3 file with
+indexes on date, task and tag so range aggregates run as `GROUP BY`s.
+
+The active backend comes from `plog --backend` / PLOG_BACKEND (default
+"yaml"); `plog migrate` copies every month from one backend to another.
+"""
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from contextlib import closing
+from logging import getLogger
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+from purrgress.plog import core, pack
+from purrgress.plog.cleanup import tidy_day, tidy_month
+from purrgress.plog.intervals import day_total, unique_minutes
+from purrgress.plog.monthio import load_month_text
+from purrgress.utils import log_call, profiling
+from purrgress.utils.date import parse_span
+
+log = getLogger("plog")
+
+BACKENDS = ("yaml", "sqlite")
+SQLITE_NAME = "plog.sqlite3"
+GROUP_BY = ("day", "task", "tag")
+
+_backend: str | None = None
+
+class SpanRow(NamedTuple):
+    day: str
+    task: str
+    tags: tuple
+    span: str
+    minutes: int | None
+
+def _month_of(day_iso: str) -> tuple[int, int]:
+    y, m, _ = str(day_iso).split("-")
+    return int(y), int(m)
+
+def _month_bounds(year: int, month: int) -> tuple[str, str]:
+    return f"{year:04}-{month:02}-00", f"{year:04}-{month:02}-99"
+
+def _in_range(day: str, start: str | None, end: str | None) -> bool:
+    return (start is None or day >= start) and (end is None or day <= end)
+
+def _span_minutes(span) -> int | None:
+    parsed = parse_span(span)
+    return None if parsed is None else parsed[1] - parsed[0]
+
+class Repository(ABC):
+    """
+    Month-granular life-log store.
+
+    Backends implement `months`, `load_month` and `save_month`; everything
+    else has a generic implementation on top of those that backends may
+    override with something faster.
+    """
+
+    name = "abstract"
+
+    @abstractmethod
+    def months(self) -> list[tuple[int, int]]:
+        """Sorted (year, month) pairs that hold data."""
+
+    @abstractmethod
+    def load_month(self, year: int, month: int) -> dict:
+        """Month data keyed by ISO day ({} if there is none)."""
+
+    @abstractmethod
+    def save_month(self, year: int, month: int, data: dict) -> None:
+        """Tidy and replace a whole month."""
+
+    @property
+    @abstractmethod
+    def data_dir(self) -> Path:
+        """Directory for derived files (indexes, caches) of this store."""
+
+    def location(self, year: int, month: int) -> str:
+        """Human-readable place a month lives, for CLI messages."""
+        return f"{self.name}:{year}-{month:02}"
+
+    def month_stamps(self) -> dict[str, list]:
+        """
+        Cheap change markers keyed by "YYYY-MM" (no parsing); a derived
+        index whose stamp for a month differs must rebuild that month.
+        """
+        return {f"{y:04}-{m:02}": [] for y, m in self.months()}
+
+    def month_stamp(self, year: int, month: int) -> list | None:
+        """`month_stamps()` entry for one month (None if it has no data)."""
+        return self.month_stamps().get(f"{year:04}-{month:02}")
+
+    def has_month(self, year: int, month: int) -> bool:
+        return (year, month) in self.months()
+
+    def load_day(self, day_iso: str) -> dict:
+        return self.load_month(*_month_of(day_iso)).get(day_iso, {})
+
+    def load_range(self, start: str | None = None, end: str | None = None) -> dict:
+        """
+        Days between `start` and `end` (inclusive ISO dates; None = open).
+
+        Returns:
+            dict: Day nodes keyed by ISO day, in date order.
+        """
+        out = {}
+        for year, month in self.months():
+            lo, hi = _month_bounds(year, month)
+            if (end is not None and lo > end) or (start is not None and hi < start):
+                continue
+            for day, node in sorted(self.load_month(year, month).items()):
+                if _in_range(str(day), start, end):
+                    out[str(day)] = node
+        return out
+
+    def append_span(self, day_iso: str, session: dict) -> None:
+        """Append one session (task/tags/moods/spans) to a day."""
+        year, month = _month_of(day_iso)
+        data = self.load_month(year, month)
+        node = data.setdefault(day_iso, {"sessions": []})
+        node.setdefault("sessions", []).append(session)
+        self.save_month(year, month, data)
+
+    def set_key(self, day_iso: str, key: str, value) -> None:
+        """Set a day-level key such as "wake" / "sleep", overwriting it."""
+        year, month = _month_of(day_iso)
+        data = self.load_month(year, month)
+        data.setdefault(day_iso, {"sessions": []})[key] = value
+        self.save_month(year, month, data)
+
+    def iter_spans(self, start: str | None = None, end: str | None = None) -> Iterator[SpanRow]:
+        """Every span between two ISO dates, with its session's task/tags."""
+        for day, node in self.load_range(start, end).items():
+            for sess in (node or {}).get("sessions") or []:
+                tags = tuple(sess.get("tags") or ())
+                for span in sess.get("spans") or []:
+                    yield SpanRow(day, sess.get("task", ""), tags, span, _span_minutes(span))
+
+    def minutes_by(self, start: str | None = None, end: str | None = None,
+                   by: str = "day") -> dict[str, int]:
+        """
+        Minutes logged between two ISO dates, grouped by day, task or tag.
+        Malformed spans are skipped. Day totals count overlapping sessions
+        once (`intervals.day_total`); task/tag totals credit every session.
+        """
+        if by not in GROUP_BY:
+            raise ValueError(f"by must be one of {GROUP_BY}, got {by!r}")
+        if by == "day":
+            days = {day: day_total(node) for day, node in sorted(self.load_range(start, end).items())}
+            return {day: mins for day, mins in days.items() if mins}
+        totals: dict[str, int] = {}
+        for row in self.iter_spans(start, end):
+            if row.minutes is None:
+                continue
+            keys = row.tags if by == "tag" else (row.task,)
+            for key in dict.fromkeys(keys):
+                totals[key] = totals.get(key, 0) + row.minutes
+        return dict(sorted(totals.items()))
+
+class YamlRepository(Repository):
+    """
+    One YAML file per month under `root` (default: `core.DATA_ROOT`).
+    Months folded into `<year>.plogpack` bundles (see `pack`) are read
+    transparently; a loose file shadows its packed copy.
+    """
+
+    name = "yaml"
+
+    def __init__(self, root: Path | None = None):
+        self._root = Path(root) if root is not None else None
+
+    @property
+    def root(self) -> Path:
+        return self._root if self._root is not None else core.DATA_ROOT
+
+    @property
+    def data_dir(self) -> Path:
+        return self.root
+
+    def month_path(self, year: int, month: int) -> Path:
+        return self.root / f"{year}/{month:02}.yaml"
+
+    def _packed(self, year: int, month: int) -> pack.Bundle | None:
+        bundle = pack.read_bundle(pack.bundle_path(self.root, year))
+        return bundle if bundle is not None and month in bundle.entries else None
+
+    def month_stamps(self) -> dict[str, list]:
+        # packed entries keep the original file's mtime/size, so packing
+        # doesn't look like an edit to indexes keyed on these
+        stamps = {}
+        for year, bundle in pack.bundles(self.root).items():
+            for m, e in bundle.entries.items():
+                stamps[f"{year:04}-{m:02}"] = [e.mtime_ns, e.size]
+        for path in self.root.glob("[0-9][0-9][0-9][0-9]/[0-9][0-9].yaml"):
+            st = path.stat()
+            stamps[f"{path.parent.name}-{path.stem}"] = [st.st_mtime_ns, st.st_size]
+        return dict(sorted(stamps.items()))
+
+    def month_stamp(self, year: int, month: int) -> list | None:
+        try:
+            st = self.month_path(year, month).stat()
+        except FileNotFoundError:
+            bundle = self._packed(year, month)
+            if bundle is None:
+                return None
+            entry = bundle.entries[month]
+            return [entry.mtime_ns, entry.size]
+        return [st.st_mtime_ns, st.st_size]
+
+    def location(self, year: int, month: int) -> str:
+        path = self.month_path(year, month)
+        suffix = ""
+        if not path.exists() and self._packed(year, month) is not None:
+            path, suffix = pack.bundle_path(self.root, year), f"#{month:02}"
+        try:
+            return str(path.relative_to(self.root.parent)) + suffix
+        except ValueError:
+            return str(path) + suffix
+
+    def months(self) -> list[tuple[int, int]]:
+        found = {(year, m) for year, bundle in pack.bundles(self.root).items() for m in bundle.entries}
+        for path in self.root.glob("[0-9][0-9][0-9][0-9]/[0-9][0-9].yaml"):
+            found.add((int(path.parent.name), int(path.stem)))
+        return sorted(found)
+
+    def has_month(self, year: int, month: int) -> bool:
+        return self.month_path(year, month).exists() or self._packed(year, month) is not None
+
+    def load_month(self, year: int, month: int) -> dict:
+        path = self.month_path(year, month)
+        if not path.exists():
+            bundle = self._packed(year, month)
+            if bundle is not None:
+                raw = pack.read_month(bundle, month)
+                with profiling.phase("yaml_load"):
+                    return load_month_text(raw.decode("utf-8"))
+        return core._load_month(path)
+
+    def save_month(self, year: int, month: int, data: dict) -> None:
+        path = self.month_path(year, month)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        core._write_month(path, data)
+
+_SCHEMA = """
+PRAGMA foreign_keys = ON;
+CREATE TABLE IF NOT EXISTS days (
+    date  TEXT PRIMARY KEY,
+    wake  TEXT,
+    sleep TEXT
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id    INTEGER PRIMARY KEY,
+    date  TEXT NOT NULL REFERENCES days(date) ON DELETE CASCADE,
+    seq   INTEGER NOT NULL,
+    task  TEXT NOT NULL,
+    tags  TEXT NOT NULL,
+    moods TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS session_tags (
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    tag        TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS spans (
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    seq        INTEGER NOT NULL,
+    date       TEXT NOT NULL,
+    span       TEXT NOT NULL,
+    start_min  INTEGER,
+    end_min    INTEGER
+);
+CREATE TABLE IF NOT EXISTS month_rev (
+    month TEXT PRIMARY KEY,
+    rev   INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_date ON sessions(date);
+CREATE INDEX IF NOT EXISTS sessions_task ON sessions(task);
+CREATE INDEX IF NOT EXISTS session_tags_tag ON session_tags(tag, session_id);
+CREATE INDEX IF NOT EXISTS spans_date ON spans(date);
+CREATE INDEX IF NOT EXISTS spans_session ON spans(session_id);
+"""
+
+_GROUP_SQL = {
+    # rows, not sums: overlapping sessions are merged in Python (see minutes_by)
+    "day": """SELECT sp.date, sp.start_min, sp.end_min FROM spans sp
+              WHERE sp.date BETWEEN ? AND ? AND sp.start_min IS NOT NULL
+              ORDER BY sp.date""",
+    "task": """SELECT s.task, SUM(sp.end_min - sp.start_min) FROM spans sp
+               JOIN sessions s ON s.id = sp.session_id
+               WHERE sp.date BETWEEN ? AND ? AND sp.start_min IS NOT NULL
+               GROUP BY s.task ORDER BY s.task""",
+    "tag": """SELECT t.tag, SUM(sp.end_min - sp.start_min) FROM spans sp
+              JOIN session_tags t ON t.session_id = sp.session_id
+              WHERE sp.date BETWEEN ? AND ? AND sp.start_min IS NOT NULL
+              GROUP BY t.tag ORDER BY t.tag""",
+}
+
+class SqliteRepository(Repository):
+    """
+    All months in one SQLite file (default: DATA_ROOT/plog.sqlite3).
+
+    Days are written already tidied, so `load_month` returns exactly what
+    the YAML backend would after `tidy_month`. Tags/moods keep their order
+    as JSON on the session row; `session_tags` holds one row per distinct
+    tag for the tag index.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Path | None = None):
+        self._path = Path(path) if path is not None else None
+
+    @property
+    def path(self) -> Path:
+        return self._path if self._path is not None else core.DATA_ROOT / SQLITE_NAME
+
+    @property
+    def data_dir(self) -> Path:
+        return self.path.parent
+
+    def location(self, year: int, month: int) -> str:
+        return f"{self.path.name}#{year}-{month:02}"
+
+    def month_stamps(self) -> dict[str, list]:
+        with closing(self._connect()) as con:
+            return {month: [rev] for month, rev in con.execute("SELECT month, rev FROM month_rev")}
+
+    def month_stamp(self, year: int, month: int) -> list | None:
+        with closing(self._connect()) as con:
+            row = con.execute("SELECT rev FROM month_rev WHERE month = ?",
+                              (f"{year:04}-{month:02}",)).fetchone()
+        return [row[0]] if row is not None else None
+
+    @staticmethod
+    def _bump(con: sqlite3.Connection, day_iso: str) -> None:
+        con.execute(
+            "INSERT INTO month_rev (month, rev) VALUES (?, 1) "
+            "ON CONFLICT(month) DO UPDATE SET rev = rev + 1", (str(day_iso)[:7],)
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        con = sqlite3.connect(self.path)
+        con.executescript(_SCHEMA)
+        return con
+
+    def months(self) -> list[tuple[int, int]]:
+        with closing(self._connect()) as con:
+            rows = con.execute(
+                "SELECT DISTINCT substr(date, 1, 7) FROM days ORDER BY 1"
+            ).fetchall()
+        return [_month_of(f"{ym}-01") for (ym,) in rows]
+
+    def has_month(self, year: int, month: int) -> bool:
+        with closing(self._connect()) as con:
+            row = con.execute("SELECT 1 FROM days WHERE date BETWEEN ? AND ? LIMIT 1",
+                              _month_bounds(year, month)).fetchone()
+        return row is not None
+
+    def _read(self, con: sqlite3.Connection, lo: str, hi: str) -> dict:
+        out: dict[str, dict] = {}
+        for date, wake, sleep in con.execute(
+            "SELECT date, wake, sleep FROM days WHERE date BETWEEN ? AND ? ORDER BY date", (lo, hi)
+        ):
+            node = {}
+            if wake is not None:
+                node["wake"] = json.loads(wake)
+            if sleep is not None:
+                node["sleep"] = json.loads(sleep)
+            node["sessions"] = []
+            out[date] = node
+
+        by_id = {}
+        for sid, date, task, tags, moods in con.execute(
+            "SELECT id, date, task, tags, moods FROM sessions "
+            "WHERE date BETWEEN ? AND ? ORDER BY date, seq", (lo, hi)
+        ):
+            sess = {"task": task, "tags": json.loads(tags), "moods": json.loads(moods), "spans": []}
+            out[date]["sessions"].append(sess)
+            by_id[sid] = sess
+
+        for sid, span in con.execute(
+            "SELECT session_id, span FROM spans WHERE date BETWEEN ? AND ? "
+            "ORDER BY session_id, seq", (lo, hi)
+        ):
+            by_id[sid]["spans"].append(span)
+        return out
+
+    def _write_days(self, con: sqlite3.Connection, data: dict) -> None:
+        for day, node in data.items():
+            day = str(day)
+            node = tidy_day(node or {})
+            self._bump(con, day)
+            con.execute("DELETE FROM days WHERE date = ?", (day,))
+            con.execute(
+                "INSERT INTO days (date, wake, sleep) VALUES (?, ?, ?)",
+                (day,
+                 json.dumps(node["wake"]) if "wake" in node else None,
+                 json.dumps(node["sleep"]) if "sleep" in node else None),
+            )
+            for seq, sess in enumerate(node["sessions"]):
+                sid = con.execute(
+                    "INSERT INTO sessions (date, seq, task, tags, moods) VALUES (?, ?, ?, ?, ?)",
+                    (day, seq, sess["task"],
+                     json.dumps(sess["tags"], ensure_ascii=False),
+                     json.dumps(sess["moods"], ensure_ascii=False)),
+                ).lastrowid
+                con.executemany(
+                    "INSERT INTO session_tags (session_id, tag) VALUES (?, ?)",
+                    [(sid, str(tag)) for tag in dict.fromkeys(sess["tags"])],
+                )
+                rows = []
+                for i, span in enumerate(sess["spans"]):
+                    parsed = parse_span(span)
+                    rows.append((sid, i, day, span, *(parsed or (None, None))))
+                con.executemany(
+                    "INSERT INTO spans (session_id, seq, date, span, start_min, end_min) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", rows,
+                )
+
+    @log_call()
+    def load_month(self, year: int, month: int) -> dict:
+        with closing(self._connect()) as con:
+            return self._read(con, *_month_bounds(year, month))
+
+    @log_call()
+    def load_range(self, start: str | None = None, end: str | None = None) -> dict:
+        with closing(self._connect()) as con:
+            return self._read(con, start or "0000", end or "9999")
+
+    def load_day(self, day_iso: str) -> dict:
+        with closing(self._connect()) as con:
+            return self._read(con, day_iso, day_iso).get(day_iso, {})
+
+    @log_call()
+    def save_month(self, year: int, month: int, data: dict) -> None:
+        with closing(self._connect()) as con, con:
+            con.execute("DELETE FROM days WHERE date BETWEEN ? AND ?", _month_bounds(year, month))
+            self._bump(con, f"{year:04}-{month:02}")
+            self._write_days(con, data)
+
+    def append_span(self, day_iso: str, session: dict) -> None:
+        with closing(self._connect()) as con, con:
+            node = self._read(con, day_iso, day_iso).get(day_iso, {"sessions": []})
+            node["sessions"].append(session)
+            self._write_days(con, {day_iso: node})
+
+    def set_key(self, day_iso: str, key: str, value) -> None:
+        if key not in ("wake", "sleep"):
+            raise ValueError(f"SQLite backend only stores wake/sleep day keys, not {key!r}")
+        with closing(self._connect()) as con, con:
+            con.execute("INSERT OR IGNORE INTO days (date) VALUES (?)", (day_iso,))
+            self._bump(con, day_iso)
+            con.execute(f"UPDATE days SET {key} = ? WHERE date = ?", (json.dumps(value), day_iso))
+
+    @log_call()
+    def minutes_by(self, start: str | None = None, end: str | None = None,
+                   by: str = "day") -> dict[str, int]:
+        if by not in GROUP_BY:
+            raise ValueError(f"by must be one of {GROUP_BY}, got {by!r}")
+        with closing(self._connect()) as con:
+            rows = con.execute(_GROUP_SQL[by], (start or "0000", end or "9999")).fetchall()
+        if by == "day":
+            per_day: dict[str, list] = {}
+            for day, lo, hi in rows:
+                per_day.setdefault(day, []).append((lo, hi))
+            days = {day: unique_minutes(ivs) for day, ivs in per_day.items()}
+            return {day: mins for day, mins in days.items() if mins}
+        return {key: int(total) for key, total in rows}
+
+def use_backend(name: str | None) -> None:
+    """Select the backend for this process (None = PLOG_BACKEND / yaml)."""
+    global _backend
+    if name is not None and name not in BACKENDS:
+        raise ValueError(f"Unknown backend {name!r}; choose from {BACKENDS}")
+    _backend = name
+
+def repository_spec(repo: Repository) -> tuple[str, str]:
+    """
+    (backend name, absolute location) that `get_repository` turns back into
+    an equivalent repository - for handing a store to worker processes.
+    """
+    if isinstance(repo, YamlRepository):
+        return repo.name, str(repo.root)
+    if isinstance(repo, SqliteRepository):
+        return repo.name, str(repo.path)
+    raise ValueError(f"Don't know how to locate a {type(repo).__name__}")
+
+def get_repository(name: str | None = None, *, location: Path | None = None) -> Repository:
+    """
+    Build a repository for `name`, the selected backend, or PLOG_BACKEND.
+
+    Args:
+        name (str | None): "yaml" or "sqlite".
+        location (Path | None): Data root (yaml) or database file (sqlite);
+            defaults follow `core.DATA_ROOT`.
+
+    Returns:
+        Repository: The backend instance.
+    """
+    name = name or _backend or os.environ.get("PLOG_BACKEND") or "yaml"
+    if name == "yaml":
+        return YamlRepository(location)
+    if name == "sqlite":
+        return SqliteRepository(location)
+    raise ValueError(f"Unknown backend {name!r}; choose from {BACKENDS}")
+
+@log_call()
+def migrate(src: Repository, dst: Repository) -> list[tuple[int, int]]:
+    """
+    Copy every month of `src` into `dst`, replacing those months there.
+
+    Returns:
+        list[tuple[int, int]]: (year, month) pairs copied.
+    """
+    copied = []
+    for year, month in src.months():
+        data = src.load_month(year, month)
+        try:
+            dst.save_month(year, month, tidy_month(data))
+        except Exception as e:
+            log.error("[migrate] Failed to copy %d-%02d to %s: %s", year, month, dst.name, e)
+            raise
+        copied.append((year, month))
+    return copied
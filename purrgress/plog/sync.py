@@ -0,0 +1,173 @@
+"""
+Two-way merge of two YAML data roots (`plog sync`), e.g. a laptop's
+data dir and the desktop's on a mounted share.
+
+Each root gets a content hash tree: day → month → year. Day hashes are
+taken over the tidied day, so formatting or session order never shows up
+as a difference. Trees are cached per root in `.sync-tree.json`, keyed on
+the month files' (mtime, size) stamps, so months that didn't change since
+the last sync are never parsed; equal year/month hashes skip whole
+subtrees when comparing.
+
+Differing days are merged with `tidy_day` semantics - the union of both
+sides' sessions, same task+tags merged, spans deduped and overlaps
+unioned. When both sides set different wake/sleep times, SRC wins and the
+conflict is reported. Only the affected month files are rewritten, each
+atomically and only if its bytes change.
+"""
+import json
+import logging
+from logging import getLogger
+from pathlib import Path
+from typing import NamedTuple
+
+from purrgress.plog import monthio
+from purrgress.plog.cleanup import tidy_day, tidy_month
+from purrgress.plog.storage import YamlRepository
+from purrgress.utils import log_call
+from purrgress.utils.load import write_atomic
+from purrgress.utils.manifest import load_manifest, save_manifest, text_digest
+
+log = getLogger("plog")
+
+TREE_CACHE = ".sync-tree.json"
+
+class SyncResult(NamedTuple):
+    days: list           # ISO days that differed
+    written: list        # (side, "YYYY-MM") pairs rewritten; side is "src" | "dst"
+    conflicts: list      # human-readable wake/sleep conflicts
+    parsed: int          # month files parsed to build the trees
+
+def day_digest(node) -> str:
+    """Hash of a day's tidied content (raw content if it can't be tidied)."""
+    try:
+        node = tidy_day(node)
+    except Exception:
+        pass
+    return text_digest(json.dumps(node, sort_keys=True, ensure_ascii=False, default=str))[:16]
+
+def _combine(hashes: dict) -> str:
+    return text_digest("".join(f"{k}:{v};" for k, v in sorted(hashes.items())))[:16]
+
+def _month_entry(data: dict, stamp: list) -> dict:
+    days = {str(day): day_digest(node) for day, node in data.items()}
+    return {"stamp": stamp, "hash": _combine(days), "days": days}
+
+def hash_tree(root: Path) -> tuple[dict, int]:
+    """
+    Per-day hash tree of a root, reusing its cache for unchanged months.
+
+    Returns:
+        tuple: ({year: {"hash", "months": {"YYYY-MM": {"stamp", "hash", "days"}}}},
+        number of month files parsed).
+    """
+    repo = YamlRepository(root)
+    cache_path = Path(root) / TREE_CACHE
+    cached = load_manifest(cache_path).get("months", {})
+    months, parsed = {}, 0
+    for key, stamp in repo.month_stamps().items():
+        hit = cached.get(key)
+        if hit and hit.get("stamp") == stamp:
+            months[key] = hit
+            continue
+        months[key] = _month_entry(repo.load_month(int(key[:4]), int(key[5:])), stamp)
+        parsed += 1
+    if months != cached:
+        save_manifest(cache_path, {"months": months})
+
+    tree: dict[str, dict] = {}
+    for key, entry in months.items():
+        tree.setdefault(key[:4], {"months": {}})["months"][key] = entry
+    for year in tree.values():
+        year["hash"] = _combine({k: m["hash"] for k, m in year["months"].items()})
+    return tree, parsed
+
+def diff_trees(a: dict, b: dict) -> dict[str, list[str]]:
+    """Differing days by "YYYY-MM", descending only into subtrees whose hashes differ."""
+    out: dict[str, list[str]] = {}
+    for year in sorted(set(a) | set(b)):
+        ya, yb = a.get(year, {}), b.get(year, {})
+        if ya.get("hash") == yb.get("hash"):
+            continue
+        ma, mb = ya.get("months", {}), yb.get("months", {})
+        for month in sorted(set(ma) | set(mb)):
+            da, db = ma.get(month, {}), mb.get(month, {})
+            if da.get("hash") == db.get("hash"):
+                continue
+            days_a, days_b = da.get("days", {}), db.get("days", {})
+            days = [d for d in sorted(set(days_a) | set(days_b)) if days_a.get(d) != days_b.get(d)]
+            if days:
+                out[month] = days
+    return out
+
+def merge_day(src: dict | None, dst: dict | None, day_iso: str = "",
+              conflicts: list | None = None) -> dict:
+    """
+    Union of two versions of a day, tidied. SRC's wake/sleep win on conflict
+    (recorded in `conflicts`).
+    """
+    src, dst = src or {}, dst or {}
+    node = {"sessions": list(src.get("sessions") or []) + list(dst.get("sessions") or [])}
+    for key in ("wake", "sleep"):
+        if key in src:
+            node[key] = src[key]
+            if key in dst and dst[key] != src[key] and conflicts is not None:
+                conflicts.append(f"{day_iso} {key}: {src[key]} (src) over {dst[key]} (dst)")
+        elif key in dst:
+            node[key] = dst[key]
+    return tidy_day(node)
+
+def _write(repo: YamlRepository, year: int, month: int, data: dict) -> bool:
+    path = repo.month_path(year, month)
+    out = monthio.dump_month(tidy_month(data)).encode("utf-8")
+    if path.exists() and path.read_bytes() == out:
+        return False
+    write_atomic(path, out)
+    return True
+
+@log_call(logging.INFO)
+def sync(src: Path, dst: Path, *, one_way: bool = False, dry_run: bool = False) -> SyncResult:
+    """
+    Merge two data roots so both hold the union of their logs.
+
+    Args:
+        src (Path): First root (wins wake/sleep conflicts).
+        dst (Path): Second root.
+        one_way (bool): Only update DST.
+        dry_run (bool): Report differences without writing.
+
+    Returns:
+        SyncResult: Differing days, rewritten months, conflicts.
+    """
+    src, dst = Path(src), Path(dst)
+    for root in (src, dst):
+        if not root.is_dir():
+            raise FileNotFoundError(f"{root} is not a directory")
+    tree_src, parsed_src = hash_tree(src)
+    tree_dst, parsed_dst = hash_tree(dst)
+    diff = diff_trees(tree_src, tree_dst)
+
+    repos = {"src": YamlRepository(src), "dst": YamlRepository(dst)}
+    days, written, conflicts = [], [], []
+    for key, changed in diff.items():
+        days.extend(changed)
+        year, month = int(key[:4]), int(key[5:])
+        data = {side: repo.load_month(year, month) for side, repo in repos.items()}
+        merged = {d: merge_day(data["src"].get(d), data["dst"].get(d), d, conflicts) for d in changed}
+        if dry_run:
+            continue
+        for side in ("dst",) if one_way else ("src", "dst"):
+            try:
+                if _write(repos[side], year, month, {**data[side], **merged}):
+                    written.append((side, key))
+            except Exception as e:
+                log.error("[sync] Failed to write %s %s: %s", side, key, e)
+                raise
+    if written:
+        # refresh the caches so the next sync skips the months just written
+        hash_tree(dst)
+        if not one_way:
+            hash_tree(src)
+    return SyncResult(days, written, conflicts, parsed_src + parsed_dst)
+
+__all__ = ["SyncResult", "TREE_CACHE", "day_digest", "diff_trees", "hash_tree", "merge_day", "sync"]
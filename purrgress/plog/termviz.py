@@ -0,0 +1,96 @@
+"""
+Terminal heat-map: the same 24 × N grid as the PNG, drawn with rich.
+Imports neither pandas nor matplotlib.
+"""
+from logging import getLogger
+
+import numpy as np
+from rich.console import Console
+from rich.text import Text
+
+log = getLogger("plog")
+
+# 9 evenly spaced stops sampled from the matplotlib colormaps of the same name.
+PALETTES = {
+    "viridis": ["#440154", "#472d7b", "#3b528b", "#2c728e", "#21918c", "#28ae80", "#5ec962", "#addc30", "#fde725"],
+    "magma":   ["#000004", "#1d1147", "#51127c", "#832681", "#b73779", "#e75263", "#fc8961", "#fec488", "#fcfdbf"],
+    "plasma":  ["#0d0887", "#4c02a1", "#7e03a8", "#aa2395", "#cc4778", "#e66c5c", "#f89540", "#fdc527", "#f0f921"],
+    "inferno": ["#000004", "#210c4a", "#57106e", "#8a226a", "#bc3754", "#e45a31", "#f98e09", "#f9cb35", "#fcffa4"],
+    "cividis": ["#00224e", "#1a386f", "#434e6c", "#61656f", "#7d7c78", "#9b9476", "#bcae6c", "#dec958", "#fee838"],
+    "turbo":   ["#30123b", "#466be3", "#28bceb", "#32f298", "#a4fc3c", "#eecf3a", "#fb7e21", "#d02f05", "#7a0403"],
+}
+
+def _palette(theme: str) -> list[str]:
+    if theme not in PALETTES:
+        log.warning("[termviz] Unknown theme %r for --term; using viridis", theme)
+    return PALETTES.get(theme, PALETTES["viridis"])
+
+def render_grid(grid: np.ndarray, title: str, *, theme: str = "viridis",
+                col_labels: list | None = None, row_labels: list | None = None,
+                unit: str = "min") -> Text:
+    """
+    Render a (rows × cols) count matrix as coloured blocks, first row at the
+    bottom (like `imshow(origin="lower")`).
+
+    Args:
+        grid (np.ndarray): Counts, e.g. minutes per [hour, day].
+        title (str): Heading line.
+        theme (str): One of `PALETTES`.
+        col_labels (list | None): Column labels (default 1..cols).
+        row_labels (list | None): Row labels (default 0..rows-1).
+        unit (str): Unit shown in the legend.
+
+    Returns:
+        Text: rich renderable.
+    """
+    colors = _palette(theme)
+    rows, cols = grid.shape
+    col_labels = col_labels or list(range(1, cols + 1))
+    row_labels = row_labels or list(range(rows))
+    label_w = max(len(str(r)) for r in row_labels)
+
+    peak = int(grid.max()) if grid.size else 0
+    if peak:
+        levels = np.ceil(grid * (len(colors) - 1) / peak).astype(int)
+    else:
+        levels = np.zeros(grid.shape, dtype=int)
+
+    out = Text(f"{title}\n", style="bold")
+    for r in range(rows - 1, -1, -1):
+        out.append(f"{row_labels[r]:>{label_w}} ")
+        for c in range(cols):
+            if grid[r, c]:
+                out.append("██", style=colors[levels[r, c]])
+            else:
+                out.append("··", style="grey30")
+        out.append("\n")
+
+    out.append(" " * (label_w + 1))
+    for label in col_labels:
+        out.append(f"{str(label)[-2:]:>2}", style="dim")
+    out.append("\n\n")
+
+    out.append(" " * (label_w + 1) + f"0 {unit} ")
+    for color in colors[1:]:
+        out.append("██", style=color)
+    out.append(f" {peak} {unit}   total {int(grid.sum())} {unit}\n")
+    return out
+
+def print_heatmap(grid: np.ndarray, year: int, month: int, *, theme: str = "viridis",
+                  console: Console | None = None) -> None:
+    """Print an hour × day month grid from `grid.hour_day_grid`."""
+    (console or Console()).print(
+        render_grid(grid, f"Study Heat-map {year}-{month:02}", theme=theme)
+    )
+
+def print_profile(profiles: dict, start: str, end: str, *, bin_minutes: int = 60,
+                  theme: str = "viridis", console: Console | None = None) -> None:
+    """Print weekday × time-bin matrices from `weekly.week_profile`, Monday on top."""
+    from purrgress.plog.weekly import WEEKDAYS, bin_labels
+
+    console = console or Console()
+    for label, matrix in profiles.items():
+        console.print(render_grid(
+            matrix[::-1], f"Weekly profile {start} → {end} ({label}, {bin_minutes}-min bins)",
+            theme=theme, col_labels=bin_labels(bin_minutes), row_labels=WEEKDAYS[::-1],
+        ))
@@ -0,0 +1,190 @@
+"""
+Daily-totals index: one int32 of logged minutes per calendar day, stored
+in a small binary file next to the data, with int64 prefix sums built on
+load so any date-range total is two array lookups.
+
+File layout (little endian):
+    b"PLTOT1\\0\\0" | base ordinal (i4) | days (i4) | stamps length (u4)
+    | stamps JSON ("YYYY-MM" → backend change marker) | days × i4 totals
+
+Months whose change marker differs from the stored one (edited by hand,
+by another backend, ...) are recounted on the next query; `_store_span`
+refreshes its own month right after writing.
+"""
+import calendar
+import json
+import struct
+from datetime import date, timedelta
+from logging import getLogger
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from purrgress.utils import log_call, profiling
+from purrgress.utils.load import write_atomic
+
+log = getLogger("plog")
+
+MAGIC = b"PLTOT1\0\0"
+_HEADER = struct.Struct("<8siiI")
+PERIODS = ("week", "month", "year")
+
+class TotalsIndex(NamedTuple):
+    base: int                 # date ordinal of daily[0]
+    daily: np.ndarray         # int32 minutes per day
+    stamps: dict              # "YYYY-MM" → change marker
+    prefix: np.ndarray        # int64, prefix[i] = sum(daily[:i])
+
+def _with_prefix(base: int, daily: np.ndarray, stamps: dict) -> TotalsIndex:
+    prefix = np.zeros(len(daily) + 1, dtype=np.int64)
+    np.cumsum(daily, out=prefix[1:])
+    return TotalsIndex(base, daily, stamps, prefix)
+
+def index_path(repo) -> Path:
+    return repo.data_dir / f".totals-{repo.name}.bin"
+
+def read_index(path: Path) -> TotalsIndex | None:
+    """Parse an index file; None if missing or unreadable."""
+    try:
+        raw = path.read_bytes()
+        magic, base, days, slen = _HEADER.unpack_from(raw)
+        if magic != MAGIC:
+            raise ValueError("bad magic")
+        off = _HEADER.size
+        stamps = json.loads(raw[off:off + slen])
+        daily = np.frombuffer(raw, dtype="<i4", count=days, offset=off + slen).astype(np.int32)
+    except FileNotFoundError:
+        return None
+    except (ValueError, struct.error) as e:
+        log.warning("[totals] Ignoring unreadable index %s: %s", path, e)
+        return None
+    return _with_prefix(base, daily, stamps)
+
+def write_index(path: Path, idx: TotalsIndex) -> None:
+    stamps = json.dumps(idx.stamps, sort_keys=True, separators=(",", ":")).encode()
+    blob = _HEADER.pack(MAGIC, idx.base, len(idx.daily), len(stamps)) + stamps \
+        + idx.daily.astype("<i4").tobytes()
+    write_atomic(path, blob)
+
+def _month_span(key: str) -> tuple[int, int]:
+    y, m = int(key[:4]), int(key[5:7])
+    first = date(y, m, 1).toordinal()
+    return first, first + calendar.monthrange(y, m)[1]
+
+def _recount(repo, idx: TotalsIndex | None, months: list[str], stamps: dict) -> TotalsIndex:
+    """Recount `months` into `idx` (growing it as needed)."""
+    spans = [_month_span(k) for k in stamps] + [_month_span(k) for k in months]
+    if idx is not None and len(idx.daily):
+        spans.append((idx.base, idx.base + len(idx.daily)))
+    if not spans:
+        return _with_prefix(date.today().toordinal(), np.zeros(0, dtype=np.int32), {})
+    lo, hi = min(s for s, _ in spans), max(e for _, e in spans)
+
+    daily = np.zeros(hi - lo, dtype=np.int32)
+    if idx is not None and len(idx.daily):
+        daily[idx.base - lo: idx.base - lo + len(idx.daily)] = idx.daily
+    for key in months:
+        first, end = _month_span(key)
+        daily[first - lo: end - lo] = 0
+        by_day = repo.minutes_by(date.fromordinal(first).isoformat(),
+                                 date.fromordinal(end - 1).isoformat(), by="day")
+        for day_iso, minutes in by_day.items():
+            try:
+                daily[date.fromisoformat(day_iso).toordinal() - lo] = minutes
+            except ValueError:
+                log.warning("[totals] Skipping unparsable day %r", day_iso)
+    return _with_prefix(lo, daily, dict(stamps))
+
+@log_call()
+def load(repo) -> TotalsIndex:
+    """
+    The up-to-date index for `repo`, recounting only months whose change
+    marker moved and saving if anything changed.
+    """
+    path = index_path(repo)
+    with profiling.phase("totals"):
+        idx = read_index(path)
+        current = repo.month_stamps()
+        old = idx.stamps if idx is not None else {}
+        stale = sorted(k for k in set(current) | set(old) if current.get(k) != old.get(k))
+        if idx is not None and not stale:
+            return idx
+        log.debug("[totals] Recounting %d month(s)", len(stale))
+        idx = _recount(repo, idx, stale, current)
+        try:
+            write_index(path, idx)
+        except OSError as e:
+            # derived data: a read-only data dir just recounts next time
+            log.warning("[totals] Could not write %s: %s", path, e)
+    return idx
+
+@log_call()
+def refresh_month(repo, day_iso: str) -> None:
+    """
+    Recount the month containing `day_iso` after a write, leaving the rest
+    of the index untouched. Without an index yet, does nothing (the first
+    query builds it).
+    """
+    path = index_path(repo)
+    idx = read_index(path)
+    if idx is None:
+        return
+    key = str(day_iso)[:7]
+    stamps = dict(idx.stamps)
+    stamp = repo.month_stamp(int(key[:4]), int(key[5:7]))
+    if stamp is not None:
+        stamps[key] = stamp
+    else:
+        stamps.pop(key, None)
+    write_index(path, _recount(repo, idx, [key], stamps))
+
+def _slot(idx: TotalsIndex, day: date) -> int:
+    return min(max(day.toordinal() - idx.base, 0), len(idx.daily))
+
+def range_total(idx: TotalsIndex, start: date, end: date) -> int:
+    """Minutes logged from `start` to `end`, both inclusive."""
+    if end < start:
+        return 0
+    return int(idx.prefix[_slot(idx, end + timedelta(days=1))] - idx.prefix[_slot(idx, start)])
+
+def daily_series(idx: TotalsIndex, start: date, end: date) -> np.ndarray:
+    """Per-day minutes from `start` to `end` inclusive (zeros outside the index)."""
+    ords = np.arange(start.toordinal(), end.toordinal() + 1) - idx.base
+    out = np.zeros(len(ords), dtype=np.int64)
+    inside = (ords >= 0) & (ords < len(idx.daily))
+    out[inside] = idx.daily[ords[inside]]
+    return out
+
+def rolling_average(idx: TotalsIndex, window: int, end: date) -> float:
+    """Mean minutes per day over the `window` days ending at `end`."""
+    return range_total(idx, end - timedelta(days=window - 1), end) / window
+
+def period_sums(idx: TotalsIndex, start: date, end: date, period: str) -> dict[str, int]:
+    """
+    Totals per ISO week ("2025-W07"), month ("2025-02") or year, clipped to
+    [start, end].
+    """
+    if period not in PERIODS:
+        raise ValueError(f"period must be one of {PERIODS}, got {period!r}")
+    sums: dict[str, int] = {}
+    cur = start
+    while cur <= end:
+        if period == "week":
+            iso = cur.isocalendar()
+            label = f"{iso.year}-W{iso.week:02}"
+            nxt = cur + timedelta(days=7 - cur.weekday())
+        elif period == "month":
+            label = f"{cur.year}-{cur.month:02}"
+            nxt = date(cur.year + cur.month // 12, cur.month % 12 + 1, 1)
+        else:
+            label = str(cur.year)
+            nxt = date(cur.year + 1, 1, 1)
+        sums[label] = range_total(idx, cur, min(nxt - timedelta(days=1), end))
+        cur = nxt
+    return sums
+
+__all__ = [
+    "TotalsIndex", "daily_series", "load", "period_sums", "range_total",
+    "refresh_month", "rolling_average",
+]
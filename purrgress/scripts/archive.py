@@ -3,8 +3,11 @@ from __future__ import annotations
 import click
 import re
 from datetime import datetime
-from purrgress.utils import read_lines, write_lines
-from purrgress.utils.markdown import diff_preview
+from pathlib import Path
+from purrgress.utils import read_lines, rewrite
+from purrgress.utils.batch import expand_targets, manifest_path, run_parallel, summary_line
+from purrgress.utils.manifest import file_digest, load_manifest, save_manifest, text_digest
+from purrgress.utils.path import resolve_pathish
 from typing import List, Tuple
 
 # ------------------------------------------------------------------
@@ -108,28 +111,64 @@ def _flatten_blocks(blocks: List[List[str]]) -> List[str]:
     return flat
 
 
-@click.command(name="archive")
-@click.option("--src", default="docs/purrboard.md", show_default=True,
-              help="Active purrboard markdown file to sweep.")
-@click.option("--dst", default="docs/archived.md", show_default=True,
-              help="Archive destination file.")
-@click.option('-p', "--preview", is_flag=True,
-              help="Preview diff; do not modify files.")
-def archive(src: str, dst: str, preview: bool) -> None:
+def _sweep_source(src: Path) -> Tuple[List[str], List[str], List[List[str]]]:
+    """
+    Pull completed tasks out of one board's ACTIVE block.
+
+    Returns:
+        Tuple: (original lines, lines with tasks removed, archived task blocks)
+    """
     src_lines = read_lines(src)
     start, end = _find_block(src_lines, ACTIVE_START, ACTIVE_END)
     active_block = src_lines[start:end]
     remain_block, archived_blocks = _extract_completed_tasks(active_block)
+    new_src_lines = src_lines[:start] + remain_block + src_lines[end:]
+    return src_lines, new_src_lines, archived_blocks
 
-    archived_count = sum(1 for _ in archived_blocks)
+
+@click.command(name="archive")
+@click.option("--src", "srcs", multiple=True,
+              help="Active purrboard file, directory or glob to sweep "
+                   "(repeatable; default: docs/purrboard.md).")
+@click.option("--dst", default="docs/archived.md", show_default=True,
+              help="Archive destination file.")
+@click.option('-p', "--preview", is_flag=True,
+              help="Preview diff; do not modify files.")
+@click.option('-j', '--jobs', type=int, default=None,
+              help="Worker threads for multi-board runs.")
+@click.option('--force', is_flag=True,
+              help="Ignore the manifest and re-scan every board.")
+def archive(srcs: tuple[str], dst: str, preview: bool, jobs: int | None, force: bool) -> None:
+    dst_path = resolve_pathish(dst)
+    paths = [p for p in expand_targets(srcs or ("docs/purrboard.md",)) if p != dst_path]
+    manifest = {} if preview else load_manifest(manifest_path())
+
+    def _one(src: Path):
+        entry = manifest.get(f"archive:{src}")
+        if not force and entry is not None and entry.get("sha") == file_digest(src):
+            return src, None
+        return src, _sweep_source(src)
+
+    results = run_parallel(_one, paths, jobs)
+    swept = [(src, res) for src, res in results if res is not None and res[2]]
+    skipped = sum(1 for _, res in results if res is None)
+    archived_blocks = [blk for _, res in swept for blk in res[2]]
+    archived_count = len(archived_blocks)
+
+    if not preview:
+        for src, res in results:
+            if res is not None and not res[2]:
+                manifest[f"archive:{src}"] = {"sha": text_digest("".join(res[0]))}
 
     if archived_count == 0:
+        if not preview:
+            save_manifest(manifest_path(), manifest)
+        if len(paths) > 1:
+            click.echo(summary_line(0, len(paths) - skipped, skipped, "swept"))
         click.echo("😺 Nothing to archive. All clean!")
         return
 
-    new_src_lines = src_lines[:start] + remain_block + src_lines[end:]
-
-    dst_lines = read_lines(dst)
+    dst_lines = read_lines(dst_path)
     dst_lines = _ensure_archive_skeleton(dst_lines)
 
     ym = datetime.now().strftime("%Y-%m")
@@ -155,22 +194,25 @@ def archive(src: str, dst: str, preview: bool) -> None:
 
     if preview:
         click.echo("\n🐾 PREVIEW: SOURCE CHANGES\n" + "-"*32)
-        click.echo(
-            diff_preview(src_lines, new_src_lines,
-                        fromfile=f"{src} (orig)", tofile=f"{src} (new)")
-        )
+        for src, (src_lines, new_src_lines, _) in swept:
+            click.echo(rewrite(src, new_src_lines, original=src_lines,
+                               write=False, preview=True).diff)
 
         click.echo("\n🐾 PREVIEW: ARCHIVE CHANGES\n" + "-"*32)
-        click.echo(
-            diff_preview(dst_lines, new_dst_lines,
-                        fromfile=f"{dst} (orig)", tofile=f"{dst} (new)")
-        )
+        click.echo(rewrite(dst_path, new_dst_lines, original=dst_lines,
+                           write=False, preview=True, label=dst).diff)
         click.echo("\n💡 Use without --preview to apply.\n")
         return
 
-    write_lines(src, new_src_lines)
-    write_lines(dst, new_dst_lines)
+    for src, (_, new_src_lines, _) in swept:
+        rewrite(src, new_src_lines)
+        manifest[f"archive:{src}"] = {"sha": text_digest("".join(new_src_lines))}
+    rewrite(dst_path, new_dst_lines)
+    save_manifest(manifest_path(), manifest)
 
     archived_added = len(new_blocks_filtered)
     click.echo(f"📤 Archived {archived_added} items to {dst}")
-    click.echo(f"🧹 Removed {archived_count} items from {src}")
+    for src, (_, _, blocks) in swept:
+        click.echo(f"🧹 Removed {len(blocks)} items from {src}")
+    if len(paths) > 1:
+        click.echo(summary_line(len(swept), len(paths) - len(swept) - skipped, skipped, "swept"))
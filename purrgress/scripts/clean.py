@@ -1,23 +1,82 @@
 import click
 
 from pathlib import Path
-from purrgress.utils import read_lines, write_lines
-from purrgress.utils.text import clean_punctuation
-from purrgress.utils.path import resolve_pathish
+from purrgress.utils import profiling
+from purrgress.utils.batch import expand_targets, manifest_path, run_parallel, summary_line
+from purrgress.utils.load import atomic_open
+from purrgress.utils.manifest import file_digest, load_manifest, save_manifest
+from purrgress.utils.text import CHUNK_SIZE, clean_stream
+
+def clean_file(path: Path, write: bool, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Stream-clean one file; returns the number of replacements.
+
+    With `write`, a first read-only pass counts replacements so clean files
+    are never rewritten; dirty files are streamed into a temp file that is
+    renamed over the original. Without `write`, the cleaned text is streamed
+    to stdout.
+    """
+    if not write:
+        out = click.get_text_stream("stdout")
+        with path.open("r", encoding="utf-8", newline="") as src:
+            return clean_stream(src, out, chunk_size)
+
+    with profiling.phase("scan"), path.open("r", encoding="utf-8", newline="") as src:
+        count = clean_stream(src, None, chunk_size)
+    profiling.add_bytes(read=path.stat().st_size)
+    if count:
+        with profiling.phase("rewrite"), path.open("r", encoding="utf-8", newline="") as src, \
+                atomic_open(path, "w", newline="") as dst:
+            clean_stream(src, dst, chunk_size)
+        profiling.add_bytes(written=path.stat().st_size)
+    return count
 
 @click.command("clean")
 @click.argument("files", nargs=-1, type=str, required=True)
-@click.option("-w", "--write", is_flag=True, 
+@click.option("-w", "--write", is_flag=True,
               help="Overwrite the file(s) instead of printing.")
-def clean_cmd(files: tuple[str], write: bool) -> None:
-    for raw in files:
-        path: Path = resolve_pathish(raw)
+@click.option("-j", "--jobs", type=int, default=None,
+              help="Worker threads for multi-file runs.")
+@click.option("--force", is_flag=True,
+              help="Ignore the manifest and re-scan every file.")
+@click.option("--chunk-size", type=click.IntRange(min=1), default=CHUNK_SIZE, show_default=True,
+              help="Characters processed per streaming step.")
+def clean_cmd(files: tuple[str], write: bool, jobs: int | None, force: bool, chunk_size: int) -> None:
+    if files == ("-",):
+        stdin = click.get_text_stream("stdin")
+        count = clean_stream(stdin, click.get_text_stream("stdout"), chunk_size)
+        click.echo(f"🖊️ <stdin>: {count} replacement(s)", err=True)
+        return
+
+    paths = expand_targets(files)
+    if not write:
+        for path in paths:
+            count = clean_file(path, False, chunk_size)
+            click.echo(f"🖊️ {path}: {count} replacement(s)", err=True)
+        return
 
-        text = "".join(read_lines(path, missing_ok=False))
-        fixed = clean_punctuation(text)
+    manifest = load_manifest(manifest_path())
 
-        if write:
-            write_lines(path, [fixed])
-            click.secho(f"🖊️ scrubbed {path}", fg="green")
+    def _one(path: Path):
+        entry = manifest.get(f"clean:{path}")
+        if not force and entry is not None and entry.get("sha") == file_digest(path):
+            return None
+        return clean_file(path, True, chunk_size)
+
+    results = run_parallel(_one, paths, jobs)
+
+    updated = unchanged = skipped = 0
+    for path, count in zip(paths, results):
+        if count is None:
+            skipped += 1
+            continue
+        manifest[f"clean:{path}"] = {"sha": file_digest(path)}
+        if count:
+            updated += 1
+            click.secho(f"🖊️ scrubbed {path} ({count} replacement(s))", fg="green")
         else:
-            click.echo(fixed)
+            unchanged += 1
+
+    save_manifest(manifest_path(), manifest)
+    if len(paths) > 1:
+        click.echo(summary_line(updated, unchanged, skipped, "scrubbed"))
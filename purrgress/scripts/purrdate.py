@@ -1,56 +1,130 @@
 from __future__ import annotations
 
+import json
+from pathlib import Path
+from typing import List, Tuple
+
 import click
-from purrgress.utils import read_lines, write_lines
-from purrgress.utils.date import date_vars, anchored_date_lines
-from purrgress.utils.markdown import inject_tags, replace_anchored_blocks, diff_preview
+from purrgress.utils import profiling, read_lines, rewrite
+from purrgress.utils.batch import expand_targets, manifest_path, run_parallel, summary_line
+from purrgress.utils.date import date_context, date_vars, anchored_date_lines
+from purrgress.utils.manifest import file_digest, load_manifest, save_manifest, text_digest
+from purrgress.utils.markdown import substitute_lines
+
+_LIVE = "LAST_UPDATED"
+
+def purrdate_file(path: Path, tags: dict | None, anchors: dict | None) -> Tuple[List[str], List[str]]:
+    """
+    Compute the refreshed lines for one board in a single streaming pass.
+
+    Build `tags`/`anchors` once (see `date_context`) and reuse them across
+    every board in a batch.
+
+    Args:
+        path (Path): Markdown board.
+        tags (dict | None): `{{TAG}}` → value map, or None to skip tags.
+        anchors (dict | None): anchor key → line map, or None to skip anchors.
+
+    Returns:
+        Tuple[List[str], List[str]]: (original lines, updated lines)
+    """
+    original_lines = read_lines(path, missing_ok=False)
+    with profiling.phase("render"):
+        return original_lines, list(substitute_lines(original_lines, tags, anchors))
+
+def plog_lines() -> dict:
+    """`<!--PLOG-...-->` lines from the life log's cached summary; {} if unavailable."""
+    try:
+        from purrgress.plog.board import anchored_plog_lines
+
+        return anchored_plog_lines()
+    except Exception as e:
+        click.echo(f"⚠️  Skipping PLOG anchors: {e}")
+        return {}
 
 @click.command(name="purrdate")
-@click.option('-f', '--file', default="docs/purrboard.md", show_default=True,
-              help="Markdown file to update")
-@click.option('-p', '--preview', is_flag=True, 
+@click.argument("targets", nargs=-1)
+@click.option('-f', '--file', 'files', multiple=True,
+              help="Markdown file, directory or glob to update (repeatable; "
+                   "default: docs/purrboard.md)")
+@click.option('-p', '--preview', is_flag=True,
               help="Show changes without writing")
-@click.option('-w', '--write', is_flag=True, 
+@click.option('-w', '--write', is_flag=True,
               help="Actually write changes to file")
-@click.option('--tags-only', is_flag=True, 
+@click.option('--tags-only', is_flag=True,
               help="Only update {{TAGS}} blocks; skip anchors.")
-@click.option('--anchors-only', is_flag=True, 
-              help="Only update <!--DATE-XYZ--> anchors; skip {{TAGS}}")
+@click.option('--anchors-only', is_flag=True,
+              help="Only update <!--DATE-XYZ--> / <!--PLOG-XYZ--> anchors; skip {{TAGS}}")
+@click.option('-j', '--jobs', type=int, default=None,
+              help="Worker threads for multi-file runs.")
+@click.option('--force', is_flag=True,
+              help="Ignore the manifest and re-check every file.")
+@click.option('--no-plog', is_flag=True,
+              help="Leave <!--PLOG-XYZ--> anchors alone (don't read the life log).")
 
-def purrdate(file, preview, write, tags_only, anchors_only):
+def purrdate(targets, files, preview, write, tags_only, anchors_only, jobs, force, no_plog):
     if tags_only and anchors_only:
         click.echo("⚠️  --tags-only and --anchors-only given; nothing to do. Choose one.")
         return
-    
-    original_lines = read_lines(file, missing_ok=False)
-    original_text = "".join(original_lines)
 
-    if anchors_only:
-        updated_text = original_text
-        lines = original_text.splitlines(keepends=True)
-    else:
-        tags = date_vars()
-        updated_text = inject_tags(original_text, tags)
-        lines = updated_text.splitlines(keepends=True)
+    paths = expand_targets(targets + files or ("docs/purrboard.md",))
+    ctx = date_context()
+    tags = None if anchors_only else date_vars(ctx)
+    anchors = None if tags_only else anchored_date_lines(ctx)
+    plog = {} if tags_only or no_plog else plog_lines()
+    if anchors is not None:
+        anchors.update(plog)
 
-    if not tags_only:
-        lines = replace_anchored_blocks(lines, anchored_date_lines())
+    # the stamp covers every rendered value except the minute-precision
+    # LAST_UPDATED ones; files using those are never skipped instead
+    rendered = {k: v for k, v in {**(tags or {}), **(anchors or {})}.items() if _LIVE not in k}
+    stamp = text_digest(json.dumps(rendered, sort_keys=True, ensure_ascii=False))[:16]
+    manifest = load_manifest(manifest_path()) if write else {}
+
+    def _skip(path: Path) -> bool:
+        entry = manifest.get(f"purrdate:{path}")
+        return (not force and entry is not None and not entry.get("live")
+                and entry.get("stamp") == stamp and entry.get("sha") == file_digest(path))
+
+    def _one(path: Path):
+        if _skip(path):
+            return None
+        original_lines, lines = purrdate_file(path, tags, anchors)
+        res = rewrite(path, lines, original=original_lines, write=write,
+                      preview=preview or not write)
+        return res, text_digest("".join(lines)), any(_LIVE in line for line in original_lines)
+
+    results = run_parallel(_one, paths, jobs)
+
+    updated = unchanged = skipped = 0
+    for path, out in zip(paths, results):
+        if out is None:
+            skipped += 1
+            continue
+        res, sha, live = out
+        if res.changed:
+            updated += 1
+        else:
+            unchanged += 1
+        if write:
+            manifest[f"purrdate:{path}"] = {"sha": sha, "stamp": stamp, "live": live}
 
     if preview or not write:
         click.echo("\n🐈  Preview of Changes\n" + "-" * 40)
-        click.echo(
-            diff_preview(
-                original_lines,
-                lines,
-                fromfile=f"{file} (orig)",
-                tofile=f"{file} (new)",
-            )
-        )
-        if not write:
-            click.echo("\n💡 Use --write to apply changes.\n")
-            return
-        
-    write_lines(file, lines)
-    click.echo(f"😸 Updated: {file}")
-
-__all__ = ["purrdate"]
\ No newline at end of file
+        click.echo("\n".join(out[0].diff for out in results if out and out[0].diff))
+
+    if write:
+        save_manifest(manifest_path(), manifest)
+        for out in results:
+            if out and out[0].written:
+                click.echo(f"😸 Updated: {out[0].path}")
+        if len(paths) == 1 and not updated:
+            click.echo(f"😺 Already up to date: {paths[0]}")
+
+    if len(paths) > 1:
+        click.echo(summary_line(updated, unchanged, skipped,
+                                "updated" if write else "would change"))
+    if not write:
+        click.echo("\n💡 Use --write to apply changes.\n")
+
+__all__ = ["plog_lines", "purrdate", "purrdate_file"]
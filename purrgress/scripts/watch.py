@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import time
+from datetime import date
+from pathlib import Path
+from typing import Callable, Iterable, List, NamedTuple
+
+import click
+from purrgress.scripts.archive import ACTIVE_END, ACTIVE_START, DONE_BULLET_RE, archive
+from purrgress.scripts.purrdate import plog_lines
+from purrgress.utils import read_lines, rewrite
+from purrgress.utils.batch import expand_targets, manifest_path
+from purrgress.utils.date import anchored_date_lines, date_context, date_vars
+from purrgress.utils.manifest import load_manifest, save_manifest
+from purrgress.utils.markdown import substitute_lines
+from purrgress.utils.path import resolve_pathish
+
+WATCH_DAY = "watch:@day"
+
+class Markers(NamedTuple):
+    """What a board needs from purrdate/archive, parsed once per file version."""
+    stamp: list          # [mtime_ns, size] the positions belong to
+    anchors: list        # [line index, anchor key] per `<!--KEY-->` line
+    done: int            # completed tasks inside the ACTIVE block
+    tags: bool           # has `{{...}}` tokens
+
+def stamp_of(path: Path) -> list | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+def scan_markers(lines: List[str], stamp: list) -> Markers:
+    """Anchor positions, completed-task count and token presence in one pass."""
+    anchors, done, tags, active = [], 0, False, False
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped == ACTIVE_START:
+            active = True
+        elif stripped == ACTIVE_END:
+            active = False
+        elif stripped.startswith("<!--") and stripped.endswith("-->"):
+            key = stripped.strip("<!-->").strip()
+            if key and " " not in key:
+                anchors.append([i, key])
+        elif active and DONE_BULLET_RE.match(line):
+            done += 1
+        if not tags and "{{" in line:
+            tags = True
+    return Markers(stamp, anchors, done, tags)
+
+def refresh_anchors(lines: List[str], markers: Markers, anchors: dict) -> List[str]:
+    """
+    Re-render anchored `<sub>` lines at their cached positions; falls back
+    to a full `substitute_lines` pass if the positions no longer match.
+    """
+    out = list(lines)
+    for i, key in reversed(markers.anchors):
+        if key not in anchors:
+            continue
+        if i >= len(out) or out[i].strip().strip("<!-->").strip() != key:
+            return list(substitute_lines(lines, anchors=anchors))
+        value = anchors[key] + "\n"
+        if i + 1 < len(out) and out[i + 1].lstrip().startswith("<sub>"):
+            out[i + 1] = value
+        else:
+            out.insert(i + 1, value)
+    return out
+
+class Watcher:
+    """
+    Poll board files and keep them fresh without re-running whole batches.
+
+    * A file is handled once its (mtime, size) has been stable for
+      `debounce` seconds, so a burst of saves is one refresh.
+    * A changed file gets its tokens and anchors refreshed and, if its
+      ACTIVE block holds completed tasks, is archived (`on_archive`).
+    * Unchanged files are only touched when the date rolls over, and only
+      those with anchors; their anchor lines come from the cached positions.
+
+    Marker positions are cached per file version in the purg manifest
+    (`watch:<path>`), so a restarted watcher skips files it already knows.
+
+    Args:
+        targets (Iterable[str]): Files, directories or globs (re-expanded each poll).
+        exclude (Iterable[Path]): Paths never handled (e.g. the archive file).
+        on_archive (Callable | None): Called with the boards to archive.
+        plog (bool): Include `<!--PLOG-...-->` anchors.
+        debounce (float): Seconds a file must stay unchanged.
+        clock (Callable[[], float]): Monotonic time source.
+        today (Callable[[], date]): Date source.
+        echo (Callable[[str], None]): Progress output.
+    """
+
+    def __init__(self, targets: Iterable[str], *, exclude: Iterable[Path] = (),
+                 on_archive: Callable[[List[Path]], None] | None = None, plog: bool = True,
+                 debounce: float = 1.0, clock: Callable[[], float] = time.monotonic,
+                 today: Callable[[], date] = date.today, echo: Callable[[str], None] = click.echo):
+        self.targets = tuple(targets)
+        self.exclude = set(exclude)
+        self.on_archive = on_archive
+        self.plog = plog
+        self.debounce = debounce
+        self.clock = clock
+        self.today = today
+        self.echo = echo
+        manifest = load_manifest(manifest_path())
+        self.markers: dict[Path, Markers] = {
+            Path(k[len("watch:"):]): Markers(**v) for k, v in manifest.items()
+            if k.startswith("watch:") and k != WATCH_DAY and isinstance(v, dict)
+        }
+        self.day = (manifest.get(WATCH_DAY) or {}).get("day")
+        self._pending: dict[Path, tuple[list, float]] = {}
+
+    def paths(self) -> List[Path]:
+        return [p for p in expand_targets(self.targets) if p not in self.exclude]
+
+    def _values(self) -> tuple[dict, dict]:
+        ctx = date_context(self.today())
+        anchors = anchored_date_lines(ctx)
+        if self.plog:
+            anchors.update(plog_lines())
+        return date_vars(ctx), anchors
+
+    def tick(self) -> List[Path]:
+        """
+        One poll: handle settled changes and a date rollover.
+
+        Returns:
+            List[Path]: Files rewritten or archived this tick.
+        """
+        now = self.clock()
+        settled = []
+        live = set()
+        for path in self.paths():
+            stamp = stamp_of(path)
+            if stamp is None:
+                continue
+            live.add(path)
+            known = self.markers.get(path)
+            if known is not None and known.stamp == stamp:
+                self._pending.pop(path, None)
+                continue
+            seen = self._pending.get(path)
+            if seen is None or seen[0] != stamp:
+                self._pending[path] = (stamp, now)
+            elif now - seen[1] >= self.debounce:
+                settled.append(path)
+        for path in set(self.markers) - live:
+            if not path.exists():
+                del self.markers[path]
+
+        rollover = self.today().isoformat() != self.day
+        if not settled and not rollover:
+            return []
+
+        tags, anchors = self._values()
+        touched, to_archive = [], []
+        for path in settled:
+            del self._pending[path]
+            lines = read_lines(path)
+            markers = scan_markers(lines, stamp_of(path))
+            if markers.tags or markers.anchors:
+                if rewrite(path, list(substitute_lines(lines, tags, anchors)), original=lines).written:
+                    touched.append(path)
+            if markers.done and self.on_archive is not None:
+                to_archive.append(path)
+            self._rescan(path)
+
+        if rollover:
+            for path, markers in list(self.markers.items()):
+                if path not in live or path in settled or path in self._pending or not markers.anchors:
+                    continue
+                lines = read_lines(path)
+                if rewrite(path, refresh_anchors(lines, markers, anchors), original=lines).written:
+                    touched.append(path)
+                    self._rescan(path)
+            self.day = self.today().isoformat()
+
+        if to_archive:
+            self.on_archive(to_archive)
+            for path in to_archive:
+                self._rescan(path)
+            touched.extend(p for p in to_archive if p not in touched)
+        self._save()
+        for path in touched:
+            self.echo(f"😸 Refreshed: {path}")
+        return touched
+
+    def _rescan(self, path: Path) -> None:
+        """Record the file as it is now, so our own write isn't seen as an edit."""
+        stamp = stamp_of(path)
+        if stamp is not None:
+            self.markers[path] = scan_markers(read_lines(path), stamp)
+
+    def _save(self) -> None:
+        manifest = load_manifest(manifest_path())
+        manifest = {k: v for k, v in manifest.items() if not k.startswith("watch:")}
+        manifest.update({f"watch:{p}": m._asdict() for p, m in self.markers.items()})
+        manifest[WATCH_DAY] = {"day": self.day}
+        save_manifest(manifest_path(), manifest)
+
+    def run(self, interval: float = 2.0, once: bool = False) -> None:
+        """Poll every `interval` seconds until interrupted (or one settled pass with `once`)."""
+        if once:
+            self.debounce = 0
+            self.tick()
+            self.tick()
+            return
+        while True:
+            self.tick()
+            time.sleep(interval)
+
+@click.command(name="watch")
+@click.argument("targets", nargs=-1)
+@click.option('-f', '--file', 'files', multiple=True,
+              help="Board file, directory or glob to watch (repeatable; "
+                   "default: docs/purrboard.md)")
+@click.option("--dst", default="docs/archived.md", show_default=True,
+              help="Archive destination file.")
+@click.option("--no-archive", is_flag=True,
+              help="Only refresh tokens/anchors; never archive.")
+@click.option("--no-plog", is_flag=True,
+              help="Leave <!--PLOG-XYZ--> anchors alone (don't read the life log).")
+@click.option("-i", "--interval", type=float, default=2.0, show_default=True,
+              help="Seconds between polls.")
+@click.option("--debounce", type=float, default=1.0, show_default=True,
+              help="Seconds a file must stay unchanged before it is handled.")
+@click.option("--once", is_flag=True,
+              help="Handle pending changes / a date rollover once and exit (cron-friendly).")
+@click.pass_context
+def watch(ctx, targets, files, dst, no_archive, no_plog, interval, debounce, once):
+    """
+    Keep boards fresh from one long-running process: edited boards get
+    purrdate + archive, anchors are re-rendered when the date rolls over.
+    """
+    dst_path = resolve_pathish(dst)
+
+    def _archive(paths: List[Path]) -> None:
+        ctx.invoke(archive, srcs=tuple(str(p) for p in paths), dst=dst,
+                   preview=False, jobs=None, force=True)
+
+    watcher = Watcher(targets + files or ("docs/purrboard.md",), exclude=[dst_path],
+                      on_archive=None if no_archive else _archive, plog=not no_plog,
+                      debounce=debounce)
+    if not once:
+        click.echo(f"👀 Watching {len(watcher.paths())} board(s) every {interval:g}s (Ctrl-C to stop)")
+    try:
+        watcher.run(interval, once=once)
+    except KeyboardInterrupt:
+        click.echo("\n🐾 Stopped watching.")
+
+__all__ = ["Markers", "Watcher", "refresh_anchors", "scan_markers", "watch"]
@@ -1,4 +1,4 @@
-from purrgress.utils.load import read_lines, write_lines
+from purrgress.utils.load import read_lines, rewrite, write_lines
 from purrgress.utils.logutils import log_call
 
-__all__ = ["read_lines", "write_lines", "log_call"]
\ No newline at end of file
+__all__ = ["read_lines", "rewrite", "write_lines", "log_call"]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, List, TypeVar
+
+from purrgress.utils.path import resolve_pathish
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+PURG_MANIFEST = ".purg-manifest.json"
+
+def manifest_path() -> Path:
+    """Where purg keeps its content-hash manifest (`PURG_MANIFEST` env overrides)."""
+    return resolve_pathish(os.getenv("PURG_MANIFEST") or PURG_MANIFEST)
+
+def expand_targets(targets: Iterable[str], suffix: str = ".md") -> List[Path]:
+    """
+    Turn files, directories and glob patterns into a sorted, de-duplicated
+    list of file paths.
+
+    Directories are walked recursively for files ending in `suffix`;
+    glob patterns (`docs/**/*.md`) are expanded relative to the repo root
+    unless absolute. Plain paths are passed through even if missing so the
+    caller can report them.
+
+    Args:
+        targets (Iterable[str]): Raw CLI arguments.
+        suffix (str): File suffix picked up when walking directories.
+
+    Returns:
+        List[Path]: Absolute file paths in stable order.
+    """
+    seen: dict[Path, None] = {}
+    for raw in targets:
+        p = resolve_pathish(raw)
+        if any(ch in str(raw) for ch in "*?["):
+            for hit in sorted(glob.glob(str(p), recursive=True)):
+                hp = Path(hit)
+                if hp.is_file():
+                    seen.setdefault(hp.resolve(), None)
+        elif p.is_dir():
+            for hp in sorted(p.rglob(f"*{suffix}")):
+                if hp.is_file():
+                    seen.setdefault(hp.resolve(), None)
+        else:
+            seen.setdefault(p, None)
+    return list(seen)
+
+def run_parallel(func: Callable[[T], R], items: Iterable[T], jobs: int | None = None) -> List[R]:
+    """
+    Map `func` over `items` on a thread pool, keeping input order.
+
+    A single item (or `jobs == 1`) runs inline so the common one-board case
+    pays no pool start-up cost.
+    """
+    items = list(items)
+    if jobs is None:
+        jobs = min(8, (os.cpu_count() or 1) + 4)
+    if len(items) <= 1 or jobs <= 1:
+        return [func(it) for it in items]
+    with ThreadPoolExecutor(max_workers=min(jobs, len(items))) as pool:
+        return list(pool.map(func, items))
+
+def summary_line(updated: int, unchanged: int, skipped: int, verb: str = "updated") -> str:
+    """One-line aggregate used by the multi-file purg commands."""
+    total = updated + unchanged + skipped
+    return (f"🐾 {total} file(s): {updated} {verb}, {unchanged} unchanged, "
+            f"{skipped} skipped (manifest)")
+
+__all__ = ["expand_targets", "run_parallel", "summary_line", "manifest_path", "PURG_MANIFEST"]
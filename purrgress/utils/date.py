@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import os
+import re
 from datetime import date, datetime, timedelta
 from logging import getLogger
 from zoneinfo import ZoneInfo
@@ -7,30 +10,48 @@ from purrgress.utils import log_call
 
 log = getLogger("plog")
 
-def date_vars() -> dict:
-    today = date.today()
+def date_context(today: date | None = None, stamp: datetime | None = None) -> dict:
+    """
+    Compute every date string the board tokens need, once per run.
+
+    Args:
+        today (date | None): Day to render (default: today).
+        stamp (datetime | None): "Last updated" moment (default: now).
+
+    Returns:
+        dict: Pre-formatted pieces shared by `date_vars` and `anchored_date_lines`.
+    """
+    stamp = stamp or datetime.now()
+    today = today or stamp.date()
 
     week_start = today - timedelta(days=today.isoweekday() - 1)
     week_end   = week_start + timedelta(days=6)
 
     return {
-        '{{DATE_TODAY}}': date.today().strftime('%d-%m-%Y'),
-        '{{DATE_WEEK}}': date.today().strftime('%G-W%V'),
-        '{{DATE_WEEK_RANGE}}' : f'{week_start:%d %b} → {week_end:%d %b}',
-        '{{DATE_MONTH}}': date.today().strftime('%B %Y'),
-        '{{LAST_UPDATED}}': datetime.now().strftime('%d-%m-%Y %H:%M'),
+        "today": today.strftime('%d-%m-%Y'),
+        "week": today.strftime('%G-W%V'),
+        "week_range": f'{week_start:%d %b} → {week_end:%d %b}',
+        "month": today.strftime('%B %Y'),
+        "updated": stamp.strftime('%d-%m-%Y %H:%M'),
     }
 
-def anchored_date_lines() -> dict:
-    today = date.today()
-    week_start = today - timedelta(days=today.isoweekday() - 1)
-    week_end   = week_start + timedelta(days=6)
+def date_vars(ctx: dict | None = None) -> dict:
+    ctx = ctx or date_context()
+    return {
+        '{{DATE_TODAY}}': ctx["today"],
+        '{{DATE_WEEK}}': ctx["week"],
+        '{{DATE_WEEK_RANGE}}' : ctx["week_range"],
+        '{{DATE_MONTH}}': ctx["month"],
+        '{{LAST_UPDATED}}': ctx["updated"],
+    }
 
+def anchored_date_lines(ctx: dict | None = None) -> dict:
+    ctx = ctx or date_context()
     return {
-        'DATE-LAST_UPDATED': f'<sub><em>Last updated: {datetime.now().strftime("%d-%m-%Y %H:%M")}</em></sub>',
-        'DATE-TODAY': f'<sub><em>{today.strftime("%d-%m-%Y")}</em></sub>',
-        'DATE-WEEK': f'<sub><em>{today.strftime("%G-W%V")}: {week_start:%d %b} → {week_end:%d %b}</em></sub>',
-        'DATE-MONTH': f'<sub><em>{today.strftime("%B %Y")}</em></sub>',
+        'DATE-LAST_UPDATED': f'<sub><em>Last updated: {ctx["updated"]}</em></sub>',
+        'DATE-TODAY': f'<sub><em>{ctx["today"]}</em></sub>',
+        'DATE-WEEK': f'<sub><em>{ctx["week"]}: {ctx["week_range"]}</em></sub>',
+        'DATE-MONTH': f'<sub><em>{ctx["month"]}</em></sub>',
     }
 
 @log_call()
@@ -69,6 +90,19 @@ def today_iso(tz_arg: str | None = None) -> str:
     today = now(tz_arg).date().isoformat()
     return today
 
+def fmt_duration(minutes: int) -> str:
+    """Minutes as "1h05m"."""
+    h, m = divmod(int(minutes), 60)
+    return f"{h}h{m:02d}m"
+
+def month_keys(start: date, end: date) -> list[str]:
+    """"YYYY-MM" of every month from `start` to `end` (inclusive)."""
+    keys, cur = [], start.replace(day=1)
+    while cur <= end:
+        keys.append(f"{cur.year:04}-{cur.month:02}")
+        cur = (cur + timedelta(days=32)).replace(day=1)
+    return keys
+
 @log_call()
 def minutes_between(start_hm: str, end_hm: str) -> int:
     """
@@ -84,4 +118,36 @@ def minutes_between(start_hm: str, end_hm: str) -> int:
         log.debug("[minutes_between] end_hm < start_hm; rolling over midnight")
         e += timedelta(days=1)
     mins = int((e - s).total_seconds() // 60)
-    return mins
\ No newline at end of file
+    return mins
+
+_HM_RE = re.compile(r"(\d{1,2}):(\d{1,2})")
+
+def parse_hm(hm: str) -> int | None:
+    """
+    "HH:MM" → minutes since midnight, or None if it isn't a valid time.
+    Accepts the same strings as `strptime(hm, "%H:%M")`.
+    """
+    m = _HM_RE.fullmatch(hm)
+    if not m:
+        return None
+    h, mm = int(m.group(1)), int(m.group(2))
+    if h > 23 or mm > 59:
+        return None
+    return h * 60 + mm
+
+def parse_span(span) -> tuple[int, int] | None:
+    """
+    "HH:MM-HH:MM" → (start, end) minutes, end > start when the span rolls
+    past midnight (e.g. "23:30-00:15" → (1410, 1455)). Malformed spans → None.
+    """
+    if not isinstance(span, str):
+        return None
+    parts = span.split("-")
+    if len(parts) != 2:
+        return None
+    s, e = parse_hm(parts[0]), parse_hm(parts[1])
+    if s is None or e is None:
+        return None
+    if e < s:
+        e += 24 * 60
+    return s, e
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
+from purrgress.utils import profiling
+from purrgress.utils.markdown import diff_preview
 from purrgress.utils.path import resolve_pathish
-from typing import Iterable, List, Union
+from typing import IO, Iterable, Iterator, List, NamedTuple, Union
 
 Pathish = Union[str, Path]
 
+class Rewrite(NamedTuple):
+    """Outcome of `rewrite()` for one file."""
+    path: Path
+    changed: bool
+    written: bool
+    diff: str
+
 def read_lines(pathish: Pathish, missing_ok: bool = True, encoding: str = "utf-8") -> List[str]:
     p = resolve_pathish(pathish)
     try:
         with p.open("r", encoding=encoding) as f:
-            return f.readlines()
+            with profiling.phase("read"):
+                lines = f.readlines()
+            if profiling.active():
+                profiling.add_bytes(read=os.fstat(f.fileno()).st_size)
+            return lines
     except FileNotFoundError:
         if missing_ok:
             return []
@@ -23,4 +39,85 @@ def write_lines(pathish: Pathish, lines: Iterable[str], encoding: str = "utf-8")
         for ln in lines:
             f.write(ln)
 
-__all__ = ["read_lines", "write_lines"]
+@contextmanager
+def atomic_open(pathish: Pathish, mode: str = "w", encoding: str | None = "utf-8",
+                newline: str | None = None) -> Iterator[IO]:
+    """
+    Open a temp file next to `pathish` for writing; on a clean exit it is
+    fsynced and renamed over the target (old mode bits kept), on error it
+    is removed and the target is left untouched.
+    """
+    p = resolve_pathish(pathish)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{p.name}.", suffix=".tmp", dir=p.parent)
+    try:
+        if "b" in mode:
+            f = os.fdopen(fd, mode)
+        else:
+            f = os.fdopen(fd, mode, encoding=encoding, newline=newline)
+        with f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, p.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, p)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+def write_atomic(pathish: Pathish, data: bytes) -> None:
+    """Replace a file's contents atomically (see `atomic_open`)."""
+    with profiling.phase("write"), atomic_open(pathish, "wb") as f:
+        f.write(data)
+    profiling.add_bytes(written=len(data))
+
+def rewrite(pathish: Pathish, lines: Iterable[str], *, original: List[str] | None = None,
+            write: bool = True, preview: bool = False, label: str | None = None,
+            encoding: str = "utf-8") -> Rewrite:
+    """
+    Write `lines` to a file only if its bytes would change.
+
+    Args:
+        pathish (Pathish): Target file.
+        lines (Iterable[str]): New content.
+        original (List[str] | None): Lines as previously read (for the diff);
+            re-read from disk when omitted.
+        write (bool): Actually replace the file (atomically) when it changed.
+        preview (bool): Build a unified diff over the changed regions.
+        label (str | None): Name shown in the diff header (default: the path).
+        encoding (str): Text encoding.
+
+    Returns:
+        Rewrite: (path, changed, written, diff)
+    """
+    p = resolve_pathish(pathish)
+    lines = list(lines)
+    new_bytes = "".join(lines).encode(encoding)
+    try:
+        old_bytes = p.read_bytes()
+    except FileNotFoundError:
+        old_bytes = None
+
+    if old_bytes == new_bytes:
+        return Rewrite(p, False, False, "")
+
+    diff = ""
+    if preview:
+        if original is None:
+            original = read_lines(p)
+        name = label or str(pathish)
+        with profiling.phase("diff"):
+            diff = diff_preview(original, lines,
+                                fromfile=f"{name} (orig)", tofile=f"{name} (new)")
+
+    if write:
+        write_atomic(p, new_bytes)
+    return Rewrite(p, True, write, diff)
+
+__all__ = ["read_lines", "write_lines", "atomic_open", "write_atomic", "rewrite", "Rewrite"]
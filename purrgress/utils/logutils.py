@@ -19,34 +19,52 @@ def my_cli_command():
 import functools
 import inspect
 import logging
+import reprlib
+
+_REPR = reprlib.Repr()
+_REPR.maxstring = _REPR.maxother = 120
+_REPR.maxlist = _REPR.maxdict = _REPR.maxtuple = _REPR.maxset = 12
+_REPR.maxlevel = 4
 
 
 def log_call(level=logging.DEBUG):
     """
     Decorator: log entry (and exit) with args/kwargs at chosen level.
-    Skips string-building unless the logger is enabled for `level`.
+    Skips string-building unless the logger is enabled for `level`. When it
+    is, arguments and the result are rendered (size-limited, via `reprlib`)
+    on the calling thread, so the record shows them as they were at call
+    time even if a queue handler (see `plog.log_setup`) formats it later.
     """
 
     def decorator(func):
         log = logging.getLogger(func.__module__)
+        sig = inspect.signature(func)
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             if log.isEnabledFor(level):
-                bound = inspect.signature(func).bind_partial(*args, **kwargs)
-                bound.apply_defaults()
-                log.log(level, "%s(%s)", func.__name__, _fmt_params(bound.arguments))
+                log.log(level, "%s(%s)", func.__name__, _bind_params(sig, args, kwargs))
             result = func(*args, **kwargs)
             if log.isEnabledFor(level):
-                log.log(level, "%s -> %r", func.__name__, result)
+                log.log(level, "%s -> %s", func.__name__, _REPR.repr(result))
             return result
 
         return wrapper
 
     return decorator
 
+def _bind_params(sig, args, kwargs) -> str:
+    """Bind call arguments to the signature and render them as text."""
+    try:
+        bound = sig.bind_partial(*args, **kwargs)
+    except TypeError:
+        # the call itself is about to fail; still log what was passed
+        return _fmt_params({**dict(enumerate(args)), **kwargs})
+    bound.apply_defaults()
+    return _fmt_params(bound.arguments)
+
 def _fmt_params(params: dict) -> str:
     """
-    Compact k=v, k2=v2 … string for logging.
+    Compact k=v, k2=v2 … string for logging (long values are truncated).
     """
-    return ", ".join(f"{k}={v!r}" for k, v in params.items())
+    return ", ".join(f"{k}={_REPR.repr(v)}" for k, v in params.items())
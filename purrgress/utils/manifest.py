@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Union
+
+from purrgress.utils.path import resolve_pathish
+
+Pathish = Union[str, Path]
+
+def file_digest(pathish: Pathish) -> str:
+    """
+    sha256 of a file's bytes, or "" if the file does not exist.
+    """
+    p = resolve_pathish(pathish)
+    try:
+        return hashlib.sha256(p.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+def text_digest(text: str, encoding: str = "utf-8") -> str:
+    """sha256 of `text` as it would be written to disk."""
+    return hashlib.sha256(text.encode(encoding)).hexdigest()
+
+def modules_digest(*modules) -> str:
+    """
+    Short fingerprint of the source files of `modules`, for caches whose
+    output depends on that code.
+    """
+    return text_digest(":".join(file_digest(m.__file__) for m in modules))[:32]
+
+def load_manifest(pathish: Pathish) -> dict:
+    """
+    Read a JSON manifest; a missing or corrupt file is an empty manifest.
+    """
+    p = resolve_pathish(pathish)
+    try:
+        data = json.loads(p.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def save_manifest(pathish: Pathish, data: dict) -> None:
+    """
+    Write a JSON manifest atomically (temp file + rename).
+    """
+    p = resolve_pathish(pathish)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_name(f".{p.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, p)
+
+__all__ = ["file_digest", "text_digest", "modules_digest", "load_manifest", "save_manifest"]
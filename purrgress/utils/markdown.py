@@ -1,37 +1,222 @@
+from __future__ import annotations
+
 import difflib
+import re
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator
+
+@lru_cache(maxsize=32)
+def _tag_pattern(keys: tuple[str, ...]) -> re.Pattern:
+    """One alternation over every tag, longest first so prefixes never win."""
+    return re.compile("|".join(map(re.escape, sorted(keys, key=len, reverse=True))))
+
+def compile_tags(tags: dict) -> Callable[[str], str]:
+    """
+    Build a single-pass substituter for `{{TAG}}` tokens.
+
+    Args:
+        tags (dict): Token → replacement map (e.g. from `date_vars()`).
+
+    Returns:
+        Callable[[str], str]: Function replacing every token in one regex scan.
+    """
+    if not tags:
+        return lambda text: text
+    pattern = _tag_pattern(tuple(tags))
+    lookup = tags.__getitem__
+    return lambda text: pattern.sub(lambda m: lookup(m.group()), text) if "{{" in text else text
+
+def substitute_lines(lines: Iterable[str], tags: dict | None = None,
+                     anchors: dict | None = None) -> Iterator[str]:
+    """
+    Stream `lines` once, injecting tags and refreshing anchored blocks.
+
+    An anchor is a comment line such as `<!--DATE-TODAY-->` whose key is in
+    `anchors`; the `<sub>` line right after it (if any) is replaced by the
+    anchor's value. Works on any line iterable, including an open file.
+
+    Args:
+        lines (Iterable[str]): Source lines (with line endings).
+        tags (dict | None): `{{TAG}}` map, or None to leave tags alone.
+        anchors (dict | None): anchor key → replacement line, or None.
+
+    Yields:
+        str: Updated lines.
+    """
+    sub = compile_tags(tags or {})
+    anchors = anchors or {}
+    pending = None
+
+    for line in lines:
+        line = sub(line)
+        if pending is not None:
+            yield pending
+            pending = None
+            if line.lstrip().startswith("<sub>"):
+                continue
+        if anchors and "<!--" in line:
+            stripped = line.strip()
+            if stripped.startswith("<!--"):
+                key = stripped.strip("<!-->").strip()
+                if key in anchors:
+                    pending = anchors[key] + "\n"
+        yield line
+
+    if pending is not None:
+        yield pending
 
 def inject_tags(text: str, tags: dict) -> str:
-    for k, v in tags.items():
-        text = text.replace(k, v)
-    return text
+    return compile_tags(tags)(text)
 
 def replace_anchored_blocks(lines: list[str], anchors: dict) -> list[str]:
-    output = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if line.strip().startswith("<!--DATE-"):
-            anchor_key = line.strip().strip("<!-->").strip()
-            if anchor_key in anchors:
-                output.append(line) 
-                i += 1 
-                if i < len(lines) and lines[i].strip().startswith("<sub>"):
-                    i += 1 
-                output.append(anchors[anchor_key] + "\n") 
-                continue
-        output.append(line)
-        i += 1
-    return output
+    return list(substitute_lines(lines, anchors=anchors))
+
+def _unique_anchors(a: list[str], b: list[str], alo: int, ahi: int, blo: int, bhi: int) -> list[tuple[int, int]]:
+    """
+    Lines occurring exactly once on each side, kept in increasing order on
+    both sides (longest increasing subsequence) - the patience-diff anchors.
+    """
+    seen_a: dict[str, int] = {}
+    for i in range(alo, ahi):
+        seen_a[a[i]] = -1 if a[i] in seen_a else i
+    seen_b: dict[str, int] = {}
+    for j in range(blo, bhi):
+        seen_b[b[j]] = -1 if b[j] in seen_b else j
+
+    pairs = [(i, seen_b[ln]) for ln, i in seen_a.items()
+             if i >= 0 and seen_b.get(ln, -1) >= 0]
+    pairs.sort()
+
+    tails: list[int] = []
+    tails_idx: list[int] = []
+    prev: list[int] = [-1] * len(pairs)
+    for k, (_, j) in enumerate(pairs):
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if tails[mid] < j:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(tails):
+            tails.append(j)
+            tails_idx.append(k)
+        else:
+            tails[lo] = j
+            tails_idx[lo] = k
+        prev[k] = tails_idx[lo - 1] if lo else -1
+
+    out: list[tuple[int, int]] = []
+    k = tails_idx[-1] if tails_idx else -1
+    while k >= 0:
+        out.append(pairs[k])
+        k = prev[k]
+    return out[::-1]
+
+def _anchored_opcodes(a: list[str], b: list[str]) -> list[tuple[str, int, int, int, int]]:
+    """
+    difflib-style opcodes computed only over changed regions.
+
+    The common prefix/suffix is trimmed, unique lines anchor the rest, and
+    `SequenceMatcher` only ever sees the small gaps between anchors, so the
+    cost tracks the size of the edit rather than the size of the board.
+    """
+    n, m = len(a), len(b)
+    pre = 0
+    while pre < n and pre < m and a[pre] == b[pre]:
+        pre += 1
+    suf = 0
+    while suf < n - pre and suf < m - pre and a[n - 1 - suf] == b[m - 1 - suf]:
+        suf += 1
+
+    ops: list[tuple[str, int, int, int, int]] = []
+
+    def emit(tag, i1, i2, j1, j2):
+        if i1 == i2 and j1 == j2:
+            return
+        if ops and ops[-1][0] == tag:
+            _, pi1, _, pj1, _ = ops[-1]
+            ops[-1] = (tag, pi1, i2, pj1, j2)
+        else:
+            ops.append((tag, i1, i2, j1, j2))
+
+    def gap(i1, i2, j1, j2):
+        if i1 == i2 and j1 == j2:
+            return
+        if i1 == i2:
+            emit("insert", i1, i2, j1, j2)
+        elif j1 == j2:
+            emit("delete", i1, i2, j1, j2)
+        else:
+            sm = difflib.SequenceMatcher(None, a[i1:i2], b[j1:j2], autojunk=False)
+            for tag, x1, x2, y1, y2 in sm.get_opcodes():
+                emit(tag, i1 + x1, i1 + x2, j1 + y1, j1 + y2)
+
+    emit("equal", 0, pre, 0, pre)
+    i, j = pre, pre
+    for ai, bj in _unique_anchors(a, b, pre, n - suf, pre, m - suf):
+        gap(i, ai, j, bj)
+        emit("equal", ai, ai + 1, bj, bj + 1)
+        i, j = ai + 1, bj + 1
+    gap(i, n - suf, j, m - suf)
+    emit("equal", n - suf, n, m - suf, m)
+    return ops
+
+def _grouped(ops: list[tuple[str, int, int, int, int]], n: int = 3):
+    """Same grouping rules as `SequenceMatcher.get_grouped_opcodes`."""
+    if not ops:
+        ops = [("equal", 0, 1, 0, 1)]
+    if ops[0][0] == "equal":
+        tag, i1, i2, j1, j2 = ops[0]
+        ops[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if ops[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = ops[-1]
+        ops[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    nn = n + n
+    group = []
+    for tag, i1, i2, j1, j2 in ops:
+        if tag == "equal" and i2 - i1 > nn:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+def _fmt_range(start: int, stop: int) -> str:
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
 
 def diff_preview(original_lines: list[str], updated_lines: list[str], fromfile="original", tofile="updated") -> str:
-    diff = difflib.unified_diff(
-        original_lines,
-        updated_lines,
-        fromfile=fromfile,
-        tofile=tofile,
-        lineterm=''
-    )
-    return '\n'.join(diff)
+    """
+    Unified diff of two line lists, computed over changed regions only.
+
+    Output follows `difflib.unified_diff(..., lineterm='')`; an identical
+    pair of inputs yields an empty string without any diffing at all.
+    """
+    if original_lines == updated_lines:
+        return ""
+    a, b = original_lines, updated_lines
+    out = [f"--- {fromfile}", f"+++ {tofile}"]
+    for group in _grouped(_anchored_opcodes(a, b)):
+        first, last = group[0], group[-1]
+        out.append(f"@@ -{_fmt_range(first[1], last[2])} +{_fmt_range(first[3], last[4])} @@")
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                out.extend(" " + ln for ln in a[i1:i2])
+                continue
+            if tag in ("replace", "delete"):
+                out.extend("-" + ln for ln in a[i1:i2])
+            if tag in ("replace", "insert"):
+                out.extend("+" + ln for ln in b[j1:j2])
+    return "\n".join(out)
 
 if __name__ == "__main__":
-    print(inject_tags("Today is {{DATE_TODAY}}", {"{{DATE_TODAY}}": "2025-07-17"}))
\ No newline at end of file
+    print(inject_tags("Today is {{DATE_TODAY}}", {"{{DATE_TODAY}}": "2025-07-17"}))
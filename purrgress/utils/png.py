@@ -0,0 +1,45 @@
+"""
+Minimal PNG encoder for RGB uint8 arrays (zlib + CRC, no image libraries).
+"""
+from __future__ import annotations
+
+import struct
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+def _chunk(tag: bytes, data: bytes) -> bytes:
+    return (struct.pack(">I", len(data)) + tag + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+def encode_png(rgb: np.ndarray, level: int = 6) -> bytes:
+    """
+    Encode an (H, W, 3) uint8 array as an 8-bit truecolour PNG.
+
+    Every scanline uses filter type 0 (None); heat-map thumbnails are large
+    flat blocks, which zlib already compresses well.
+    """
+    rgb = np.ascontiguousarray(rgb, dtype=np.uint8)
+    if rgb.ndim != 3 or rgb.shape[2] != 3:
+        raise ValueError(f"expected (H, W, 3) array, got shape {rgb.shape}")
+    h, w, _ = rgb.shape
+    raw = np.empty((h, 1 + w * 3), dtype=np.uint8)
+    raw[:, 0] = 0
+    raw[:, 1:] = rgb.reshape(h, w * 3)
+
+    ihdr = struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0)
+    return (_SIGNATURE
+            + _chunk(b"IHDR", ihdr)
+            + _chunk(b"IDAT", zlib.compress(raw.tobytes(), level))
+            + _chunk(b"IEND", b""))
+
+def write_png(path: Path, rgb: np.ndarray) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_png(rgb))
+    return path
+
+__all__ = ["encode_png", "write_png"]
@@ -0,0 +1,163 @@
+"""
+Opt-in per-command metrics for `plog` and `purg`.
+
+Enable with `--profile` on either CLI group or `PURRGRESS_PROFILE=1`. Extra
+dumps: `--profile-dump cprofile|tracemalloc` (repeatable) or list them in the
+env var, e.g. `PURRGRESS_PROFILE=cprofile,tracemalloc`.
+
+Each run appends one JSON line to `DATA_ROOT/.metrics/metrics.jsonl`:
+
+```json
+{"ts": "...", "command": "plog tidy", "status": "ok", "wall_s": 0.41,
+ "phases": {"yaml_load": 0.22, "tidy": 0.09, "dump": 0.07, "write": 0.01},
+ "bytes_read": 183204, "bytes_written": 179911}
+```
+
+Hot paths call `phase()` / `add_bytes()`; both are no-ops unless a run is active.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator
+
+DUMPS = ("cprofile", "tracemalloc")
+
+_RUN: dict | None = None
+_LOCK = threading.Lock()
+
+def resolve(flag: bool, dumps: Iterable[str] = ()) -> set[str] | None:
+    """
+    Combine CLI switches with `PURRGRESS_PROFILE`.
+
+    Returns:
+        set[str] | None: Requested extra dumps (possibly empty) when profiling
+        is on, otherwise None.
+    """
+    env = os.getenv("PURRGRESS_PROFILE", "").strip().lower()
+    env_on = env not in ("", "0", "false", "no", "off")
+    if not (flag or dumps or env_on):
+        return None
+    return set(dumps) | {d for d in env.replace(" ", "").split(",") if d in DUMPS}
+
+def active() -> bool:
+    return _RUN is not None
+
+def start(command: str, dumps: Iterable[str] = ()) -> None:
+    """Begin recording metrics for one command."""
+    global _RUN
+    dumps = set(dumps)
+    run = {
+        "command": command,
+        "argv": sys.argv[1:],
+        "t0": time.perf_counter(),
+        "phases": {},
+        "bytes_read": 0,
+        "bytes_written": 0,
+        "profiler": None,
+        "tracemalloc": "tracemalloc" in dumps,
+    }
+    if "tracemalloc" in dumps:
+        import tracemalloc
+        tracemalloc.start(25)
+    if "cprofile" in dumps:
+        import cProfile
+        run["profiler"] = cProfile.Profile()
+        run["profiler"].enable()
+    _RUN = run
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Accumulate wall time spent inside the block under `name`."""
+    if _RUN is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        dt = time.perf_counter() - t0
+        run = _RUN
+        if run is not None:
+            with _LOCK:
+                run["phases"][name] = run["phases"].get(name, 0.0) + dt
+
+def add_bytes(read: int = 0, written: int = 0) -> None:
+    """Count file bytes read/written by the current command."""
+    run = _RUN
+    if run is None:
+        return
+    with _LOCK:
+        run["bytes_read"] += read
+        run["bytes_written"] += written
+
+def finish(data_root: Path, status: str = "ok") -> dict | None:
+    """
+    Stop recording and append the record to `data_root/.metrics/metrics.jsonl`.
+
+    Returns:
+        dict | None: The record written, or None if nothing was recording.
+    """
+    global _RUN
+    run, _RUN = _RUN, None
+    if run is None:
+        return None
+
+    wall = time.perf_counter() - run["t0"]
+    out_dir = Path(data_root) / ".metrics"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now()
+    slug = f"{stamp:%Y%m%d-%H%M%S}-{run['command'].replace(' ', '_')}"
+
+    record = {
+        "ts": stamp.isoformat(timespec="seconds"),
+        "command": run["command"],
+        "argv": run["argv"],
+        "status": status,
+        "wall_s": round(wall, 6),
+        "phases": {k: round(v, 6) for k, v in sorted(run["phases"].items())},
+        "bytes_read": run["bytes_read"],
+        "bytes_written": run["bytes_written"],
+    }
+
+    if run["profiler"] is not None:
+        run["profiler"].disable()
+        prof = out_dir / f"{slug}.prof"
+        run["profiler"].dump_stats(prof)
+        record["cprofile"] = str(prof)
+
+    if run["tracemalloc"]:
+        import tracemalloc
+        _, peak = tracemalloc.get_traced_memory()
+        top = tracemalloc.take_snapshot().statistics("lineno")[:25]
+        tracemalloc.stop()
+        txt = out_dir / f"{slug}.tracemalloc.txt"
+        txt.write_text("\n".join(str(s) for s in top) + "\n")
+        record["peak_mem_bytes"] = peak
+        record["tracemalloc"] = str(txt)
+
+    with (out_dir / "metrics.jsonl").open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return record
+
+def finish_on_close(data_root: Path):
+    """
+    Callback for `click.Context.call_on_close`: records `status` from the
+    exception being propagated (if any) when the context is torn down.
+    """
+    def _close():
+        exc = sys.exc_info()[1]
+        if exc is None or (isinstance(exc, SystemExit) and not exc.code):
+            status = "ok"
+        else:
+            status = type(exc).__name__
+        finish(data_root, status)
+    return _close
+
+__all__ = ["resolve", "active", "start", "phase", "add_bytes", "finish", "finish_on_close", "DUMPS"]
@@ -1,14 +1,53 @@
 from __future__ import annotations
-import re
+from typing import TextIO
 
 _REPLACE = {
     '‘': "'", '’': "'", '“': '"', '”': '"',
     '—': '-', ' ': ' ', ' ':' ', ' ': ' ', 
     '–': '-', '‑': '-',
 }
-_PATTERN = re.compile("|".join(map(re.escape, _REPLACE)))
+# str.maketrans insists on single-character keys, so a multi-character entry
+# in _REPLACE fails loudly here instead of silently breaking chunked cleaning.
+_TABLE = str.maketrans(_REPLACE)
+_DELETE = str.maketrans("", "", "".join(_REPLACE))
+
+CHUNK_SIZE = 1 << 20
+
+def _clean_chunk(text: str) -> tuple[str, int]:
+    """Translate one chunk and count how many characters were replaced."""
+    return text.translate(_TABLE), len(text) - len(text.translate(_DELETE))
 
 def clean_punctuation(text: str) -> str:
-    return _PATTERN.sub(lambda m: _REPLACE[m.group()], text)
+    return text.translate(_TABLE)
+
+def count_punctuation(text: str) -> int:
+    """Number of characters `clean_punctuation` would replace."""
+    return _clean_chunk(text)[1]
+
+def clean_stream(src: TextIO, dst: TextIO | None = None, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Clean `src` into `dst` in bounded chunks; peak memory is ~2 chunks.
+
+    Every mapping is a single code point and text streams never split a
+    code point, so chunk boundaries need no carry-over. Open both streams
+    with `newline=""` to keep line endings byte-for-byte.
+
+    Args:
+        src (TextIO): Readable text stream.
+        dst (TextIO | None): Writable text stream, or None to only count.
+        chunk_size (int): Characters read per step.
+
+    Returns:
+        int: Total replacements made.
+    """
+    total = 0
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            return total
+        fixed, n = _clean_chunk(chunk)
+        total += n
+        if dst is not None:
+            dst.write(fixed)
 
-__all__ = ["clean_punctuation"]
+__all__ = ["clean_punctuation", "count_punctuation", "clean_stream", "CHUNK_SIZE"]
@@ -0,0 +1,48 @@
+import asyncio
+
+from purrgress.plog import storage
+from purrgress.plog.aio import AsyncLogRepository
+
+def test_single_flight_loads_and_serialized_writes(tmp_path, monkeypatch):
+    loads = []
+    real_load = storage.YamlRepository.load_month
+    monkeypatch.setattr(storage.YamlRepository, "load_month",
+                        lambda self, y, m: loads.append((y, m)) or real_load(self, y, m))
+
+    async def main():
+        async with AsyncLogRepository(tmp_path, backend="yaml", max_workers=4) as log:
+            await asyncio.gather(*(
+                log.append_span(f"2025-03-{i % 5 + 1:02}",
+                                   {"task": f"t{i}", "spans": [f"{9 + i // 5:02}:00-{9 + i // 5:02}:30"]})
+                for i in range(20)
+            ))
+            loads.clear()
+            days = await asyncio.gather(*(log.load_day("2025-03-01") for _ in range(10)))
+            assert loads == [(2025, 3)]
+            assert all(d is days[0] for d in days) and len(days[0]["sessions"]) == 4
+            return await asyncio.gather(log.minutes_for_month(2025, 3), log.minutes_for_day("2025-03-02"))
+
+    assert asyncio.run(main()) == [600, 120]
+
+def test_loads_never_see_a_half_written_month(tmp_path):
+    async def main():
+        async with AsyncLogRepository(tmp_path, backend="yaml", max_workers=4) as log:
+            for day in range(1, 29):
+                await log.append_span(f"2025-03-{day:02}", {"task": "seed", "spans": ["08:00-08:30"]})
+            seen, done = [], asyncio.Event()
+
+            async def reader():
+                while not done.is_set():
+                    seen.append(len(await log.load_month(2025, 3)))
+                    await asyncio.sleep(0)
+
+            async def writer():
+                for i in range(30):
+                    await log.append_span(f"2025-03-{i % 28 + 1:02}", {"task": f"w{i}", "spans": ["10:00-10:10"]})
+                done.set()
+
+            await asyncio.gather(writer(), *(reader() for _ in range(4)))
+            return seen
+
+    seen = asyncio.run(main())
+    assert seen and set(seen) == {28}
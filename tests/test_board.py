@@ -0,0 +1,39 @@
+from datetime import date
+
+from purrgress.plog import board
+from purrgress.plog.storage import YamlRepository
+from purrgress.utils.markdown import substitute_lines
+
+MONTH = ("'2025-03-03':\n  sessions:\n  - task: a\n    tags:\n    - py\n    spans:\n    - 09:00-10:30\n"
+         "'2025-03-05':\n  sessions:\n  - task: b\n    tags:\n    - doc\n    spans:\n    - {span}\n")
+
+def test_plog_anchors_cached_until_month_changes(tmp_data_dir, monkeypatch):
+    (tmp_data_dir / "2025").mkdir()
+    (tmp_data_dir / "2025/03.yaml").write_text(MONTH.format(span="20:00-20:45"))
+    repo, today = YamlRepository(), date(2025, 3, 5)
+
+    lines = board.anchored_plog_lines(today, repo)
+    assert lines["PLOG-TODAY"] == "<sub><em>🐾 Logged today: 0h45m</em></sub>"
+    assert lines["PLOG-WEEK"] == "<sub><em>🐾 This week: 2h15m (0h45m/day)</em></sub>"
+    assert lines["PLOG-TAGS"] == "<sub><em>🐾 Top tags: #py 1h30m · #doc 0h45m</em></sub>"
+
+    def _boom(*a, **k):
+        raise AssertionError("log re-read despite unchanged months")
+    with monkeypatch.context() as m:
+        m.setattr(YamlRepository, "minutes_by", _boom)
+        assert board.anchored_plog_lines(today, repo) == lines
+
+    (tmp_data_dir / "2025/03.yaml").write_text(MONTH.format(span="20:00-22:00"))
+    fresh = board.anchored_plog_lines(today, repo)
+    assert fresh["PLOG-TODAY"] == "<sub><em>🐾 Logged today: 2h00m</em></sub>"
+
+    out = list(substitute_lines(["<!--PLOG-TODAY-->\n", "<sub><em>stale</em></sub>\n"], anchors=fresh))
+    assert out == ["<!--PLOG-TODAY-->\n", fresh["PLOG-TODAY"] + "\n"]
+
+def test_plog_anchors_default_to_the_plog_timezone_day(tmp_data_dir, monkeypatch):
+    (tmp_data_dir / "2025").mkdir()
+    (tmp_data_dir / "2025/03.yaml").write_text(MONTH.format(span="20:00-20:45"))
+    monkeypatch.setattr(board, "today_iso", lambda tz=None: "2025-03-05")
+    lines = board.anchored_plog_lines(repo=YamlRepository())
+    assert lines == board.anchored_plog_lines(date(2025, 3, 5), YamlRepository())
+    assert lines["PLOG-TODAY"] == "<sub><em>🐾 Logged today: 0h45m</em></sub>"
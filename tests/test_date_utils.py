@@ -3,3 +3,8 @@ from purrgress.utils import date as du
 def test_minutes_between_rollover():
     assert du.minutes_between("23:55", "00:10") == 15
     assert du.minutes_between("12:00", "12:30") == 30
+
+def test_parse_hm_rejects_trailing_newline():
+    assert du.parse_hm("09:05") == 545
+    assert du.parse_hm("09:05\n") is None
+    assert du.parse_span("09:00-10:00\n") is None
@@ -0,0 +1,68 @@
+from click.testing import CliRunner
+
+from purrgress.plog.cli import log_group
+from purrgress.plog.fsck import check_month
+
+BAD = """'2024-02-01':
+  wake: '25:00'
+  sessions:
+  - task: a
+    tags:
+    - nope
+    spans:
+    - 09:00-10:00
+    - 9am
+    - 11:00-11:00
+  - task: b
+    spans:
+    - 09:30-10:30
+'2024-03-02':
+  sessions: []
+"""
+
+def test_check_month_classifies_issues():
+    import yaml
+
+    issues, fixed = check_month(yaml.safe_load(BAD), 2024, 2, tags=frozenset({"py"}))
+    codes = sorted(i.code for i in issues)
+    assert codes == ["overlap", "span", "tag", "wake", "wrong_month", "zero_span"]
+    assert fixed["2024-02-01"]["sessions"][0]["spans"] == ["09:00-10:00"]
+    assert "wake" not in fixed["2024-02-01"]
+
+def test_check_day_reports_non_list_spans_and_non_string_tags():
+    from purrgress.plog.fsck import check_day
+
+    node = {"sessions": [{"task": "a", "tags": ["py", ["x"]], "moods": [{"m": 1}], "spans": "09:00-10:00"}]}
+    issues, fixed = check_day("2024-02-01", node, tags=frozenset({"py"}), moods=frozenset())
+    assert sorted((i.code, i.fixable) for i in issues) == [("mood", True), ("span", True), ("tag", True)]
+    assert fixed["sessions"][0] == {"task": "a", "tags": ["py"], "moods": [], "spans": ["09:00-10:00"]}
+
+def test_day_total_check_counts_overlaps_once():
+    from purrgress.plog.fsck import check_day
+
+    node = {"sessions": [{"task": "a", "spans": ["08:00-21:00"]}, {"task": "b", "spans": ["09:00-22:00"]}]}
+    assert [i.code for i in check_day("2024-02-01", node)[0]] == ["overlap"]
+    node["sessions"].append({"task": "c", "spans": ["22:00-09:00"]})
+    assert "day_total" in [i.code for i in check_day("2024-02-01", node)[0]]
+
+def test_fsck_repair_rewrites_only_bad_files(tmp_data_dir):
+    (tmp_data_dir / "2024").mkdir()
+    (tmp_data_dir / "2024/02.yaml").write_text(BAD)
+    good = "'2024-01-05':\n  sessions:\n  - task: a\n    tags: []\n    moods: []\n    spans:\n    - 09:00-10:00\n"
+    (tmp_data_dir / "2024/01.yaml").write_text(good)
+    mtime = (tmp_data_dir / "2024/01.yaml").stat().st_mtime_ns
+    runner = CliRunner()
+
+    check = runner.invoke(log_group, ["fsck", "-j", "2"])
+    assert check.exit_code == 1
+    assert "2 file(s) checked: 1 with issues, 0 repaired" in check.output
+    assert (tmp_data_dir / "2024/02.yaml").read_text() == BAD
+
+    fixed = runner.invoke(log_group, ["fsck", "--repair"])
+    assert "1 repaired" in fixed.output
+    text = (tmp_data_dir / "2024/02.yaml").read_text()
+    assert "9am" not in text and "11:00-11:00" not in text and "25:00" not in text
+    assert (tmp_data_dir / "2024/01.yaml").stat().st_mtime_ns == mtime
+
+    again = runner.invoke(log_group, ["fsck"])
+    assert "0 fixable" in again.output
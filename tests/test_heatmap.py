@@ -1,9 +1,48 @@
 from purrgress.plog.reports import make_heatmap
 from pathlib import Path
 
-def test_make_heatmap(tmp_data_dir, monkeypatch):
+def test_make_heatmap(tmp_data_dir, tmp_path, monkeypatch):
     month = tmp_data_dir / "2025" / "07.yaml"
     month.parent.mkdir(parents=True, exist_ok=True)
     month.write_text("'2025-07-01': {sessions: []}")
-    out = make_heatmap(2025, 7, theme="viridis")
+    out = make_heatmap(2025, 7, theme="viridis", out_dir=tmp_path / "visuals")
     assert Path(out).exists()
+
+def test_term_grid_matches_png_grid(tmp_data_dir):
+    from purrgress.plog.grid import month_grid
+    from purrgress.plog.reports import _empty_df, _fill_df, _month_yaml
+    from purrgress.plog.termviz import render_grid
+
+    month = tmp_data_dir / "2025" / "01.yaml"
+    month.parent.mkdir(parents=True, exist_ok=True)
+    month.write_text(
+        "'2025-01-01': {sessions: [{task: a, spans: ['09:10-10:05', '23:30-00:45']}]}\n"
+        "'2025-01-31': {sessions: [{task: b, spans: ['22:00-02:00', '10:00-oops']}]}\n"
+    )
+    grid = month_grid(2025, 1)
+    df = _fill_df(_empty_df(2025, 1), _month_yaml(2025, 1))
+    assert (grid == df.to_numpy()).all()
+    assert grid[9, 0] == 50 and grid[0, 1] == 45 and grid[:, 30].sum() == 120
+    assert "total 250 min" in render_grid(grid, "t").plain
+
+def test_thumbnail_png(tmp_data_dir, tmp_path):
+    import struct, zlib
+    from purrgress.plog.reports import colormap_lut, make_thumbnails
+
+    month = tmp_data_dir / "2025" / "02.yaml"
+    month.parent.mkdir(parents=True, exist_ok=True)
+    month.write_text("'2025-02-03': {sessions: [{task: a, spans: ['09:00-10:00']}]}\n")
+    (out,) = make_thumbnails(2025, theme="magma", scale=2, out_dir=tmp_path)
+
+    blob = out.read_bytes()
+    assert blob[:8] == b"\x89PNG\r\n\x1a\n"
+    w, h = struct.unpack(">II", blob[16:24])
+    assert (w, h) == (28 * 2, 24 * 2)
+    (size,) = struct.unpack(">I", blob[33:37])
+    assert blob[37:41] == b"IDAT"
+    raw = zlib.decompress(blob[41:41 + size])
+    rows = [raw[i * (1 + w * 3) + 1:(i + 1) * (1 + w * 3)] for i in range(h)]
+    lut = colormap_lut("magma")
+    # hour 9 is the 10th row from the bottom; day 3 is the 3rd column
+    px = lambda r, c: tuple(rows[h - 1 - r * 2][c * 6:c * 6 + 3])
+    assert px(9, 2) == tuple(lut[-1]) and px(0, 0) == tuple(lut[0])
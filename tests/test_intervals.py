@@ -0,0 +1,46 @@
+from purrgress.plog.cleanup import tidy_day
+from purrgress.plog.intervals import find_overlaps, merge_spans, scan, unique_minutes
+
+def test_merge_spans_within_session():
+    spans = ["09:30-11:00", "09:00-10:00", "11:00-11:30", "12:00-13:00", "12:15-12:45", "23:30-00:30", "10:00-oops"]
+    assert sorted(merge_spans(spans)) == ["09:00-11:00", "10:00-oops", "11:00-11:30", "12:00-13:00", "23:30-00:30"]
+
+    node = {"sessions": [{"task": "a", "spans": ["09:00-10:00"]}, {"task": "a", "spans": ["09:45-10:30"]}]}
+    assert tidy_day(node)["sessions"][0]["spans"] == ["09:00-10:30"]
+
+def test_cross_session_overlaps_and_unique_minutes():
+    days = {
+        "2025-03-04": {"sessions": [
+            {"task": "code", "tags": ["py"], "spans": ["09:00-10:00", "23:30-00:30"]},
+            {"task": "read", "tags": ["py"], "spans": ["09:30-11:00"]},
+        ]},
+        "2025-03-05": {"sessions": [{"task": "x", "tags": [], "spans": ["00:15-01:00", "10:00-10:00"]}]},
+    }
+    report = scan(days)
+    assert [(o.end - o.start, o.a.task, o.b.task) for o in report.overlaps] == [(30, "code", "read"), (15, "code", "x")]
+    assert (report.logged, report.unique) == (255, 210)
+    assert unique_minutes([(0, 10), (10, 20), (5, 15)]) == 20
+    assert find_overlaps([(0, 10, "a"), (10, 20, "b")]) == []
+
+def test_overlapping_day_counts_once_everywhere(tmp_data_dir):
+    from purrgress.plog import core, site
+    from purrgress.plog.grid import hour_day_grid
+    from purrgress.plog.rollup import summarize_root
+    from purrgress.plog.storage import SqliteRepository
+
+    repo = core.default_repository()
+    repo.append_span("2025-03-04", {"task": "code", "tags": ["py"], "moods": [], "spans": ["09:00-10:00"]})
+    repo.append_span("2025-03-04", {"task": "read", "tags": ["py"], "moods": [], "spans": ["09:30-11:00"]})
+    month = repo.load_month(2025, 3)
+
+    assert hour_day_grid(month, 31).sum() == 120
+    assert site.summarize(month)["minutes"] == 120
+    assert site.summarize(month)["tags"] == {"py": 150}
+    assert repo.minutes_for_day("2025-03-04") == 120
+    assert repo.minutes_for_month(2025, 3) == 120
+    assert repo.store.minutes_by("2025-03-01", "2025-03-31") == {"2025-03-04": 120}
+    assert summarize_root(("me", str(tmp_data_dir), "2025-03-01", "2025-03-31")).minutes == 120
+
+    sql = SqliteRepository(tmp_data_dir / "log.sqlite")
+    sql.save_month(2025, 3, month)
+    assert sql.minutes_by("2025-03-01", "2025-03-31") == {"2025-03-04": 120}
@@ -0,0 +1,15 @@
+from purrgress.utils.load import rewrite
+
+def test_rewrite_skips_identical_bytes(tmp_path):
+    f = tmp_path / "board.md"
+    f.write_text("a\nb\n")
+    before = f.stat().st_mtime_ns
+
+    res = rewrite(f, ["a\n", "b\n"], preview=True)
+    assert (res.changed, res.written, res.diff) == (False, False, "")
+    assert f.stat().st_mtime_ns == before
+
+    res = rewrite(f, ["a\n", "c\n"], preview=True, label="board")
+    assert res.written and f.read_text() == "a\nc\n"
+    assert "-b" in res.diff and "+c" in res.diff
+    assert [p.name for p in tmp_path.iterdir()] == ["board.md"]
@@ -0,0 +1,40 @@
+import json
+import logging
+import threading
+
+from purrgress.plog import log_setup
+from purrgress.utils import log_call
+
+def test_queue_mode_snapshots_message_on_caller_thread(tmp_path):
+    root = logging.getLogger()
+    saved = root.handlers[:], root.level
+    logging.disable(logging.NOTSET)
+    sink = tmp_path / "logs" / "plog.jsonl"
+    try:
+        log = log_setup.init("WARNING", json_file=sink)
+        assert isinstance(root.handlers[0], log_setup.DeferredQueueHandler)
+
+        seen = []
+        class Probe:
+            def __repr__(self):
+                seen.append(threading.current_thread().name)
+                return "probe"
+        log.debug("value=%r", Probe())
+
+        @log_call()
+        def f(session):
+            return {"n": 1}
+        sess = {"spans": ["09:00-10:00"]}
+        r = f(sess)
+        sess["spans"].append("MUTATED")
+        r["n"] = 999
+    finally:
+        log_setup._stop_listener()
+        root.handlers[:], root.level = saved
+
+    recs = [json.loads(line) for line in sink.read_text().splitlines()]
+    msgs = [r["msg"] for r in recs]
+    assert "value=probe" in msgs and recs[0]["level"] == "DEBUG"
+    assert seen == [threading.main_thread().name]
+    assert "f(session={'spans': ['09:00-10:00']})" in msgs
+    assert "f -> {'n': 1}" in msgs
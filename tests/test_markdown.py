@@ -0,0 +1,19 @@
+from purrgress.utils.date import anchored_date_lines, date_context, date_vars
+from purrgress.utils.markdown import substitute_lines
+
+def test_substitute_lines_single_pass():
+    ctx = date_context()
+    lines = [
+        "Today {{DATE_TODAY}} / {{DATE_MONTH}}\n",
+        "<!--DATE-TODAY-->\n",
+        "<sub><em>stale</em></sub>\n",
+        "<!--DATE-MONTH-->\n",
+    ]
+    out = list(substitute_lines(iter(lines), date_vars(ctx), anchored_date_lines(ctx)))
+    assert out == [
+        f"Today {ctx['today']} / {ctx['month']}\n",
+        "<!--DATE-TODAY-->\n",
+        f"<sub><em>{ctx['today']}</em></sub>\n",
+        "<!--DATE-MONTH-->\n",
+        f"<sub><em>{ctx['month']}</em></sub>\n",
+    ]
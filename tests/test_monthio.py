@@ -0,0 +1,48 @@
+import random
+from datetime import date
+
+import yaml
+
+from purrgress.plog.cleanup import tidy_month
+from purrgress.plog.monthio import dump_month, load_month_text
+from purrgress.utils.yaml_tools import dump_no_wrap
+
+WORDS = ["", "a", "yes", "null", "1.5", "10:30", "07:30", "2025-01-01", "#x", "- y", "a: b",
+         "it's", "ü", "😸", " lead", "trail ", "[", "{k}", "<<", "x\ny", "\x85", "---", "~"]
+
+def _word(rng):
+    return "".join(rng.choice(WORDS) for _ in range(rng.randint(0, 3)))
+
+def _month(rng):
+    data = {}
+    for _ in range(rng.randint(0, 4)):
+        node = {"sessions": [
+            {"task": _word(rng),
+             "tags": [_word(rng) for _ in range(rng.randint(0, 3))],
+             "moods": [_word(rng) for _ in range(rng.randint(0, 2))],
+             "spans": [f"{rng.randint(0, 23):02}:{rng.randint(0, 59):02}-"
+                       f"{rng.randint(0, 23):02}:{rng.randint(0, 59):02}" for _ in range(rng.randint(0, 3))]}
+            for _ in range(rng.randint(0, 3))
+        ]}
+        for key in ("wake", "sleep"):
+            if rng.random() < 0.5:
+                node[key] = _word(rng)
+        data[_word(rng) if rng.random() < 0.1 else f"2025-01-{rng.randint(1, 31):02}"] = node
+    return data
+
+def test_roundtrip_matches_pyyaml():
+    rng = random.Random(0)
+    for _ in range(400):
+        data = _month(rng)
+        try:
+            data = tidy_month(data)
+        except ValueError:
+            pass
+        text = dump_no_wrap(data)
+        assert dump_month(data) == text
+        assert load_month_text(text) == (yaml.safe_load(text) or {})
+
+def test_unrecognised_layout_falls_back():
+    text = "'2025-06-01':\n  sessions:\n    - task: x  # flow + comment\n      tags: [a, b]\n"
+    assert load_month_text(text) == yaml.safe_load(text)
+    assert load_month_text("2025-06-01:\n  wake: 10:30\n") == {date(2025, 6, 1): {"wake": 630}}
@@ -0,0 +1,37 @@
+from click.testing import CliRunner
+
+from purrgress.plog import pack
+from purrgress.plog.cli import log_group
+from purrgress.plog.storage import YamlRepository
+
+MONTH = "'{day}':\n  sessions:\n  - task: a\n    tags: []\n    moods: []\n    spans:\n    - 09:00-10:30\n"
+
+def test_pack_is_transparent_and_round_trips(tmp_data_dir):
+    for y, m in ((2023, 1), (2023, 2), (2025, 1)):
+        path = tmp_data_dir / f"{y}/{m:02}.yaml"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(MONTH.format(day=f"{y}-{m:02}-03"))
+    repo = YamlRepository()
+    before = (repo.months(), repo.month_stamps(), repo.load_month(2023, 2))
+    original = (tmp_data_dir / "2023/02.yaml").read_bytes()
+    runner = CliRunner()
+
+    out = runner.invoke(log_group, ["pack", "--before", "2024", "--codec", "gzip"])
+    assert out.exit_code == 0, out.output
+    assert not (tmp_data_dir / "2023").exists()
+    assert pack.bundle_path(tmp_data_dir, 2023).exists()
+    assert (repo.months(), repo.month_stamps(), repo.load_month(2023, 2)) == before
+    assert repo.load_day("2023-01-03")["sessions"][0]["spans"] == ["09:00-10:30"]
+    assert repo.location(2023, 1).endswith("2023.plogpack#01")
+
+    repo.append_span("2023-02-04", {"task": "b", "tags": [], "moods": [], "spans": ["11:00-12:00"]})
+    assert "2023-02-04" in repo.load_month(2023, 2)
+    runner.invoke(log_group, ["pack", "--before", "2024"])
+    assert not (tmp_data_dir / "2023").exists()
+    assert set(repo.load_month(2023, 2)) == {"2023-02-03", "2023-02-04"}
+
+    runner.invoke(log_group, ["unpack"])
+    assert not pack.bundle_path(tmp_data_dir, 2023).exists()
+    assert (tmp_data_dir / "2023/01.yaml").read_text() == MONTH.format(day="2023-01-03")
+    assert (tmp_data_dir / "2023/02.yaml").read_bytes() != original
+    assert "2023-02-04" in (tmp_data_dir / "2023/02.yaml").read_text()
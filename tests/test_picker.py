@@ -0,0 +1,55 @@
+from datetime import date
+
+import yaml
+from click.testing import CliRunner
+
+from purrgress.plog import core
+from purrgress.plog.cli import log_group
+from purrgress.plog.picker import PICKER_CACHE, NameIndex, count_usage, recent_usage
+
+TAGS = ["learn.netsec", "learn.web", "proj.plog", "proj.purg", "life.misc"]
+
+def test_index_prefix_segment_and_fuzzy():
+    idx = NameIndex(TAGS)
+    assert idx.search("proj")[:2] == ["proj.plog", "proj.purg"]
+    assert idx.search("net") == ["learn.netsec"]                 # segment prefix
+    assert idx.search("netsce")[0] == "learn.netsec"             # trigram, typo
+    assert idx.search("proj", usage={"proj.purg": 5})[0] == "proj.purg"
+    assert idx.search("", usage={"life.misc": 1})[0] == "life.misc"
+
+def test_count_usage_decays_and_finds_last():
+    days = {
+        "2025-07-01": {"sessions": [{"task": "a", "tags": ["proj.plog"], "moods": ["focus"]}]},
+        "2025-07-14": {"sessions": [{"task": "b", "tags": ["learn.web"], "moods": []},
+                                    {"task": "c", "tags": ["proj.purg"], "moods": ["tired"]}]},
+    }
+    usage = count_usage(days, date(2025, 7, 14))
+    assert usage.tags["learn.web"] == 1 and usage.tags["proj.plog"] < 1
+    assert usage.last == {"task": "c", "tags": ["proj.purg"], "moods": ["tired"]}
+
+def test_recent_usage_is_cached(tmp_data_dir):
+    core.default_repository().append_span("2025-07-14", {"task": "a", "tags": ["proj.plog"], "moods": [], "spans": ["09:00-10:00"]})
+    first = recent_usage(date(2025, 7, 14))
+    assert (tmp_data_dir / PICKER_CACHE).exists()
+    assert recent_usage(date(2025, 7, 14)) == first
+    core.default_repository().append_span("2025-07-14", {"task": "b", "tags": ["life.misc"], "moods": [], "spans": ["11:00-12:00"]})
+    assert recent_usage(date(2025, 7, 14)).last["task"] == "b"
+
+def test_start_last_reuses_previous_tags(tmp_data_dir):
+    core.default_repository().append_span(date.today().isoformat(),
+                     {"task": "a", "tags": ["proj.plog"], "moods": ["focus"], "spans": ["00:00-00:01"]})
+    out = CliRunner().invoke(log_group, ["start", "next thing", "--last", "-m", "chill"])
+    assert out.exit_code == 0, out.output
+    draft = yaml.safe_load((tmp_data_dir / ".draft.yaml").read_text())
+    assert draft["tags"] == ["proj.plog"] and draft["moods"] == ["chill"]
+
+def test_start_last_uses_the_group_timezone_day(tmp_data_dir):
+    from purrgress.utils.date import today_iso
+
+    ahead = "Pacific/Kiritimati"  # UTC+14: usually already tomorrow
+    core.default_repository().append_span(today_iso(ahead),
+                     {"task": "a", "tags": ["proj.purg"], "moods": ["focus"], "spans": ["00:00-00:01"]})
+    out = CliRunner().invoke(log_group, ["--tz", ahead, "start", "next thing", "--last"])
+    assert out.exit_code == 0, out.output
+    draft = yaml.safe_load((tmp_data_dir / ".draft.yaml").read_text())
+    assert draft["tags"] == ["proj.purg"] and draft["date"] == today_iso(ahead)
@@ -0,0 +1,21 @@
+import json
+
+from click.testing import CliRunner
+
+from purrgress.plog.cli import log_group
+
+def test_profile_appends_metrics(tmp_data_dir):
+    month = tmp_data_dir / "2025" / "07.yaml"
+    month.parent.mkdir(parents=True)
+    month.write_text("'2025-07-01': {sessions: [{task: a, spans: ['09:00-10:00']}]}\n")
+    size = month.stat().st_size
+
+    res = CliRunner().invoke(log_group, ["--profile", "tidy", "-y", "2025", "-m", "7"])
+    assert res.exit_code == 0, res.output
+
+    lines = (tmp_data_dir / ".metrics" / "metrics.jsonl").read_text().splitlines()
+    rec = json.loads(lines[-1])
+    assert rec["command"] == "plog tidy" and rec["status"] == "ok"
+    assert {"yaml_load", "tidy", "dump", "write"} <= set(rec["phases"])
+    assert rec["bytes_read"] == size
+    assert rec["bytes_written"] == month.stat().st_size
@@ -0,0 +1,53 @@
+from click.testing import CliRunner
+
+from purrgress.cli import cli
+
+BOARD = """<!--DATE-TODAY-->
+<sub><em>old</em></sub>
+
+<!-- ============= ACTIVE START ============= -->
+* [x] done thing {n}
+* [ ] open thing {n}
+<!-- ============= ACTIVE END ============= -->
+"""
+
+def _boards(tmp_path, monkeypatch, count=3):
+    monkeypatch.setenv("PURG_MANIFEST", str(tmp_path / "manifest.json"))
+    boards = tmp_path / "boards"
+    boards.mkdir()
+    for n in range(count):
+        (boards / f"b{n}.md").write_text(BOARD.format(n=n))
+    return boards
+
+def test_purrdate_dir_skips_unchanged(tmp_path, monkeypatch):
+    boards = _boards(tmp_path, monkeypatch)
+    runner = CliRunner()
+
+    res = runner.invoke(cli, ["purrdate", str(boards), "--write"])
+    assert res.exit_code == 0, res.output
+    assert "3 updated" in res.output
+    mtimes = {p: p.stat().st_mtime_ns for p in boards.iterdir()}
+
+    res = runner.invoke(cli, ["purrdate", str(boards), "--write"])
+    assert "3 skipped" in res.output
+    assert mtimes == {p: p.stat().st_mtime_ns for p in boards.iterdir()}
+
+def test_purrdate_never_skips_last_updated(tmp_path, monkeypatch):
+    boards = _boards(tmp_path, monkeypatch, count=2)
+    (boards / "b0.md").write_text("<!--DATE-LAST_UPDATED-->\n<sub><em>old</em></sub>\n")
+    runner = CliRunner()
+    runner.invoke(cli, ["purrdate", str(boards), "--write"])
+
+    res = runner.invoke(cli, ["purrdate", str(boards), "--write"])
+    assert res.exit_code == 0, res.output
+    assert "1 skipped" in res.output
+
+def test_archive_many_sources_one_dst(tmp_path, monkeypatch):
+    boards = _boards(tmp_path, monkeypatch, count=2)
+    dst = tmp_path / "archived.md"
+
+    res = CliRunner().invoke(cli, ["archive", "--src", f"{boards}/*.md", "--dst", str(dst)])
+    assert res.exit_code == 0, res.output
+    text = dst.read_text()
+    assert "done thing 0" in text and "done thing 1" in text
+    assert "[x]" not in (boards / "b0.md").read_text()
@@ -0,0 +1,40 @@
+from purrgress.plog import site
+from purrgress.plog.storage import YamlRepository
+
+MONTH = "'{day}':\n  sessions:\n  - task: a\n    tags:\n    - py\n    spans:\n    - {span}\n"
+
+def test_report_build_is_incremental(tmp_data_dir, tmp_path):
+    repo, out = YamlRepository(), tmp_path / "site"
+    for name, day in (("2024/01.yaml", "2024-01-02"), ("2024/02.yaml", "2024-02-03")):
+        (tmp_data_dir / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_data_dir / name).write_text(MONTH.format(day=day, span="09:00-10:30"))
+
+    first = site.build(repo, out_dir=out, jobs=1)
+    assert first.rendered == ["2024-01", "2024-02"]
+    page = (out / "2024/01.md").read_text()
+    assert "**Total:** 90 min (1h30m) over 1 day(s)" in page and "| `py` | 90 |" in page
+    assert (out / "2024/02_heatmap.png").read_bytes()[:8] == b"\x89PNG\r\n\x1a\n"
+    assert "[2024](2024/index.md) | 180 |" in (out / "index.md").read_text()
+
+    again = site.build(repo, out_dir=out, jobs=1)
+    assert again.rendered == [] and again.skipped == 2 and again.written == []
+
+    (tmp_data_dir / "2024/02.yaml").write_text(MONTH.format(day="2024-02-03", span="09:00-09:15"))
+    (tmp_data_dir / "2024/01.yaml").unlink()
+    third = site.build(repo, out_dir=out, jobs=1)
+    assert third.rendered == ["2024-02"] and third.removed == ["2024-01"]
+    assert not (out / "2024/01.md").exists()
+    assert "[2024](2024/index.md) | 15 |" in (out / "index.md").read_text()
+
+def test_report_rebuilds_when_heatmap_code_changes(tmp_data_dir, tmp_path, monkeypatch):
+    from purrgress.plog import grid
+
+    repo, out = YamlRepository(), tmp_path / "site"
+    (tmp_data_dir / "2024").mkdir()
+    (tmp_data_dir / "2024/01.yaml").write_text(MONTH.format(day="2024-01-02", span="09:00-10:30"))
+    assert site.build(repo, out_dir=out, jobs=1).rendered == ["2024-01"]
+
+    patched = tmp_path / "grid.py"
+    patched.write_text(open(grid.__file__).read() + "\n# tweak\n")
+    monkeypatch.setattr(grid, "__file__", str(patched))
+    assert site.build(repo, out_dir=out, jobs=1).rendered == ["2024-01"]
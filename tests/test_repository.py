@@ -0,0 +1,76 @@
+import pytest
+
+from purrgress.plog import storage
+from purrgress.plog.repository import LogRepository
+
+def test_batch_flushes_each_month_once(tmp_path, monkeypatch):
+    a, b = LogRepository(tmp_path / "a", backend="yaml"), LogRepository(tmp_path / "b", backend="yaml")
+    saves = []
+    real_save = storage.YamlRepository.save_month
+    monkeypatch.setattr(storage.YamlRepository, "save_month",
+                        lambda self, y, m, data: saves.append((y, m)) or real_save(self, y, m, data))
+
+    with a.batch():
+        for day in range(1, 21):
+            a.append_span(f"2025-03-{day:02}", {"task": "t", "spans": ["09:00-10:00"]})
+        a.append_span("2025-04-01", {"task": "t", "spans": ["09:00-09:30"]})
+        a.set_wake("07:00", day_iso="2025-03-01")
+        assert a.minutes_for_day("2025-03-01") == 60
+        assert saves == []
+    assert sorted(saves) == [(2025, 3), (2025, 4)]
+    assert a.load_day("2025-03-01")["wake"] == "07:00"
+    assert a.minutes_for_month(2025, 3) == 20 * 60
+    assert b.minutes_for_month(2025, 3) == 0 and not (tmp_path / "b/2025").exists()
+
+    with pytest.raises(RuntimeError):
+        with a.batch():
+            a.append_span("2025-03-01", {"task": "t", "spans": ["11:00-12:00"]})
+            raise RuntimeError("boom")
+    assert a.minutes_for_day("2025-03-01") == 60
+
+def test_sessions_use_the_repository_draft(tmp_path):
+    repo = LogRepository(tmp_path, backend="yaml")
+    repo.start_session("task", ["py"], [], tz="UTC")
+    assert (tmp_path / ".draft.yaml").exists() and repo.open_draft()["task"] == "task"
+    draft = repo.stop_session(tz="UTC")
+    assert repo.open_draft() is None
+    assert repo.load_day(draft["date"])["sessions"][0]["tags"] == ["py"]
+
+def test_range_queries_see_buffered_writes(tmp_path):
+    repo = LogRepository(tmp_path, backend="yaml")
+    repo.append_span("2025-03-01", {"task": "t", "spans": ["09:00-10:00"]})
+    repo.append_span("2025-02-28", {"task": "t", "spans": ["09:00-09:30"]})
+    with repo.batch():
+        repo.append_span("2025-03-02", {"task": "t", "spans": ["09:00-11:00"]})
+        repo.append_span("2025-03-01", {"task": "u", "spans": ["09:30-10:30"]})
+        assert repo.minutes_for_month(2025, 3) == 90 + 120
+        assert repo.minutes_for_range("2025-02-28", "2025-03-01") == 30 + 90
+        assert repo.rolling_average(3, "2025-03-02") == (30 + 90 + 120) / 3
+    assert repo.minutes_for_month(2025, 3) == 90 + 120
+
+def test_nested_batch_error_rolls_back_only_its_writes(tmp_path):
+    repo = LogRepository(tmp_path, backend="yaml")
+    with repo.batch():
+        repo.append_span("2025-03-01", {"task": "kept", "spans": ["09:00-10:00"]})
+        with pytest.raises(RuntimeError):
+            with repo.batch():
+                repo.append_span("2025-03-01", {"task": "lost", "spans": ["11:00-12:00"]})
+                repo.append_span("2025-04-01", {"task": "lost", "spans": ["11:00-12:00"]})
+                raise RuntimeError("boom")
+    assert [s["task"] for s in repo.load_day("2025-03-01")["sessions"]] == ["kept"]
+    assert repo.load_month(2025, 4) == {}
+
+def test_totals_index_is_cached_until_the_data_moves(tmp_path, monkeypatch):
+    from purrgress.plog import totals
+
+    repo = LogRepository(tmp_path, backend="yaml")
+    repo.append_span("2025-03-01", {"task": "t", "spans": ["09:00-10:00"]})
+    loads = []
+    real_load = totals.load
+    monkeypatch.setattr(totals, "load", lambda store: loads.append(store) or real_load(store))
+    assert repo.minutes_for_month(2025, 3) == 60
+    assert repo.minutes_for_month(2025, 3) == 60
+    assert len(loads) == 1
+    repo.append_span("2025-03-02", {"task": "t", "spans": ["09:00-09:30"]})
+    assert repo.minutes_for_month(2025, 3) == 90
+    assert len(loads) == 2
@@ -0,0 +1,52 @@
+from datetime import date
+
+from click.testing import CliRunner
+
+from purrgress.plog.cli import log_group
+from purrgress.plog.rollup import merge, parse_root, rollup, summarize_root
+from purrgress.plog.storage import YamlRepository
+
+def _seed(root, spans):
+    repo = YamlRepository(root)
+    for day, task, tags, span in spans:
+        repo.append_span(day, {"task": task, "tags": tags, "moods": [], "spans": [span]})
+    return root
+
+def test_parse_root_names(tmp_path):
+    assert parse_root(str(tmp_path / "ana/purrgress/data"))[0] == "ana"
+    assert parse_root(f"bo={tmp_path}") == ("bo", tmp_path)
+
+def test_rollup_merges_roots(tmp_path):
+    a = _seed(tmp_path / "ana/purrgress/data", [
+        ("2025-07-14", "write", ["code"], "09:00-10:00"),
+        ("2025-07-15", "read", ["code", "study"], "10:00-10:30"),
+        ("2025-08-01", "write", ["code"], "09:00-12:00"),   # outside the range
+    ])
+    b = _seed(tmp_path / "bo/purrgress/data", [("2025-07-14", "write", [], "13:00-13:45")])
+    result = rollup([parse_root(str(a)), parse_root(str(b)), ("cy", tmp_path / "missing")],
+                    date(2025, 7, 1), date(2025, 7, 31), jobs=2)
+
+    assert result.minutes == 135
+    assert [(p.person, p.minutes, p.days) for p in result.people] == [("ana", 90, 2), ("bo", 45, 1), ("cy", 0, 0)]
+    assert result.people[-1].error
+    assert result.tags == {"code": 90, "untagged": 45, "study": 30}
+    assert result.tasks == {"write": 105, "read": 30}
+
+def test_merge_sums_same_person(tmp_path):
+    root = _seed(tmp_path / "ana", [("2025-07-14", "write", ["code"], "09:00-10:00")])
+    part = summarize_root(("ana", str(root), "2025-07-01", "2025-07-31"))
+    result = merge([part, part], "2025-07-01", "2025-07-31")
+    assert [(p.person, p.minutes, p.tags) for p in result.people] == [("ana", 120, {"code": 120})]
+
+def test_rollup_cli(tmp_path):
+    a = _seed(tmp_path / "ana/purrgress/data", [("2025-07-14", "write", ["code"], "09:00-10:00")])
+    out = CliRunner().invoke(log_group, ["rollup", "--roots", str(a), "--from", "2025-07-14",
+                                         "--to", "2025-07-20", "--by", "tag"])
+    assert out.exit_code == 0, out.output
+    assert "60 mins" in out.output and "code" in out.output
+
+def test_duplicate_tags_count_once(tmp_path):
+    root = tmp_path / "ana"
+    (root / "2025").mkdir(parents=True)
+    (root / "2025/07.yaml").write_text("'2025-07-14': {sessions: [{task: w, tags: [code, code], spans: ['09:00-10:00']}]}\n")
+    assert summarize_root(("ana", str(root), "2025-07-01", "2025-07-31")).tags == {"code": 60}
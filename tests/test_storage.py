@@ -0,0 +1,36 @@
+from purrgress.plog import core, storage
+from purrgress.plog.cleanup import tidy_month
+
+MONTH = (
+    "'2025-03-01':\n  wake: '07:30'\n  sessions:\n"
+    "  - {task: code, tags: [py, cli], moods: [calm], spans: ['09:00-10:30', '23:30-00:15']}\n"
+    "  - {task: read, tags: [py], moods: [], spans: ['14:00-14:45']}\n"
+    "'2025-03-02': {sessions: [{task: code, tags: [], moods: [], spans: ['10:00-10:20']}]}\n"
+)
+
+def test_sqlite_roundtrip_and_aggregates(tmp_data_dir, tmp_path):
+    src = tmp_data_dir / "2025" / "03.yaml"
+    src.parent.mkdir(parents=True)
+    src.write_text(MONTH)
+    yaml_repo = storage.YamlRepository()
+    db = storage.SqliteRepository(tmp_path / "log.sqlite3")
+
+    assert storage.migrate(yaml_repo, db) == [(2025, 3)]
+    assert db.load_month(2025, 3) == tidy_month(yaml_repo.load_month(2025, 3))
+    for by in storage.GROUP_BY:
+        assert db.minutes_by(by=by) == yaml_repo.minutes_by(by=by)
+    assert db.minutes_by("2025-03-01", "2025-03-01", by="tag") == {"cli": 135, "py": 180}
+
+    back = storage.YamlRepository(tmp_path / "copy")
+    storage.migrate(db, back)
+    assert back.load_month(2025, 3) == db.load_month(2025, 3)
+
+def test_core_uses_selected_backend(tmp_data_dir, monkeypatch):
+    monkeypatch.setattr(storage, "_backend", "sqlite")
+    core._store_span({"date": "2025-04-02", "task": "t", "tags": ["x"], "start": "09:00", "end": "09:40"})
+    core._store_span({"date": "2025-04-02", "task": "t", "tags": ["x"], "start": "08:00", "end": "08:10"})
+
+    assert (tmp_data_dir / storage.SQLITE_NAME).exists()
+    assert not (tmp_data_dir / "2025").exists()
+    assert core.load_day("2025-04-02")["sessions"][0]["spans"] == ["08:00-08:10", "09:00-09:40"]
+    assert core.minutes_for_month(2025, 4) == 50
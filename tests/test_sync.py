@@ -0,0 +1,48 @@
+from click.testing import CliRunner
+
+from purrgress.plog.cli import log_group
+from purrgress.plog.storage import YamlRepository
+from purrgress.plog.sync import TREE_CACHE, diff_trees, hash_tree, sync
+
+def _seed(root, sessions):
+    repo = YamlRepository(root)
+    for day, task, span in sessions:
+        repo.append_span(day, {"task": task, "tags": ["code"], "moods": [], "spans": [span]})
+    return repo
+
+def test_sync_merges_both_ways(tmp_path):
+    a = _seed(tmp_path / "a", [("2025-07-14", "write", "09:00-10:00"), ("2025-06-01", "old", "08:00-09:00")])
+    b = _seed(tmp_path / "b", [("2025-07-14", "write", "09:30-11:00"), ("2025-07-15", "read", "10:00-10:30")])
+    a.set_key("2025-07-14", "wake", "07:00")
+    b.set_key("2025-07-14", "wake", "07:30")
+
+    result = sync(a.root, b.root)
+    assert result.days == ["2025-06-01", "2025-07-14", "2025-07-15"]
+    assert result.conflicts == ["2025-07-14 wake: 07:00 (src) over 07:30 (dst)"]
+    for repo in (a, b):
+        day = repo.load_day("2025-07-14")
+        assert day["wake"] == "07:00"
+        assert day["sessions"][0]["spans"] == ["09:00-11:00"]
+        assert repo.load_day("2025-07-15")["sessions"][0]["task"] == "read"
+    assert (a.root / "2025/07.yaml").read_bytes() == (b.root / "2025/07.yaml").read_bytes()
+    assert (b.root / "2025/06.yaml").exists()
+
+    again = sync(a.root, b.root)
+    assert again.days == [] and again.written == [] and again.parsed == 0
+
+def test_hash_tree_skips_unchanged_months(tmp_path):
+    repo = _seed(tmp_path, [("2025-07-14", "write", "09:00-10:00"), ("2025-08-01", "x", "09:00-09:30")])
+    tree, parsed = hash_tree(repo.root)
+    assert parsed == 2 and (tmp_path / TREE_CACHE).exists()
+    repo.append_span("2025-08-01", {"task": "y", "tags": [], "moods": [], "spans": ["10:00-10:15"]})
+    tree2, parsed = hash_tree(repo.root)
+    assert parsed == 1
+    assert diff_trees(tree, tree2) == {"2025-08": ["2025-08-01"]}
+
+def test_sync_cli_dry_run_writes_nothing(tmp_path):
+    a = _seed(tmp_path / "a", [("2025-07-14", "write", "09:00-10:00")])
+    (tmp_path / "b").mkdir()
+    out = CliRunner().invoke(log_group, ["sync", "-n", str(a.root), str(tmp_path / "b")])
+    assert out.exit_code == 0, out.output
+    assert "1 day(s) differ" in out.output
+    assert not (tmp_path / "b/2025").exists()
@@ -0,0 +1,12 @@
+import io
+
+from purrgress.utils.text import clean_punctuation, clean_stream
+
+def test_clean_stream_matches_whole_text_at_any_chunk_size():
+    text = "\u201cquoted\u201d\u00a0\u2014 it\u2019s\r\nfine\u2003ok\u202f\n" * 7
+    expected = clean_punctuation(text)
+    for size in (1, 2, 5, 64):
+        out = io.StringIO(newline="")
+        count = clean_stream(io.StringIO(text, newline=""), out, chunk_size=size)
+        assert out.getvalue() == expected
+        assert count == 7 * 7
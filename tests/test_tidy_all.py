@@ -0,0 +1,33 @@
+from click.testing import CliRunner
+
+from purrgress.plog.bulk import TIDY_MANIFEST
+from purrgress.plog.cli import log_group
+
+MESSY = "'2024-02-01': {sessions: [{task: a, spans: ['10:00-11:00', '09:00-09:30', '10:00-11:00']}]}\n"
+
+def test_tidy_all_skips_canonical_months(tmp_data_dir):
+    for name in ("2024/01.yaml", "2024/02.yaml", "2025/01.yaml"):
+        (tmp_data_dir / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_data_dir / name).write_text(MESSY)
+    runner = CliRunner()
+
+    first = runner.invoke(log_group, ["tidy", "--all", "--to", "2024-12", "-j", "2"])
+    assert first.exit_code == 0, first.output
+    assert "2 file(s): 2 tidied, 0 unchanged, 0 skipped" in first.output
+    assert (tmp_data_dir / "2025/01.yaml").read_text() == MESSY
+    assert "- 09:00-09:30\n    - 10:00-11:00\n" in (tmp_data_dir / "2024/01.yaml").read_text()
+    assert (tmp_data_dir / TIDY_MANIFEST).exists()
+
+    mtime = (tmp_data_dir / "2024/01.yaml").stat().st_mtime_ns
+    again = runner.invoke(log_group, ["tidy", "--all"])
+    assert "3 file(s): 1 tidied, 0 unchanged, 2 skipped" in again.output
+    assert (tmp_data_dir / "2024/01.yaml").stat().st_mtime_ns == mtime
+
+def test_rules_digest_covers_the_span_helpers(tmp_path, monkeypatch):
+    from purrgress.plog import bulk, intervals
+
+    before = bulk.rules_digest()
+    patched = tmp_path / "intervals.py"
+    patched.write_text(open(intervals.__file__).read() + "\n# tweak\n")
+    monkeypatch.setattr(intervals, "__file__", str(patched))
+    assert bulk.rules_digest() != before
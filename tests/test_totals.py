@@ -0,0 +1,49 @@
+from datetime import date
+
+from click.testing import CliRunner
+
+from purrgress.plog import core, storage, totals
+from purrgress.plog.cli import log_group
+
+def _draft(day, start, end):
+    return {"date": day, "task": "t", "tags": [], "start": start, "end": end}
+
+def test_index_tracks_writes_and_edits(tmp_data_dir):
+    (tmp_data_dir / "2024").mkdir()
+    (tmp_data_dir / "2024/12.yaml").write_text("'2024-12-31': {sessions: [{task: a, spans: ['23:00-01:00']}]}\n")
+    assert core.minutes_for_range("2024-12-01", "2025-01-31") == 120
+
+    core._store_span(_draft("2025-01-02", "09:00", "09:45"))
+    repo = storage.YamlRepository()
+    idx = totals.read_index(totals.index_path(repo))
+    assert idx.stamps == repo.month_stamps()
+    assert totals.range_total(idx, date(2025, 1, 1), date(2025, 1, 31)) == 45
+
+    (tmp_data_dir / "2024/12.yaml").write_text("'2024-12-30': {sessions: [{task: a, spans: ['10:00-10:10']}]}\n")
+    assert core.minutes_for_range("2024-12-01", "2025-01-31") == 55
+    assert core.minutes_for_month(2024, 12) == 10
+    assert core.rolling_average(7, "2025-01-02") == 55 / 7
+
+    res = CliRunner().invoke(log_group, ["total", "--from", "2024-12-29", "--to", "2025-01-05", "--by", "week"])
+    assert res.exit_code == 0, res.output
+    assert "55 mins" in res.output and "2025-W01" in res.output
+
+def test_index_write_is_best_effort_and_refresh_stats_one_month(tmp_data_dir, monkeypatch):
+    repo = storage.YamlRepository()
+    repo.append_span("2025-01-02", {"task": "t", "spans": ["09:00-09:45"]})
+
+    def _read_only(path, idx):
+        raise PermissionError(f"read-only: {path}")
+    real_write = totals.write_index
+    monkeypatch.setattr(totals, "write_index", _read_only)
+    assert totals.range_total(totals.load(repo), date(2025, 1, 1), date(2025, 1, 31)) == 45
+    assert not totals.index_path(repo).exists()
+
+    monkeypatch.setattr(totals, "write_index", real_write)
+    totals.load(repo)
+    monkeypatch.setattr(storage.YamlRepository, "month_stamps", lambda self: 1 / 0)
+    repo.append_span("2025-01-03", {"task": "t", "spans": ["09:00-09:15"]})
+    totals.refresh_month(repo, "2025-01-03")
+    idx = totals.read_index(totals.index_path(repo))
+    assert idx.stamps["2025-01"] == repo.month_stamp(2025, 1)
+    assert totals.range_total(idx, date(2025, 1, 1), date(2025, 1, 31)) == 60
@@ -0,0 +1,75 @@
+from datetime import date
+
+from click.testing import CliRunner
+
+from purrgress.cli import cli
+from purrgress.scripts.watch import Watcher, refresh_anchors, scan_markers
+
+BOARD = """<!--DATE-TODAY-->
+<sub><em>old</em></sub>
+
+<!-- ============= ACTIVE START ============= -->
+* [ ] open thing
+<!-- ============= ACTIVE END ============= -->
+"""
+
+class _Clock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+def _watcher(tmp_path, monkeypatch, **kw):
+    monkeypatch.setenv("PURG_MANIFEST", str(tmp_path / "manifest.json"))
+    board = tmp_path / "b.md"
+    board.write_text(BOARD)
+    clock, day = _Clock(), [date(2025, 7, 14)]
+    archived = []
+    w = Watcher([str(board)], plog=False, debounce=1.0, clock=clock, today=lambda: day[0],
+                on_archive=archived.extend, echo=lambda _: None, **kw)
+    return w, board, clock, day, archived
+
+def test_scan_and_refresh_anchors():
+    lines = BOARD.splitlines(keepends=True)
+    markers = scan_markers(lines, [0, 0])
+    assert markers.anchors == [[0, "DATE-TODAY"]] and markers.done == 0 and not markers.tags
+    assert refresh_anchors(lines, markers, {"DATE-TODAY": "<sub>new</sub>"})[1] == "<sub>new</sub>\n"
+
+def test_watch_debounces_and_archives_edited_board(tmp_path, monkeypatch):
+    w, board, clock, day, archived = _watcher(tmp_path, monkeypatch)
+    assert w.tick() == []              # first sighting: wait for the file to settle
+    clock.t = 1.5
+    assert w.tick() == [board]         # anchors refreshed
+    assert "2025" in board.read_text() and "old" not in board.read_text()
+    assert w.tick() == []              # our own write isn't an edit
+
+    board.write_text(board.read_text().replace("[ ] open", "[x] open"))
+    assert w.tick() == []
+    clock.t = 3.0
+    w.tick()
+    assert archived == [board]
+
+def test_watch_refreshes_only_on_rollover_and_restarts_warm(tmp_path, monkeypatch):
+    w, board, clock, day, _ = _watcher(tmp_path, monkeypatch)
+    w.tick()
+    clock.t = 2
+    w.tick()
+    text = board.read_text()
+
+    w2 = Watcher([str(board)], plog=False, clock=clock, today=lambda: day[0], echo=lambda _: None)
+    assert w2.markers[board].anchors == [[0, "DATE-TODAY"]]
+    assert w2.tick() == [] and board.read_text() == text
+
+    day[0] = date(2025, 7, 15)
+    assert w2.tick() == [board]
+    assert board.read_text() != text
+
+def test_watch_once_cli(tmp_path, monkeypatch):
+    monkeypatch.setenv("PURG_MANIFEST", str(tmp_path / "manifest.json"))
+    board = tmp_path / "b.md"
+    board.write_text(BOARD.replace("[ ] open", "[x] done"))
+    dst = tmp_path / "archived.md"
+    res = CliRunner().invoke(cli, ["watch", str(board), "--dst", str(dst), "--once", "--no-plog"])
+    assert res.exit_code == 0, res.output
+    assert "done" in dst.read_text() and "[x]" not in board.read_text()
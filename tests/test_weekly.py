@@ -0,0 +1,33 @@
+from purrgress.plog.weekly import week_profile
+
+def test_week_profile_wraps_and_splits_tags():
+    days = {
+        "2025-03-09": {"sessions": [  # Sunday
+            {"task": "late", "tags": ["py"], "spans": ["23:30-00:30"]},
+        ]},
+        "2025-03-10": {"sessions": [  # Monday
+            {"task": "a", "tags": ["py", "doc"], "spans": ["09:10-09:40"]},
+            {"task": "b", "tags": [], "spans": ["09:20-09:30"]},
+        ]},
+    }
+    prof = week_profile(days)
+    assert prof["all"].shape == (7, 24)
+    assert prof["all"][6, 23] == 30 and prof["all"][0, 0] == 30
+    assert prof["all"][0, 9] == 30 and prof["all"].sum() == 90
+
+    fine = week_profile(days, bin_minutes=15)["all"]
+    assert fine.shape == (7, 96)
+    assert list(fine[0, 36:39]) == [5, 15, 10]
+
+    tags = week_profile(days, by_tag=True)
+    assert set(tags) == {"py", "doc", "untagged"}
+    assert tags["py"].sum() == 90 and tags["doc"].sum() == 30 and tags["untagged"].sum() == 10
+
+def test_week_profile_counts_overlaps_once_like_the_grid():
+    from purrgress.plog.grid import hour_day_grid
+
+    days = {"2025-03-10": {"sessions": [{"task": "a", "spans": ["09:00-10:00"]},
+                                        {"task": "b", "spans": ["09:00-10:00"]}]},
+            "2025-03-17": {"sessions": [{"task": "a", "spans": ["09:00-10:00"]}]}}
+    assert week_profile(days)["all"][0, 9] == 120
+    assert hour_day_grid(days, 31)[9].sum() == 120